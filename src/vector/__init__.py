@@ -1,9 +1,36 @@
+# The types are imported on first access, so `import vector` only loads the
+# modules a program actually uses (python -m vector.bench --startup).
+_EXPORTS = {
+	'Vec2d': 'vector.vector2d',
+	'Vec2dArray': 'vector.vector2d',
+	'Vec3d': 'vector.vector3d',
+	'Vec3dArray': 'vector.vector3d',
+	'Color': 'vector.color',
+	'ColorBuffer': 'vector.color',
+	'Mat3': 'vector.matrix',
+	'Mat4': 'vector.matrix',
+	'Quat': 'vector.quaternion',
+	'QuatArray': 'vector.quaternion',
+}
 
-from vector.vector2d import Vec2d
-from vector.vector3d import Vec3d
-from vector.color import Color
+__all__ = list(_EXPORTS)
 
 
+def __getattr__(name):
+	module = _EXPORTS.get(name)
+	if module is None:
+		raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
+	value = getattr(__import__(module, fromlist=(name,)), name)
+	globals()[name] = value  # later lookups skip this function
+	return value
 
 
+def __dir__():
+	return sorted(set(globals()) | set(_EXPORTS))
+
+
+# VECTOR_PROFILE profiles the whole run (see vector.profiling). The profiler
+# is only imported when it is set, and nothing is bound in this namespace.
+if __import__('os').environ.get('VECTOR_PROFILE', '0') != '0':
+	__import__('vector.profiling', fromlist=('enable_from_environment',)).enable_from_environment()
@@ -0,0 +1,84 @@
+from importlib import import_module
+
+
+# Compute backends for the batch types. A backend is a module of column
+# kernels with the interface of vector.backends.python_backend:
+#
+#   arith(op, columns, operands)   op is 'add', 'sub', 'mul' or 'div'
+#   lerp(columns, operands, t)
+#   madd(columns, operands, scale)
+#   dot(columns, operands)         -> array('d')
+#   magnitude(columns)             -> array('d')
+#   normalise(columns)
+#
+# columns is a sequence of float64 columns (array('d') or memoryview) of
+# equal length, every operand is either such a column or one float for
+# every element. arith, lerp, madd and normalise return a list of new
+# array('d') columns and never modify their inputs; the batch types copy
+# them into self or out. Every backend computes the same float expressions,
+# so they all give identical results, and a division by zero raises
+# ZeroDivisionError on every backend.
+#
+# Backends are imported on first use, so only the ones a program asks for
+# are ever loaded:
+#
+#   positions.add(velocities, backend='numpy')   # one call
+#   vector.backends.set_default('numpy')         # every call after this
+
+DEFAULT = 'array'
+
+_modules = {
+	'python': 'vector.backends.python_backend',  # plain comprehensions, the reference
+	'array': 'vector.backends.array_backend',    # the stdlib operator functions mapped over columns
+	'numpy': 'vector.backends.numpy_backend',    # NumPy ufuncs on views of the columns
+}
+_loaded = {}
+_default = DEFAULT
+
+
+def register(name, module):
+	# module is an import path, loaded on first use, or a ready module/object
+	_modules[name] = module
+	_loaded.pop(name, None)
+
+
+def get(name=None):
+	name = _default if name is None else name
+	backend = _loaded.get(name)
+	if backend is not None:
+		return backend
+
+	if name not in _modules:
+		raise ValueError(f'Unknown backend {name!r}, expected one of {sorted(_modules)}')
+
+	backend = _modules[name]
+	if type(backend) is str:
+		backend = import_module(backend)
+	_loaded[name] = backend
+	return backend
+
+
+def set_default(name):
+	global _default
+	get(name)  # fails now rather than on the next batch operation
+	_default = name
+
+
+def default():
+	return _default
+
+
+def loaded():
+	return list(_loaded)
+
+
+def available():
+	# every registered backend that can be loaded here
+	names = []
+	for name in _modules:
+		try:
+			get(name)
+		except ImportError:
+			continue
+		names.append(name)
+	return names
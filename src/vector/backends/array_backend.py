@@ -0,0 +1,57 @@
+from array import array
+from itertools import repeat
+from math import sqrt
+from operator import add, sub, mul, truediv
+
+
+# Default backend: the fastest pure Python form of every kernel. Element wise
+# arithmetic maps the operator functions over whole columns, so the loop runs
+# in C, the fused kernels are single comprehensions with no temporaries.
+
+_OPS = {'add': add, 'sub': sub, 'mul': mul, 'div': truediv}
+
+
+def _values(operand, count):
+	return repeat(operand, count) if type(operand) is float else operand
+
+
+def arith(op, columns, operands):
+	function = _OPS.get(op)
+	if function is None:
+		raise ValueError(f'Unknown operation {op!r}')
+
+	return [array('d', map(function, column, _values(operand, len(column)))) for column, operand in zip(columns, operands)]
+
+
+def lerp(columns, operands, t):
+	return [array('d', [a + t * (b - a) for a, b in zip(column, _values(operand, len(column)))]) for column, operand in zip(columns, operands)]
+
+
+def madd(columns, operands, scale):
+	return [array('d', [a + b * scale for a, b in zip(column, _values(operand, len(column)))]) for column, operand in zip(columns, operands)]
+
+
+def dot(columns, operands):
+	count = len(columns[0])
+	if len(columns) == 2:
+		xs, ys = columns
+		ox, oy = (_values(operand, count) for operand in operands)
+		return array('d', [x * bx + y * by for x, y, bx, by in zip(xs, ys, ox, oy)])
+
+	xs, ys, zs = columns
+	ox, oy, oz = (_values(operand, count) for operand in operands)
+	return array('d', [x * bx + y * by + z * bz for x, y, z, bx, by, bz in zip(xs, ys, zs, ox, oy, oz)])
+
+
+def magnitude(columns):
+	if len(columns) == 2:
+		xs, ys = columns
+		return array('d', [sqrt(x**2 + y**2) for x, y in zip(xs, ys)])
+
+	xs, ys, zs = columns
+	return array('d', [sqrt(x**2 + y**2 + z**2) for x, y, z in zip(xs, ys, zs)])
+
+
+def normalise(columns):
+	mags = magnitude(columns)
+	return [array('d', [a / m if m != 0 else a for a, m in zip(column, mags)]) for column in columns]
@@ -0,0 +1,103 @@
+from array import array
+
+try:
+	import numpy as np
+except ImportError:
+	raise ImportError("NumPy is required for the 'numpy' backend, install it with `pip install numpy`") from None
+
+
+# NumPy ufuncs over views of the columns: nothing is copied going in, and
+# results are written straight into new array('d') columns through views.
+
+
+def _view(column):
+	if isinstance(column, memoryview):
+		return np.asarray(column)
+	return np.frombuffer(column, dtype=np.float64)
+
+
+def _operand(operand):
+	return operand if type(operand) is float else _view(operand)
+
+
+def _targets(columns):
+	# new zeroed columns, filled in place through their views
+	return [array('d', bytes(8 * len(column))) for column in columns]
+
+
+def _ufunc(op):
+	if   op == 'add' : return np.add
+	elif op == 'sub' : return np.subtract
+	elif op == 'mul' : return np.multiply
+	elif op == 'div' : return np.divide
+	raise ValueError(f'Unknown operation {op!r}')
+
+
+def _check_divisors(operands):
+	# NumPy would give inf/nan with a warning, the other backends raise
+	for operand in operands:
+		if (operand == 0) if type(operand) is float else not _view(operand).all():
+			raise ZeroDivisionError('float division by zero')
+
+
+def arith(op, columns, operands):
+	function = _ufunc(op)
+	if op == 'div':
+		_check_divisors(operands)
+
+	out = _targets(columns)
+	for column, operand, target in zip(columns, operands, out):
+		function(_view(column), _operand(operand), out=_view(target))
+	return out
+
+
+def lerp(columns, operands, t):
+	# a + t * (b - a)
+	out = _targets(columns)
+	for column, operand, target in zip(columns, operands, out):
+		a = _view(column)
+		step = np.subtract(_operand(operand), a)
+		step *= t
+		np.add(a, step, out=_view(target))
+	return out
+
+
+def madd(columns, operands, scale):
+	# a + b * scale
+	out = _targets(columns)
+	for column, operand, target in zip(columns, operands, out):
+		a = _view(column)
+		np.add(a, np.multiply(_operand(operand), scale), out=_view(target))
+	return out
+
+
+def _dot(columns, operands):
+	total = np.multiply(_view(columns[0]), _operand(operands[0]))
+	for column, operand in zip(columns[1:], operands[1:]):
+		total += np.multiply(_view(column), _operand(operand))
+	return total
+
+
+def _magnitude(columns):
+	total = np.square(_view(columns[0]))
+	for column in columns[1:]:
+		total += np.square(_view(column))
+	return np.sqrt(total, out=total)
+
+
+def dot(columns, operands):
+	return array('d', _dot(columns, operands).tobytes())
+
+
+def magnitude(columns):
+	return array('d', _magnitude(columns).tobytes())
+
+
+def normalise(columns):
+	# a zero length element is left as it is, dividing by 1.0 keeps it exact
+	out = _targets(columns)
+	mags = _magnitude(columns)
+	divisors = np.where(mags != 0, mags, 1.0)
+	for column, target in zip(columns, out):
+		np.divide(_view(column), divisors, out=_view(target))
+	return out
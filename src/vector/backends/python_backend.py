@@ -0,0 +1,56 @@
+from array import array
+from itertools import repeat
+from math import sqrt
+
+
+# Reference backend: one list comprehension per column, every element
+# handled by the interpreter. The other backends must match its results.
+
+
+def _values(operand, count):
+	return repeat(operand, count) if type(operand) is float else operand
+
+
+def _store(results):
+	return [array('d', values) for values in results]
+
+
+def arith(op, columns, operands):
+	results = []
+	for column, operand in zip(columns, operands):
+		other = _values(operand, len(column))
+		if   op == 'add' : results.append([a + b for a, b in zip(column, other)])
+		elif op == 'sub' : results.append([a - b for a, b in zip(column, other)])
+		elif op == 'mul' : results.append([a * b for a, b in zip(column, other)])
+		elif op == 'div' : results.append([a / b for a, b in zip(column, other)])
+		else             : raise ValueError(f'Unknown operation {op!r}')
+	return _store(results)
+
+
+def lerp(columns, operands, t):
+	return _store([[a + t * (b - a) for a, b in zip(column, _values(operand, len(column)))] for column, operand in zip(columns, operands)])
+
+
+def madd(columns, operands, scale):
+	return _store([[a + b * scale for a, b in zip(column, _values(operand, len(column)))] for column, operand in zip(columns, operands)])
+
+
+def dot(columns, operands):
+	count = len(columns[0])
+	products = [[a * b for a, b in zip(column, _values(operand, count))] for column, operand in zip(columns, operands)]
+	total = products[0]
+	for values in products[1:]:
+		total = [t + v for t, v in zip(total, values)]
+	return array('d', total)
+
+
+def magnitude(columns):
+	total = [a**2 for a in columns[0]]
+	for column in columns[1:]:
+		total = [t + a**2 for t, a in zip(total, column)]
+	return array('d', [sqrt(t) for t in total])
+
+
+def normalise(columns):
+	mags = magnitude(columns)
+	return _store([[a / m if m != 0 else a for a, m in zip(column, mags)] for column in columns])
@@ -0,0 +1,755 @@
+import argparse
+import fnmatch
+import json
+import platform
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+from itertools import repeat
+
+from vector.vector2d import Vec2d, Vec2dArray
+from vector.vector3d import Vec3d, Vec3dArray
+from vector.color import Color, ColorBuffer
+from vector.matrix import Mat3, Mat4
+from vector.quaternion import Quat, QuatArray
+from vector.spatial import SpatialHash, KDTree, Octree
+from vector.distance import pairwise_distances, pairwise_topk
+from vector import backends, profiling, storage, stream
+from vector.parallel import ParallelExecutor
+from vector.rng import VectorRandom
+from vector.palette import Palette
+from vector.gradient import Gradient
+from vector.lazy import lazy
+from vector.particles import Particles
+from vector.broadphase import SweepAndPrune
+
+
+DEFAULT_SIZES = (1, 100, 10_000, 1_000_000)
+QUICK_SIZES = (1, 100, 10_000)
+DEFAULT_THRESHOLD = 0.10
+
+CASES = {}
+
+
+def case(name):
+	def register(make):
+		CASES[name] = make
+		return make
+	return register
+
+
+def _per_item(factory, op):
+	def make(size):
+		items = [factory(i) for i in range(size)]
+		def run():
+			for item in items:
+				op(item)
+		return run
+	return make
+
+
+#region Construction
+
+def _construct(cls, args):
+	def make(size):
+		def run():
+			for _ in range(size):
+				cls(*args)
+		return run
+	return make
+
+
+for _name, _args in [
+	('Vec2d()', ()),
+	('Vec2d(n)', (1.5,)),
+	('Vec2d(x, y)', (1.5, 2.5)),
+	('Vec2d([x, y])', ([1.5, 2.5],)),
+	('Vec2d([n])', ([1.5],)),
+	('Vec2d(Vec2d)', (Vec2d(1.5, 2.5),)),
+]:
+	case(_name)(_construct(Vec2d, _args))
+
+for _name, _args in [
+	('Vec3d()', ()),
+	('Vec3d(n)', (1.5,)),
+	('Vec3d(x, y, z)', (1.5, 2.5, 3.5)),
+	('Vec3d([x, y, z])', ([1.5, 2.5, 3.5],)),
+	('Vec3d([n])', ([1.5],)),
+	('Vec3d(Vec3d)', (Vec3d(1.5, 2.5, 3.5),)),
+]:
+	case(_name)(_construct(Vec3d, _args))
+
+for _name, _args in [
+	('Color()', ()),
+	('Color(n)', (128,)),
+	('Color(r, g, b)', (10, 20, 30)),
+	('Color([r, g, b])', ([10, 20, 30],)),
+	('Color([n])', ([128],)),
+	('Color(Color)', (Color(10, 20, 30),)),
+]:
+	case(_name)(_construct(Color, _args))
+
+#endregion
+
+
+#region Vec2d
+
+_v2 = lambda i: Vec2d(i + 1.5, i + 2.5)
+_o2 = Vec2d(1.25, 0.75)
+
+for _name, _op in [
+	('add', lambda v: v.add(_o2)),
+	('sub', lambda v: v.sub(_o2)),
+	('mult', lambda v: v.mult(_o2)),
+	('div', lambda v: v.div(_o2)),
+	('lerp', lambda v: v.lerp(_o2, t=0.25)),
+	('dot', lambda v: v.dot(_o2)),
+	('dist', lambda v: v.dist(_o2)),
+	('dist_sqrt', lambda v: v.dist_sqrt(_o2)),
+	('iadd', lambda v: v.iadd(_o2)),
+	('isub', lambda v: v.isub(_o2)),
+	('imult', lambda v: v.imult(1.0)),
+	('idiv', lambda v: v.idiv(1.0)),
+	('ilerp', lambda v: v.ilerp(_o2, t=0.25)),
+	('add(x, y)', lambda v: v.add(1.25, 0.75)),
+	('__add__', lambda v: v + _o2),
+	('__sub__', lambda v: v - _o2),
+	('__mul__', lambda v: v * _o2),
+	('__iadd__', lambda v: v.__iadd__(_o2)),
+	('rotate', lambda v: v.rotate(0.1)),
+	('normalise', lambda v: v.normalise()),
+	('normalised', lambda v: v.normalised()),
+	('clamp', lambda v: v.clamp(10, 10)),
+	('get_heading_angle', lambda v: v.get_heading_angle()),
+	('get_magnitude', lambda v: v.get_magnitude()),
+	('copy', lambda v: v.copy()),
+	('set', lambda v: v.set(1.5, 2.5)),
+	('as_floats', lambda v: v.as_floats()),
+	('as_ints', lambda v: v.as_ints()),
+]:
+	case(f'Vec2d.{_name}')(_per_item(_v2, _op))
+
+case('Vec2d.from_angle')(_per_item(float, Vec2d.from_angle))
+case('Vec2d.random_unit')(_per_item(int, lambda _: Vec2d.random_unit()))
+case('Vec2d.random_pos')(_per_item(int, lambda _: Vec2d.random_pos()))
+
+#endregion
+
+
+#region Vec3d
+
+_v3 = lambda i: Vec3d(i + 1.5, i + 2.5, i + 3.5)
+_o3 = Vec3d(1.25, 0.75, 0.5)
+
+for _name, _op in [
+	('add', lambda v: v.add(_o3)),
+	('sub', lambda v: v.sub(_o3)),
+	('mult', lambda v: v.mult(_o3)),
+	('div', lambda v: v.div(_o3)),
+	('lerp', lambda v: v.lerp(_o3, t=0.25)),
+	('dot', lambda v: v.dot(_o3)),
+	('dist', lambda v: v.dist(_o3)),
+	('dist_sqrt', lambda v: v.dist_sqrt(_o3)),
+	('cross_product', lambda v: v.cross_product(_o3)),
+	('iadd', lambda v: v.iadd(_o3)),
+	('isub', lambda v: v.isub(_o3)),
+	('imult', lambda v: v.imult(1.0)),
+	('idiv', lambda v: v.idiv(1.0)),
+	('ilerp', lambda v: v.ilerp(_o3, t=0.25)),
+	('add(x, y, z)', lambda v: v.add(1.25, 0.75, 0.5)),
+	('__add__', lambda v: v + _o3),
+	('__sub__', lambda v: v - _o3),
+	('__mul__', lambda v: v * _o3),
+	('__iadd__', lambda v: v.__iadd__(_o3)),
+	('rotate_x', lambda v: v.rotate_x(0.1)),
+	('rotate_y', lambda v: v.rotate_y(0.1)),
+	('rotate_z', lambda v: v.rotate_z(0.1)),
+	('normalise', lambda v: v.normalise()),
+	('normalised', lambda v: v.normalised()),
+	('clamp', lambda v: v.clamp(10, 10, 10)),
+	('get_magnitude', lambda v: v.get_magnitude()),
+	('copy', lambda v: v.copy()),
+	('set', lambda v: v.set(1.5, 2.5, 3.5)),
+	('as_floats', lambda v: v.as_floats()),
+	('as_ints', lambda v: v.as_ints()),
+]:
+	case(f'Vec3d.{_name}')(_per_item(_v3, _op))
+
+case('Vec3d.random_unit')(_per_item(int, lambda _: Vec3d.random_unit()))
+case('Vec3d.random_pos')(_per_item(int, lambda _: Vec3d.random_pos()))
+
+#endregion
+
+
+#region Color
+
+_c = lambda i: Color(i % 256, (i * 7) % 256, (i * 13) % 256)
+_oc = Color(40, 80, 120)
+
+for _name, _op in [
+	('add', lambda c: c.add(_oc)),
+	('sub', lambda c: c.sub(_oc)),
+	('mult', lambda c: c.mult(1.5)),
+	('div', lambda c: c.div(2)),
+	('lerp', lambda c: c.lerp(_oc, t=0.25)),
+	('iadd', lambda c: c.iadd(_oc)),
+	('isub', lambda c: c.isub(_oc)),
+	('imult', lambda c: c.imult(1)),
+	('idiv', lambda c: c.idiv(1)),
+	('ilerp', lambda c: c.ilerp(_oc, t=0.25)),
+	('__add__', lambda c: c + _oc),
+	('as_hex', lambda c: c.as_hex()),
+	('as_unit', lambda c: c.as_unit()),
+	('as_hsv', lambda c: c.as_hsv()),
+	('get', lambda c: c.get()),
+	('copy', lambda c: c.copy()),
+]:
+	case(f'Color.{_name}')(_per_item(_c, _op))
+
+case('Color.from_hex')(_per_item(lambda i: '#%06X' % (i * 2654435761 % 0xFFFFFF), Color.from_hex))
+case('Color.from_hsv')(_per_item(lambda i: (i % 360, i % 101, (i * 3) % 101), lambda hsv: Color.from_hsv(*hsv)))
+case('Color.random')(_per_item(int, lambda _: Color.random()))
+
+#endregion
+
+
+#region Batch types
+
+def _batch(factory, op):
+	def make(size):
+		batch = factory(size)
+		return lambda: op(batch)
+	return make
+
+
+_a2 = lambda n: Vec2dArray.from_columns(map(float, range(n)), map(float, range(1, n + 1)))
+_a3 = lambda n: Vec3dArray.from_columns(map(float, range(n)), map(float, range(1, n + 1)), map(float, range(2, n + 2)))
+_cb = lambda n: ColorBuffer.from_bytes(bytes(i % 256 for i in range(3 * n)), n)
+
+for _name, _op in [
+	('add', lambda a: a.add(_o2)),
+	('iadd', lambda a: a.iadd(_o2)),
+	('add(array)', lambda a: a.add(a)),
+	('mult', lambda a: a.mult(2.0)),
+	('lerp', lambda a: a.lerp(_o2, t=0.25)),
+	('dot', lambda a: a.dot(_o2)),
+	('dist', lambda a: a.dist(_o2)),
+	('dist_sqrt', lambda a: a.dist_sqrt(_o2)),
+	('normalise', lambda a: a.normalise()),
+	('rotate', lambda a: a.rotate(0.1)),
+	('clamp', lambda a: a.clamp(10, 10)),
+	('get_heading_angle', lambda a: a.get_heading_angle()),
+]:
+	case(f'Vec2dArray.{_name}')(_batch(_a2, _op))
+
+for _name, _op in [
+	('add', lambda a: a.add(_o3)),
+	('iadd', lambda a: a.iadd(_o3)),
+	('cross_product', lambda a: a.cross_product(_o3)),
+	('cross_product(array)', lambda a: a.cross_product(a)),
+	('dot', lambda a: a.dot(_o3)),
+	('lerp', lambda a: a.lerp(_o3, t=0.25)),
+	('dist', lambda a: a.dist(_o3)),
+	('normalise', lambda a: a.normalise()),
+	('rotate_x', lambda a: a.rotate_x(0.1)),
+	('rotate_y', lambda a: a.rotate_y(0.1)),
+	('rotate_z', lambda a: a.rotate_z(0.1)),
+]:
+	case(f'Vec3dArray.{_name}')(_batch(_a3, _op))
+
+for _name, _op in [
+	('add', lambda b: b.add(_oc)),
+	('iadd', lambda b: b.iadd(_oc)),
+	('imult', lambda b: b.imult(1.5)),
+	('ilerp', lambda b: b.ilerp(_oc, t=0.25)),
+	('add(buffer)', lambda b: b.add(b)),
+	('fill', lambda b: b.fill(_oc)),
+	('as_hex', lambda b: b.as_hex()),
+	('as_unit', lambda b: b.as_unit()),
+	('as_hsv', lambda b: b.as_hsv()),
+]:
+	case(f'ColorBuffer.{_name}')(_batch(_cb, _op))
+
+#endregion
+
+
+#region Matrices
+
+_m4 = Mat4.translation(1, 2, 3) @ Mat4.scale(2) @ Mat4.rotation_z(0.3) @ Mat4.rotation_y(0.2) @ Mat4.rotation_x(0.1)
+
+def _chained(v):
+	v.rotate_x(0.1) ; v.rotate_y(0.2) ; v.rotate_z(0.3)
+	v.imult(2) ; v.iadd(1, 2, 3)
+
+case('Vec3d.rotate_xyz+imult+iadd')(_per_item(_v3, _chained))
+case('Mat4.transform')(_per_item(_v3, _m4.transform))
+case('Mat4.transform_all')(_batch(lambda n: [_v3(i) for i in range(n)], _m4.transform_all))
+case('Mat4.itransform_all(array)')(_batch(_a3, _m4.itransform_all))
+case('Mat3.itransform_all(array)')(_batch(_a2, (Mat3.translation(1, 2) @ Mat3.rotation(0.3)).itransform_all))
+
+#endregion
+
+
+#region Spatial indexes
+
+_scatter2 = lambda n: [Vec2d((i * 7919) % 1000, (i * 104729) % 1000) for i in range(n)]
+
+case('SpatialHash.from_positions')(_batch(_scatter2, lambda ps: SpatialHash.from_positions(ps, 10)))
+case('SpatialHash.query_radius')(_batch(lambda n: SpatialHash.from_positions(_scatter2(n), 10), lambda g: g.query_radius((500, 500), 20)))
+case('SpatialHash.nearest')(_batch(lambda n: SpatialHash.from_positions(_scatter2(n), 10), lambda g: g.nearest((500, 500), 8)))
+case('SpatialHash.pairs_within')(_batch(lambda n: SpatialHash.from_positions(_scatter2(n), 10), lambda g: g.pairs_within(5)))
+
+_cloud = lambda n: Vec3dArray.from_columns(((i * 7919) % 1000 for i in range(n)), ((i * 104729) % 1000 for i in range(n)), ((i * 15485863) % 1000 for i in range(n)))
+
+def _octree(n):
+	tree = Octree((500, 500, 500), 500)
+	tree.insert_all(_cloud(n))
+	return tree
+
+case('KDTree.build')(_batch(_cloud, KDTree))
+case('KDTree.nearest')(_batch(lambda n: KDTree(_cloud(n)), lambda t: t.nearest((500, 500, 500), 8)))
+case('KDTree.query_radius')(_batch(lambda n: KDTree(_cloud(n)), lambda t: t.query_radius((500, 500, 500), 50)))
+case('Octree.insert_all')(_batch(_cloud, lambda c: Octree((500, 500, 500), 500).insert_all(c)))
+case('Octree.nearest')(_batch(_octree, lambda t: t.nearest((500, 500, 500), 8)))
+case('Octree.query_radius')(_batch(_octree, lambda t: t.query_radius((500, 500, 500), 50)))
+
+# sizes are rows of the distance matrix, against a fixed set of 1000 columns
+_columns = _cloud(1000)
+
+case('pairwise_distances')(_batch(_cloud, lambda c: [None for _ in pairwise_distances(c, _columns)]))
+case('pairwise_topk')(_batch(_cloud, lambda c: [None for _ in pairwise_topk(c, _columns, 5)]))
+
+#endregion
+
+
+#region Lazy expressions
+
+_k2 = Vec2d(0.5, 2.0)
+_d2 = Vec2d(1.0, 1.0)
+
+case('chain eager')(_per_item(lambda i: Vec2d(i, i + 1), lambda v: v.add(_o2).mult(_k2).sub(_d2).normalised()))
+case('chain lazy')(_per_item(lambda i: Vec2d(i, i + 1), lambda v: lazy(v).add(_o2).mult(_k2).sub(_d2).normalised().evaluate()))
+def _prebuilt(i):
+	expression = lazy(Vec2d(i, i + 1)).add(_o2).mult(_k2).sub(_d2).normalised()
+	expression.evaluate()  # plans and compiles outside the timed region
+	return expression
+
+case('chain lazy(prebuilt)')(_per_item(_prebuilt, lambda e: e.evaluate()))
+
+def _chain_eager(a):
+	result = a.add(_o2).mult(_k2).sub(_d2)
+	result.normalise()
+	return result
+
+case('Vec2dArray chain eager')(_batch(_a2, _chain_eager))
+case('Vec2dArray chain lazy')(_batch(_a2, lambda a: lazy(a).add(_o2).mult(_k2).sub(_d2).normalised().evaluate()))
+
+#endregion
+
+
+#region Destinations
+
+_t2 = Vec2d()
+_t3 = Vec3d()
+_tc = Color()
+
+case('Vec2d.add(out)')(_per_item(_v2, lambda v: v.add(_o2, out=_t2)))
+case('Vec2d.add+mult')(_per_item(_v2, lambda v: v.add(_o2.mult(0.016))))
+case('Vec2d.madd')(_per_item(_v2, lambda v: v.madd(_o2, 0.016)))
+case('Vec2d.imadd')(_per_item(_v2, lambda v: v.imadd(_o2, 0.016)))
+case('Vec3d.add(out)')(_per_item(_v3, lambda v: v.add(_o3, out=_t3)))
+case('Vec3d.cross_product(out)')(_per_item(_v3, lambda v: v.cross_product(_o3, out=_t3)))
+case('Vec3d.madd')(_per_item(_v3, lambda v: v.madd(_o3, 0.016)))
+case('Color.add(out)')(_per_item(_c, lambda c: c.add(_oc, out=_tc)))
+case('Vec2dArray.add(out)')(_batch(lambda n: (_a2(n), _a2(n)), lambda ab: ab[0].add(_o2, out=ab[1])))
+case('Vec2dArray.madd')(_batch(lambda n: (_a2(n), _a2(n)), lambda ab: ab[0].madd(ab[1], 0.016)))
+case('Vec2dArray.imadd')(_batch(lambda n: (_a2(n), _a2(n)), lambda ab: ab[0].imadd(ab[1], 0.016)))
+case('Vec3dArray.madd')(_batch(lambda n: (_a3(n), _a3(n)), lambda ab: ab[0].madd(ab[1], 0.016)))
+case('ColorBuffer.add(out)')(_batch(lambda n: (_cb(n), _cb(n)), lambda ab: ab[0].add(_oc, out=ab[1])))
+
+#endregion
+
+
+#region Particles
+
+def _particles(n):
+	rng = VectorRandom(0)
+	particles = Particles(2)
+	particles.emit_batch(rng.in_disc(n, 100), rng.vec2_unit(n), Vec2d(0, -0.01))
+	return particles
+
+def _particle_loop(n):
+	rng = VectorRandom(0)
+	return list(zip(rng.in_disc(n, 100).as_list(), rng.vec2_unit(n).as_list(), repeat(Vec2d(0, -0.01))))
+
+def _loop_step(items):
+	for pos, vel, acc in items:
+		vel.iadd(acc)
+		vel.clamp(0.5)
+		pos.iadd(vel)
+
+case('particles loop(iadd+clamp+iadd)')(_batch(_particle_loop, _loop_step))
+case('Particles.step(max_speed)')(_batch(_particles, lambda p: p.step(max_speed=0.5)))
+case('Particles.step(max_speed, damping)')(_batch(_particles, lambda p: p.step(0.5, max_speed=0.5, damping=0.99)))
+case('Particles.verlet')(_batch(_particles, lambda p: p.verlet(0.5)))
+
+#endregion
+
+
+#region Broadphase
+
+def _moving_boxes(n):
+	rng = VectorRandom(0)
+	side = 60 * max(1, n) ** 0.5  # about the same crowding at every size
+	positions = rng.vec2_uniform(n, (0, 0), (side, side))
+	boxes = SweepAndPrune.from_boxes(zip(positions.as_list(), rng.vec2_uniform(n, (2, 2), (20, 20)).as_list()))
+	boxes.pairs()
+	step = rng.vec2_uniform(n, (-1, -1), (1, 1))
+	return boxes, positions, [step, step.mult(-1)]
+
+def _frame(state):
+	boxes, positions, steps = state
+	steps.reverse()  # jitter back and forth so the boxes stay in place
+	positions.iadd(steps[0])
+	boxes.update(positions)
+	return boxes.pairs()
+
+case('SweepAndPrune.from_boxes')(_batch(lambda n: [(Vec2d(i * 7919 % 1000, i * 104729 % 1000), Vec2d(5, 5)) for i in range(n)], SweepAndPrune.from_boxes))
+case('SweepAndPrune frame(update+pairs)')(_batch(_moving_boxes, _frame))
+
+#endregion
+
+
+#region Profiling
+
+# the same loops with the profiler's wrappers installed, the plain cases
+# are the disabled baseline
+def _profiled(make):
+	return lambda size: profiling.profiled()(make(size))
+
+case('Vec2d.add(profiled)')(_profiled(_per_item(_v2, lambda v: v.add(_o2))))
+case('Vec3d.cross_product(profiled)')(_profiled(_per_item(_v3, lambda v: v.cross_product(_o3))))
+case('Color.add(profiled)')(_profiled(_per_item(_c, lambda c: c.add(_oc))))
+
+#endregion
+
+
+#region Backends
+
+# the same batch operations on every backend that can be loaded here
+for _backend in backends.available():
+	for _name, _make in [
+		('Vec2dArray.add', _batch(_a2, lambda a, b=_backend: a.add(_o2, backend=b))),
+		('Vec2dArray.lerp', _batch(_a2, lambda a, b=_backend: a.lerp(_o2, t=0.25, backend=b))),
+		('Vec3dArray.dot', _batch(_a3, lambda a, b=_backend: a.dot(_o3, backend=b))),
+		('Vec3dArray.normalise', _batch(_a3, lambda a, b=_backend: a.normalise(backend=b))),
+	]:
+		case(f'{_name}(backend={_backend})')(_make)
+
+#endregion
+
+
+#region Quaternions
+
+# one orientation applied to many vectors: the Euler rotations recompute six
+# trig calls per vector, the quaternion precomputes its coefficients once
+_q = Quat.from_euler(0.1, 0.2, 0.3)
+_q2 = Quat.from_axis_angle((1, 2, 3), 1.2)
+_qa = lambda n: QuatArray.from_axis_angles((0, 1, 0), [i * 0.001 for i in range(n)])
+
+def _rotate_xyz(v):
+	v.rotate_x(0.1) ; v.rotate_y(0.2) ; v.rotate_z(0.3)
+
+case('Vec3d.rotate_xyz')(_per_item(_v3, _rotate_xyz))
+case('Quat.transform')(_per_item(_v3, lambda v: _q.transform(v, out=v)))
+case('Vec3dArray.rotate_xyz')(_batch(_a3, _rotate_xyz))
+case('Quat.itransform_all(array)')(_batch(_a3, _q.itransform_all))
+case('QuatArray.itransform_all')(_batch(lambda n: (_qa(n), _a3(n)), lambda b: b[0].itransform_all(b[1])))
+case('Quat.slerp')(_per_item(lambda i: Quat.from_axis_angle((0, 1, 0), i * 0.001), lambda q: q.slerp(_q2, t=0.25)))
+case('Quat.multiply')(_per_item(lambda i: Quat.from_axis_angle((0, 1, 0), i * 0.001), lambda q: q.multiply(_q2)))
+case('QuatArray.slerp')(_batch(_qa, lambda a: a.slerp(_q2, t=0.25)))
+case('QuatArray.slerp(array)')(_batch(_qa, lambda a: a.slerp(a[::-1], t=0.25)))
+case('QuatArray.multiply')(_batch(_qa, lambda a: a.multiply(_q2)))
+
+#endregion
+
+
+#region Storage
+
+_scratch = os.path.join(tempfile.gettempdir(), f'vector-bench-{os.getpid()}.vec')
+
+def _stored(n):
+	storage.save(_scratch, _a3(n))
+	return storage.load(_scratch)
+
+case('storage.save(array)')(_batch(_a3, lambda a: storage.save(_scratch, a)))
+case('storage.save(list)')(_batch(lambda n: _a3(n).as_list(), lambda vs: storage.save(_scratch, vs)))
+case('VectorFile.read')(_batch(_stored, lambda f: f.read()))
+case('VectorFile.__iter__')(_batch(_stored, lambda f: [None for _ in f]))
+
+#endregion
+
+
+#region Streaming
+
+_scratch_csv = _scratch[:-len('.vec')] + '.csv'
+
+def _stored_csv(n):
+	stream.write_csv(_scratch_csv, [_a3(n)])
+	return _scratch_csv
+
+case('stream.write_csv(items)')(_batch(lambda n: _a3(n).as_list(), lambda vs: stream.write_csv(_scratch_csv, vs)))
+case('stream.write_csv(batch)')(_batch(_a3, lambda a: stream.write_csv(_scratch_csv, [a])))
+case('stream.read_csv(items)')(_batch(_stored_csv, lambda p: [None for _ in stream.read_csv(p)]))
+case('stream.read_csv(batches)')(_batch(_stored_csv, lambda p: [None for _ in stream.read_csv(p, batch_size=stream.DEFAULT_BATCH_SIZE)]))
+case('stream.read_binary(batches)')(_batch(lambda n: _stored(n) and _scratch, lambda p: [None for _ in stream.read_binary(p, batch_size=stream.DEFAULT_BATCH_SIZE)]))
+case('stream.apply(normalised)')(_batch(_a3, lambda a: [None for _ in stream.apply(stream.unbatched([a]), 'normalised')]))
+case('stream.apply(normalised, batches)')(_batch(_a3, lambda a: [None for _ in stream.apply([a], 'normalised')]))
+
+#endregion
+
+
+#region Palettes
+
+_palette = Palette.from_constants()
+
+def _image(n):
+	_palette.nearest(0)
+	_palette.indices([Color()])  # builds the lookup cube outside the timed region
+	buffer = VectorRandom(0).colors(n)
+	buffer.width = max(1, int(n ** 0.5))
+	buffer.height = n // buffer.width
+	return ColorBuffer.from_bytes(buffer.data[:3 * buffer.width * buffer.height], buffer.width, buffer.height)
+
+case('Palette.nearest')(_per_item(lambda i: Color(i % 256, i * 7 % 256, i * 13 % 256), _palette.nearest))
+case('Palette.quantize')(_batch(_image, _palette.quantize))
+case('Palette.quantize(dither)')(_batch(_image, lambda b: _palette.quantize(b, dither=True)))
+
+#endregion
+
+
+#region Gradients
+
+_gradient = Gradient([Color.BLACK, Color.RED, Color.YELLOW, (255, 255, 255)])
+_values = lambda n: [i / max(1, n - 1) for i in range(n)]
+
+_black = Color(Color.BLACK)
+_red = Color(Color.RED)
+
+# the per-pixel lerp a baked gradient replaces
+case('Color.lerp(values)')(_batch(_values, lambda vs: [_black.lerp(_red, t=t) for t in vs]))
+case('Gradient.color_at')(_per_item(lambda i: i / 1000 % 1, _gradient.color_at))
+case('Gradient.map')(_batch(_values, _gradient.map))
+case('Gradient(hsv)')(_construct(Gradient, ([Color.BLUE, Color.RED], 256, 'hsv')))
+
+#endregion
+
+
+#region Random
+
+_rng = VectorRandom(0)
+
+for _name in ('vec2_unit', 'vec3_unit', 'on_circle', 'in_disc', 'on_sphere', 'in_ball', 'colors'):
+	case(f'VectorRandom.{_name}')(_batch(lambda n: n, lambda n, op=getattr(_rng, _name): op(n)))
+
+#endregion
+
+
+#region Parallel
+
+# workers=1 runs inline and is the baseline the other worker counts scale against
+_executors = {}
+
+def _executor(workers):
+	if workers not in _executors:
+		_executors[workers] = ParallelExecutor(workers, min_shard=1)
+	return _executors[workers]
+
+for _workers in (1, 2, 4, 8):
+	case(f'ParallelExecutor.apply(rotate_z, workers={_workers})')(
+		_batch(_a3, lambda a, w=_workers: _executor(w).apply(a, 'rotate_z', 0.1)))
+	case(f'ParallelExecutor.apply(shared rotate_z, workers={_workers})')(
+		_batch(lambda n, w=_workers: _executor(w).share(_a3(n)), lambda a, w=_workers: _executor(w).apply(a, 'rotate_z', 0.1)))
+
+#endregion
+
+
+#region Running and comparing
+
+def time_case(make, size, repeat=3, target=0.05):
+	timer = timeit.Timer(make(size))
+
+	# grow the loop count until one measurement takes roughly `target` seconds
+	number = 1
+	best = timer.timeit(number)
+	while best < target:
+		number *= 10 if best < target / 10 else 2
+		best = timer.timeit(number)
+
+	for _ in range(repeat - 1):
+		best = min(best, timer.timeit(number))
+
+	return best / number
+
+
+def run(names=None, sizes=DEFAULT_SIZES, repeat=3, log=None):
+	results = {}
+
+	for name, make in CASES.items():
+		if names and not any(fnmatch.fnmatchcase(name, pattern) for pattern in names):
+			continue
+
+		results[name] = {}
+		for size in sizes:
+			seconds = time_case(make, size, repeat)
+			results[name][str(size)] = seconds
+			if log is not None:
+				log.write(f'{name:<36} {size:>9}  {seconds * 1e9 / size:12.1f} ns/item\n')
+
+	return {
+		'meta': {
+			'python': platform.python_version(),
+			'implementation': platform.python_implementation(),
+			'platform': platform.platform(),
+			'sizes': list(sizes),
+		},
+		'results': results,
+	}
+
+
+# statements timed in a fresh interpreter by --startup, the backends are
+# each loaded on top of a bare `import vector`
+STARTUP = {
+	'import vector': 'import vector',
+	'import vector, Vec2d': 'from vector import Vec2d',
+	'import vector, Vec3dArray': 'from vector import Vec3dArray',
+}
+for _backend in backends._modules:
+	STARTUP[f'import vector, backend={_backend}'] = f'import vector.backends; vector.backends.get({_backend!r})'
+
+_STARTUP_SCRIPT = '''
+from time import perf_counter
+start = perf_counter()
+{}
+print(perf_counter() - start)
+'''
+
+
+def time_startup(statement, repeat=3):
+	# best of `repeat` fresh interpreters, None when the statement fails (a missing backend)
+	env = dict(os.environ)
+	package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+	env['PYTHONPATH'] = os.pathsep.join(filter(None, [package_root, env.get('PYTHONPATH')]))
+
+	best = None
+	for _ in range(repeat):
+		process = subprocess.run([sys.executable, '-c', _STARTUP_SCRIPT.format(statement)], env=env, capture_output=True, text=True)
+		if process.returncode != 0:
+			return None
+		seconds = float(process.stdout)
+		best = seconds if best is None else min(best, seconds)
+
+	return best
+
+
+def startup(names=None, repeat=3, log=None):
+	results = {}
+
+	for name, statement in STARTUP.items():
+		if names and not any(fnmatch.fnmatchcase(name, pattern) for pattern in names):
+			continue
+
+		seconds = time_startup(statement, repeat)
+		if seconds is None:
+			if log is not None:
+				log.write(f'{name:<36} {"":>9}  {"unavailable":>12}\n')
+			continue
+
+		results[name] = {'1': seconds}
+		if log is not None:
+			log.write(f'{name:<36} {"":>9}  {seconds * 1e6:12.1f} us\n')
+
+	return {
+		'meta': {
+			'python': platform.python_version(),
+			'implementation': platform.python_implementation(),
+			'platform': platform.platform(),
+			'startup': True,
+		},
+		'results': results,
+	}
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+	regressions = []
+
+	for name, timings in current['results'].items():
+		for size, seconds in timings.items():
+			previous = baseline['results'].get(name, {}).get(size)
+			if not previous:
+				continue
+
+			ratio = seconds / previous
+			if ratio > 1 + threshold:
+				regressions.append((name, int(size), previous, seconds, ratio))
+
+	return regressions
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(prog='python -m vector.bench', description='Benchmark the vector package.')
+	parser.add_argument('patterns', nargs='*', help='only run cases matching these glob patterns, e.g. "Vec2d.*"')
+	parser.add_argument('--sizes', type=int, nargs='+', help=f'element counts per case (default {DEFAULT_SIZES})')
+	parser.add_argument('--quick', action='store_true', help=f'use sizes {QUICK_SIZES}')
+	parser.add_argument('--repeat', type=int, default=3, help='timing repeats, the best one is kept')
+	parser.add_argument('--output', '-o', help='write JSON results to this file instead of stdout')
+	parser.add_argument('--baseline', help='JSON results of a previous run to compare against')
+	parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='allowed slowdown ratio before a case counts as a regression')
+	parser.add_argument('--list', action='store_true', help='list the available cases and exit')
+	parser.add_argument('--startup', action='store_true', help='time `import vector` with and without each backend instead, in fresh interpreters')
+	args = parser.parse_args(argv)
+
+	if args.list:
+		print('\n'.join(STARTUP if args.startup else CASES))
+		return 0
+
+	sizes = args.sizes or (QUICK_SIZES if args.quick else DEFAULT_SIZES)
+	try:
+		if args.startup:
+			current = startup(args.patterns, args.repeat, log=sys.stderr)
+		else:
+			current = run(args.patterns, sizes, args.repeat, log=sys.stderr)
+	finally:
+		for executor in _executors.values():
+			executor.close()
+		for path in (_scratch, _scratch_csv):
+			if os.path.exists(path):
+				os.remove(path)
+
+	if args.output:
+		with open(args.output, 'w') as f:
+			json.dump(current, f, indent=2)
+	else:
+		json.dump(current, sys.stdout, indent=2)
+		sys.stdout.write('\n')
+
+	if not args.baseline:
+		return 0
+
+	with open(args.baseline) as f:
+		baseline = json.load(f)
+
+	regressions = compare(current, baseline, args.threshold)
+	for name, size, previous, seconds, ratio in regressions:
+		sys.stderr.write(f'REGRESSION {name} @ {size}: {previous * 1e6:.2f} us -> {seconds * 1e6:.2f} us ({ratio:.2f}x)\n')
+
+	sys.stderr.write(f'{len(regressions)} regression(s) above {args.threshold:.0%}\n')
+	return 1 if regressions else 0
+
+#endregion
+
+
+if __name__ == '__main__':
+	sys.exit(main())
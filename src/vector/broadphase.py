@@ -0,0 +1,222 @@
+from bisect import bisect_left
+from itertools import compress, repeat
+from operator import gt
+from vector.vector2d import Vec2d, Vec2dArray
+
+
+BAND_SCALE = 4  # band height in mean box heights, at most len(boxes) bands
+
+
+class SweepAndPrune:
+	# Broadphase for axis aligned rectangles given as (position, size) Vec2d
+	# pairs, position being the corner with the smallest x and y (the
+	# top-left on screen) and size the w/h.
+	#
+	#   boxes = SweepAndPrune.from_boxes(zip(positions, sizes))
+	#   boxes.update(new_positions)   # one position per item, in items order
+	#   for a, b in boxes.pairs(): ...
+	#
+	# Rectangles overlap when they share some area, touching edges do not
+	# count. pairs() sorts the boxes by their lower edge on the axis the
+	# boxes are most spread along and sweeps that order, testing the other
+	# axis only for boxes whose spans meet. The sorted order is kept between
+	# calls, so after a frame of small moves re-sorting it is a near linear
+	# pass of the adaptive list.sort instead of a full sort.
+
+	def __init__(self) -> None:
+		self.items = []  # slot -> item
+		self.__slots = {}  # item -> slot
+		self.x0s = [] ; self.y0s = []
+		self.x1s = [] ; self.y1s = []
+		self.__orders = ([], [])  # slots sorted by lower edge, per axis
+
+
+	#region Creation methods
+
+	@staticmethod
+	def from_boxes(boxes):
+		# (position, size) pairs, the items are their indexes
+		broadphase = SweepAndPrune()
+		for i, (position, size) in enumerate(boxes):
+			broadphase.insert(i, position, size)
+		return broadphase
+
+	#endregion
+
+
+	#region General manipulation methods
+
+	def insert(self, item, position, size):
+		if item in self.__slots:
+			raise KeyError(f'{item!r} is already in the broadphase')
+
+		x, y = Vec2d(position).as_floats()
+		w, h = Vec2d(size).as_floats()
+
+		slot = len(self.items)
+		self.items.append(item)
+		self.__slots[item] = slot
+		self.x0s.append(x) ; self.x1s.append(x + w)
+		self.y0s.append(y) ; self.y1s.append(y + h)
+		for order in self.__orders:
+			order.append(slot)  # sorted into place by the next pairs()
+
+	def move(self, item, position, size=None):
+		slot = self.__slots[item]
+		x, y = Vec2d(position).as_floats()
+		if size is None:
+			w = self.x1s[slot] - self.x0s[slot]
+			h = self.y1s[slot] - self.y0s[slot]
+		else:
+			w, h = Vec2d(size).as_floats()
+
+		self.x0s[slot] = x ; self.x1s[slot] = x + w
+		self.y0s[slot] = y ; self.y1s[slot] = y + h
+
+	def update(self, positions, sizes=None):
+		# Moves every box at once. positions (and sizes) are a Vec2dArray or a
+		# list of vectors with one entry per item, in the order of .items.
+		xs, ys = _columns(positions, len(self.items))
+		if sizes is None:
+			ws = [x1 - x0 for x0, x1 in zip(self.x0s, self.x1s)]
+			hs = [y1 - y0 for y0, y1 in zip(self.y0s, self.y1s)]
+		else:
+			ws, hs = _columns(sizes, len(self.items))
+
+		self.x0s[:] = xs ; self.x1s[:] = [x + w for x, w in zip(xs, ws)]
+		self.y0s[:] = ys ; self.y1s[:] = [y + h for y, h in zip(ys, hs)]
+
+	def remove(self, item):
+		# the last slot moves into the freed one
+		slot = self.__slots.pop(item)
+		last = len(self.items) - 1
+
+		for order in self.__orders:
+			order.remove(slot)
+			if slot != last:
+				order[order.index(last)] = slot
+
+		for column in (self.items, self.x0s, self.y0s, self.x1s, self.y1s):
+			column[slot] = column[last]
+			column.pop()
+		if slot != last:
+			self.__slots[self.items[slot]] = slot
+
+	def box(self, item):
+		# (position, size) of an item
+		slot = self.__slots[item]
+		x0 = self.x0s[slot] ; y0 = self.y0s[slot]
+		return Vec2d(x0, y0), Vec2d(self.x1s[slot] - x0, self.y1s[slot] - y0)
+
+	def clear(self):
+		self.items.clear()
+		self.__slots.clear()
+		for column in (self.x0s, self.y0s, self.x1s, self.y1s) + self.__orders:
+			column.clear()
+
+	#endregion
+
+
+	#region Query methods
+
+	def pairs(self):
+		# every overlapping pair of items once, as (a, b) tuples
+		if not self.items:
+			return []
+
+		# sweep along the axis the boxes are most spread along
+		x_spread = max(self.x0s) - min(self.x0s)
+		y_spread = max(self.y0s) - min(self.y0s)
+		if x_spread >= y_spread:
+			axis, lows, highs, other_lows, other_highs = 0, self.x0s, self.x1s, self.y0s, self.y1s
+		else:
+			axis, lows, highs, other_lows, other_highs = 1, self.y0s, self.y1s, self.x0s, self.x1s
+
+		order = self.__orders[axis]
+		order.sort(key=lows.__getitem__)
+
+		# The other axis is cut into bands a few boxes high and every band is
+		# swept on its own, so a box is only tested against boxes near it on
+		# both axes. A pair is reported in the band its overlap starts in.
+		base = min(other_lows)
+		span = max(other_highs) - base
+		band_size = max(BAND_SCALE * (sum(other_highs) - sum(other_lows)), span) / len(order)
+		if band_size <= 0 or span / band_size < 2:
+			return self.__sweep(order, lows, highs, other_lows, other_highs, None, 0)
+
+		scale = 1 / band_size
+		first_bands = [int((v - base) * scale) for v in other_lows]
+		last_bands = [int((v - base) * scale) for v in other_highs]
+
+		bands = [[] for _ in range(max(last_bands) + 1)]
+		for a in order:
+			first = first_bands[a] ; last = last_bands[a]
+			if first == last:
+				bands[first].append(a)
+				continue
+			for k in range(first, last + 1):
+				bands[k].append(a)
+
+		pairs = []
+		for k, band in enumerate(bands):
+			if len(band) > 1:
+				pairs.extend(self.__sweep(band, lows, highs, other_lows, other_highs, first_bands, k))
+		return pairs
+
+	def __sweep(self, order, lows, highs, other_lows, other_highs, first_bands, band):
+		# pairs among slots sorted by lows, in the given band when first_bands is set
+		starts = list(map(lows.__getitem__, order))
+		items = self.items
+		pairs = []
+
+		# for every box the end of the run of boxes starting before it ends on
+		# the sweep axis (all of them start at or after it), only boxes with a
+		# non empty run are visited
+		nexts = range(1, len(order) + 1)
+		ends = list(map(bisect_left, repeat(starts), map(highs.__getitem__, order), nexts))
+
+		for i in compress(range(len(order)), map(gt, ends, nexts)):
+			a = order[i] ; end = ends[i]
+			low = lows[a] ; other_low = other_lows[a] ; other_high = other_highs[a]
+			item = items[a]
+			if first_bands is None:
+				pairs.extend([
+					(item, items[b]) for b in order[i + 1:end]
+					if other_lows[b] < other_high and other_highs[b] > other_low and highs[b] > low
+				])
+			else:
+				first = first_bands[a]
+				pairs.extend([
+					(item, items[b]) for b in order[i + 1:end]
+					if other_lows[b] < other_high and other_highs[b] > other_low and highs[b] > low
+					and (first_bands[b] if other_lows[b] > other_low else first) == band
+				])
+
+		return pairs
+
+	#endregion
+
+
+	#region Dunder methods
+
+	def __len__(self):
+		return len(self.items)
+
+	def __contains__(self, item):
+		return item in self.__slots
+
+	def __repr__(self):
+		return f'SweepAndPrune of {len(self)} boxes'
+
+	#endregion
+
+
+def _columns(vectors, count):
+	if isinstance(vectors, Vec2dArray):
+		xs, ys = vectors.columns
+	else:
+		xs, ys = zip(*(Vec2d(v).as_floats() for v in vectors)) if vectors else ((), ())
+
+	if len(xs) != count:
+		raise ValueError(f'Length mismatch: {len(xs)} != {count}')
+	return list(xs), list(ys)
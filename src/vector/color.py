@@ -1,4 +1,6 @@
 from vector.assistive_functions import get_normal, clamp_value, translate
+from vector.conversions import rgb_to_hex, hex_to_rgb, hsv_to_rgb, rgb_to_hsv
+
 
 class Color:
 	BLACK = (0, 0, 0)
@@ -35,6 +37,8 @@ class Color:
 	DARK_PURPLE = (128, 0, 128)
 	LIGHT_PURPLE = (255, 128, 255)
 
+	__slots__ = ('_r', '_g', '_b')
+
 	def __get_rgb(self, *args) -> list[float]:
 		args = args[0]
 		number_of_args = len(args)
@@ -53,53 +57,60 @@ class Color:
 					return [args[0][0], args[0][0], args[0][0]]
 				return [args[0][0], args[0][1], args[0][2]]  # single list argument
 			if arg_type is Color:
-				return [args[0].r, args[0].b, args[0].b]
+				return [args[0].r, args[0].g, args[0].b]
 
 		raise TypeError(f'Invalid Input: {args}')
 
 	def __init__(self, *args) -> None:
-		self.__elements = self.__get_rgb(args)
+		if len(args) == 3:  # fast path for Color(r, g, b)
+			r, g, b = args
+		else:
+			r, g, b = self.__get_rgb(args)
+
+		self._r = r if 0 <= r <= 255 else clamp_value(r, 0, 255)
+		self._g = g if 0 <= g <= 255 else clamp_value(g, 0, 255)
+		self._b = b if 0 <= b <= 255 else clamp_value(b, 0, 255)
+
+	def __store(self, r, g, b):
+		# the clamping of __init__ for an existing color, used to fill out=
+		self._r = r if 0 <= r <= 255 else clamp_value(r, 0, 255)
+		self._g = g if 0 <= g <= 255 else clamp_value(g, 0, 255)
+		self._b = b if 0 <= b <= 255 else clamp_value(b, 0, 255)
 
 	#region Properties
 
 	#---------------------- R
 	@property
 	def r(self):
-		self.__elements[0] = clamp_value(self.__elements[0], 0, 255)
-		return int(self.__elements[0])
+		return int(self._r)
 
 	@r.setter
 	def r(self, val):
-		val = clamp_value(val, 0, 255)
-		self.__elements[0] = val
+		self._r = clamp_value(val, 0, 255)
 
 	#---------------------- G
 	@property
 	def g(self):
-		self.__elements[1] = clamp_value(self.__elements[1], 0, 255)
-		return int(self.__elements[1])
+		return int(self._g)
 
 	@g.setter
 	def g(self, val):
-		val = clamp_value(val, 0, 255)
-		self.__elements[1] = val
+		self._g = clamp_value(val, 0, 255)
 
 	#---------------------- B
 	@property
 	def b(self):
-		self.__elements[2] = clamp_value(self.__elements[2], 0, 255)
-		return int(self.__elements[2])
+		return int(self._b)
 
 	@b.setter
 	def b(self, val):
-		val = clamp_value(val, 0, 255)
-		self.__elements[2] = val
+		self._b = clamp_value(val, 0, 255)
 
 	#---------------------- Hex
 
 	@property
 	def hex(self):
-		return '#FFFFFF' #TODO Add Hex function
+		return '#' + self.as_hex()
 
 	#endregion
 
@@ -115,45 +126,19 @@ class Color:
 
 	@staticmethod
 	def from_hex(hex):
-		c = []
-
-		hex = hex.replace('#', '')
-		for i in range(0, 6, 2):
-			element = hex[i:i+2]
-			c.append(int(element, 16))
-
-		return Color(c)
+		return Color(*hex_to_rgb(hex))
 
 	@staticmethod
 	def from_hsv(*args):
-		h, s, v = Color(args).get()
-		s /= 100
-		v /= 100
-
-		c = v * s
-		x = c * (1 - abs(h / 60) % 2 - 1)
-		m = v - c
-
-		if h <=   0 or h >  60 : return Color((c + m) * 255, (x + m) * 255, (0 + m) * 255)
-		if h <=  60 or h > 120 : return Color((x + m) * 255, (c + m) * 255, (0 + m) * 255)
-		if h <= 120 or h > 180 : return Color((0 + m) * 255, (c + m) * 255, (x + m) * 255)
-		if h <= 180 or h > 240 : return Color((0 + m) * 255, (x + m) * 255, (c + m) * 255)
-		if h <= 240 or h > 300 : return Color((x + m) * 255, (0 + m) * 255, (c + m) * 255)
-		if h <= 300 or h > 360 : return Color((c + m) * 255, (0 + m) * 255, (x + m) * 255)
+		h, s, v = args if len(args) == 3 else args[0]
+		return Color(*hsv_to_rgb(h, s, v))
 
 	#endregion
 
 	#region Conversion methods
 
 	def as_hex(self):
-		hexadecimal = ''
-		for i in range(3):
-			element = hex(self.__getitem__(i)).replace('0x', '').upper()
-			if len(element) == 1:
-				element = '0' + element
-			hexadecimal += element
-
-		return hexadecimal
+		return rgb_to_hex(int(self._r), int(self._g), int(self._b))
 
 	def as_unit(self):
 		c = []
@@ -164,104 +149,109 @@ class Color:
 		return c
 
 	def as_hsv(self):
-		ur = self.r / 255
-		ug = self.g / 255
-		ub = self.b / 255
-
-		cmax = max(self.get())
-		cmin = min(self.get())
-
-		delta = cmax - cmin
-
-
-		if   delta == 0      : h = 0
-		elif cmax  == self.r : h = 60 * (((ug - ub) / delta) % 6)
-		elif cmax  == self.g : h = 60 * (((ub - ur) / delta) + 2)
-		elif cmax  == self.b : h = 60 * (((ur - ug) / delta) + 4)
-
-		if cmax == 0 : s = 0
-		if cmax != 0 : s = delta / cmax
-
-		v = (cmax / 255) * 100
-
-		return (int(h), int(s) * 100, int(v))
+		return rgb_to_hsv(int(self._r), int(self._g), int(self._b))
 
 	#endregion
 
 	#region General manipulation methods
 
 	def get(self):
-		return [int(self.r), int(self.g), int(self.b)]
+		return [int(self._r), int(self._g), int(self._b)]
 
 	def set(self, *args):
+		if len(args) == 1 and type(args[0]) is Color:
+			o = args[0]
+			self._r = o._r ; self._g = o._g ; self._b = o._b
+			return
 		r, g, b = self.__get_rgb(args)
-		self.__elements = [r, g, b]
+		self.r = r ; self.g = g ; self.b = b
 
-	def copy(self):
-		return Color(self.r, self.g, self.b)
+	def copy(self, out=None):
+		if out is None : return Color(self.r, self.g, self.b)
+		out._r = self._r ; out._g = self._g ; out._b = self._b
+		return out
 
 	def clear(self):
-		self.r = self.g = self.b = 0
-
-	def ilerp(self, *args, t=0.5):
-		r, g, b = self.__get_rgb(args)
-
-		r = self.r + t * (r - self.r)
-		g = self.g + t * (g - self.g)
-		b = self.b + t * (b - self.b)
-
-		self.set(r, g, b)
+		self._r = self._g = self._b = 0
 
 	#endregion
 
 	#region Dunder methods
 
-	def __iadd__(self, *args):
-		r, g, b = self.__get_rgb(args)
-		self.r += r
-		self.g += g
-		self.b += b
+	def __iadd__(self, other):
+		if type(other) is Color:
+			self.r = int(self._r) + int(other._r)
+			self.g = int(self._g) + int(other._g)
+			self.b = int(self._b) + int(other._b)
+			return self
+		r, g, b = self.__get_rgb((other,))
+		self.r = int(self._r) + r
+		self.g = int(self._g) + g
+		self.b = int(self._b) + b
 		return self
 
-	def __isub__(self, *args):
-		r, g, b = self.__get_rgb(args)
-		self.r -= r
-		self.g -= g
-		self.b -= b
+	def __isub__(self, other):
+		if type(other) is Color:
+			self.r = int(self._r) - int(other._r)
+			self.g = int(self._g) - int(other._g)
+			self.b = int(self._b) - int(other._b)
+			return self
+		r, g, b = self.__get_rgb((other,))
+		self.r = int(self._r) - r
+		self.g = int(self._g) - g
+		self.b = int(self._b) - b
 		return self
 
-	def __imul__(self, *args):
-		r, g, b = self.__get_rgb(args)
-		self.r *= r
-		self.g *= g
-		self.b *= b
+	def __imul__(self, other):
+		if type(other) is Color:
+			self.r = int(self._r) * int(other._r)
+			self.g = int(self._g) * int(other._g)
+			self.b = int(self._b) * int(other._b)
+			return self
+		r, g, b = self.__get_rgb((other,))
+		self.r = int(self._r) * r
+		self.g = int(self._g) * g
+		self.b = int(self._b) * b
 		return self
 
-	def __idiv__(self, *args):
-		r, g, b = self.__get_rgb(args)
-		self.r /= r
-		self.g /= g
-		self.b /= b
+	def __idiv__(self, other):
+		if type(other) is Color:
+			self.r = int(self._r) / int(other._r)
+			self.g = int(self._g) / int(other._g)
+			self.b = int(self._b) / int(other._b)
+			return self
+		r, g, b = self.__get_rgb((other,))
+		self.r = int(self._r) / r
+		self.g = int(self._g) / g
+		self.b = int(self._b) / b
 		return self
 
-	def __add__(self, *args):
-		r, g, b = self.__get_rgb(args)
-		return Color(self.r + r, self.g + g, self.b + b)
-
-	def __sub__(self, *args):
-		r, g, b = self.__get_rgb(args)
-		return Color(self.r - r, self.g - g, self.b - b)
-
-	def __mul__(self, *args):
-		r, g, b = self.__get_rgb(args)
-		return Color(self.r * r, self.g * g, self.b * b)
-
-	def __div__(self, *args):
-		r, g, b = self.__get_rgb(args)
-		return Color(self.r / r, self.g / g, self.b / b)
+	def __add__(self, other):
+		if type(other) is Color:
+			return Color(int(self._r) + int(other._r), int(self._g) + int(other._g), int(self._b) + int(other._b))
+		r, g, b = self.__get_rgb((other,))
+		return Color(int(self._r) + r, int(self._g) + g, int(self._b) + b)
+
+	def __sub__(self, other):
+		if type(other) is Color:
+			return Color(int(self._r) - int(other._r), int(self._g) - int(other._g), int(self._b) - int(other._b))
+		r, g, b = self.__get_rgb((other,))
+		return Color(int(self._r) - r, int(self._g) - g, int(self._b) - b)
+
+	def __mul__(self, other):
+		if type(other) is Color:
+			return Color(int(self._r) * int(other._r), int(self._g) * int(other._g), int(self._b) * int(other._b))
+		r, g, b = self.__get_rgb((other,))
+		return Color(int(self._r) * r, int(self._g) * g, int(self._b) * b)
+
+	def __div__(self, other):
+		if type(other) is Color:
+			return Color(int(self._r) / int(other._r), int(self._g) / int(other._g), int(self._b) / int(other._b))
+		r, g, b = self.__get_rgb((other,))
+		return Color(int(self._r) / r, int(self._g) / g, int(self._b) / b)
 
 	def __getitem__(self, index):
-		return int(self.__elements[index])
+		return (int(self._r), int(self._g), int(self._b))[index]
 
 	def __repr__(self):
 		return f'Color R: {self.r}, G: {self.g}, B: {self.b}'
@@ -273,61 +263,344 @@ class Color:
 
 	#region Mathematical manipulation methods
 	def iadd(self, *args):
+		if len(args) == 1 and type(args[0]) is Color:
+			o = args[0]
+			self.r = int(self._r) + int(o._r)
+			self.g = int(self._g) + int(o._g)
+			self.b = int(self._b) + int(o._b)
+			return
 		r, g, b = self.__get_rgb(args)
-		self.r += r
-		self.g += g
-		self.b += b
+		self.r = int(self._r) + r
+		self.g = int(self._g) + g
+		self.b = int(self._b) + b
 
 	def isub(self, *args):
+		if len(args) == 1 and type(args[0]) is Color:
+			o = args[0]
+			self.r = int(self._r) - int(o._r)
+			self.g = int(self._g) - int(o._g)
+			self.b = int(self._b) - int(o._b)
+			return
 		r, g, b = self.__get_rgb(args)
-		self.r -= r
-		self.g -= g
-		self.b -= b
+		self.r = int(self._r) - r
+		self.g = int(self._g) - g
+		self.b = int(self._b) - b
 
 	def imult(self, *args):
+		if len(args) == 1 and type(args[0]) is Color:
+			o = args[0]
+			self.r = int(self._r) * int(o._r)
+			self.g = int(self._g) * int(o._g)
+			self.b = int(self._b) * int(o._b)
+			return
 		r, g, b = self.__get_rgb(args)
-		self.r *= r
-		self.g *= g
-		self.b *= b
+		self.r = int(self._r) * r
+		self.g = int(self._g) * g
+		self.b = int(self._b) * b
 
 	def idiv(self, *args):
+		if len(args) == 1 and type(args[0]) is Color:
+			o = args[0]
+			self.r = int(self._r) / int(o._r)
+			self.g = int(self._g) / int(o._g)
+			self.b = int(self._b) / int(o._b)
+			return
 		r, g, b = self.__get_rgb(args)
-		self.r /= r
-		self.g /= g
-		self.b /= b
+		self.r = int(self._r) / r
+		self.g = int(self._g) / g
+		self.b = int(self._b) / b
 
 	def ilerp(self, *args, t=0.5):
-		r, g, b = self.__get_rgb(args)
+		if len(args) == 1 and type(args[0]) is Color:
+			o = args[0]
+			r = int(o._r) ; g = int(o._g) ; b = int(o._b)
+		else:
+			r, g, b = self.__get_rgb(args)
+
+		sr = int(self._r) ; sg = int(self._g) ; sb = int(self._b)
+		self._r = clamp_value(sr + t * (r - sr), 0, 255)
+		self._g = clamp_value(sg + t * (g - sg), 0, 255)
+		self._b = clamp_value(sb + t * (b - sb), 0, 255)
+
+	def imadd(self, other, scale):
+		# self += other * scale, e.g. accumulating weighted samples
+		r, g, b = self.__get_rgb((other,))
+		self.r = int(self._r) + r * scale
+		self.g = int(self._g) + g * scale
+		self.b = int(self._b) + b * scale
+
+	# add, sub, mult, div, lerp and madd return a new Color, or write into
+	# out (clamped like the constructor) and return it when one is given.
+
+	def add(self, *args, out=None):
+		if len(args) == 1 and type(args[0]) is Color:
+			o = args[0]
+			r = int(self._r) + int(o._r) ; g = int(self._g) + int(o._g) ; b = int(self._b) + int(o._b)
+		else:
+			r, g, b = self.__get_rgb(args)
+			r = int(self._r) + r ; g = int(self._g) + g ; b = int(self._b) + b
+
+		if out is None : return Color(r, g, b)
+		out.__store(r, g, b)
+		return out
+
+	def sub(self, *args, out=None):
+		if len(args) == 1 and type(args[0]) is Color:
+			o = args[0]
+			r = int(self._r) - int(o._r) ; g = int(self._g) - int(o._g) ; b = int(self._b) - int(o._b)
+		else:
+			r, g, b = self.__get_rgb(args)
+			r = int(self._r) - r ; g = int(self._g) - g ; b = int(self._b) - b
+
+		if out is None : return Color(r, g, b)
+		out.__store(r, g, b)
+		return out
+
+	def mult(self, *args, out=None):
+		if len(args) == 1 and type(args[0]) is Color:
+			o = args[0]
+			r = int(self._r) * int(o._r) ; g = int(self._g) * int(o._g) ; b = int(self._b) * int(o._b)
+		else:
+			r, g, b = self.__get_rgb(args)
+			r = int(self._r) * r ; g = int(self._g) * g ; b = int(self._b) * b
+
+		if out is None : return Color(r, g, b)
+		out.__store(r, g, b)
+		return out
+
+	def div(self, *args, out=None):
+		if len(args) == 1 and type(args[0]) is Color:
+			o = args[0]
+			r = int(self._r) / int(o._r) ; g = int(self._g) / int(o._g) ; b = int(self._b) / int(o._b)
+		else:
+			r, g, b = self.__get_rgb(args)
+			r = int(self._r) / r ; g = int(self._g) / g ; b = int(self._b) / b
+
+		if out is None : return Color(r, g, b)
+		out.__store(r, g, b)
+		return out
+
+	def lerp(self, *args, t=0.5, out=None):
+		if len(args) == 1 and type(args[0]) is Color:
+			o = args[0]
+			r = int(o._r) ; g = int(o._g) ; b = int(o._b)
+		else:
+			r, g, b = self.__get_rgb(args)
+
+		sr = int(self._r) ; sg = int(self._g) ; sb = int(self._b)
+		r = sr + t * (r - sr)
+		g = sg + t * (g - sg)
+		b = sb + t * (b - sb)
+
+		if out is None : return Color(r, g, b)
+		out.__store(r, g, b)
+		return out
+
+	def madd(self, other, scale, out=None):
+		r, g, b = self.__get_rgb((other,))
+		r = int(self._r) + r * scale ; g = int(self._g) + g * scale ; b = int(self._b) + b * scale
+
+		if out is None : return Color(r, g, b)
+		out.__store(r, g, b)
+		return out
+
+	#endregion
 
-		r = self.r + t * (r - self.r)
-		g = self.g + t * (g - self.g)
-		b = self.b + t * (b - self.b)
 
-		self.set(r, g, b)
+def _clamp_byte(value):
+	return int(clamp_value(value, 0, 255))
 
-	def add(self, *args):
-		r, g, b = self.__get_rgb(args)
-		return Color(self.r + r, self.g + g, self.b + b)
 
-	def sub(self, *args):
-		r, g, b = self.__get_rgb(args)
-		return Color(self.r - r, self.g - g, self.b - b)
+class ColorBuffer:
+	def __get_rgb(self, args):
+		if len(args) == 1 and isinstance(args[0], ColorBuffer):
+			if len(args[0]) != len(self):
+				raise ValueError(f'Length mismatch: {len(args[0])} != {len(self)}')
+			return None
 
-	def mult(self, *args):
-		r, g, b = self.__get_rgb(args)
-		return Color(self.r * r, self.g * g, self.b * b)
+		if len(args) == 1 and isinstance(args[0], Color):
+			return args[0].get()
+		if len(args) == 1 and type(args[0]) in (float, int):
+			return [args[0], args[0], args[0]]
+		if len(args) == 1 and type(args[0]) in (list, tuple):
+			if len(args[0]) == 1:
+				return [args[0][0], args[0][0], args[0][0]]
+			return list(args[0][:3])
+		if len(args) == 3:
+			return list(args)
 
-	def div(self, *args):
-		r, g, b = self.__get_rgb(args)
-		return Color(self.r / r, self.g / g, self.b / b)
+		raise TypeError(f'Invalid Input: {args}')
 
-	def lerp(self, *args, t=0.5):
-		r, g, b = self.__get_rgb(args)
+	def __apply(self, args, op, out=None):
+		# writes op(self, args) into out, or into self when out is None
+		rgb = self.__get_rgb(args)
+		if out is None:
+			out = self
+		elif len(out) != len(self):
+			raise ValueError(f'Length mismatch: {len(out)} != {len(self)}')
+
+		if rgb is None:  # pixel by pixel against another buffer
+			other = args[0].data
+			out.data[:] = bytes([_clamp_byte(op(a, b)) for a, b in zip(self.data, other)])
+			return out
+
+		# one lookup table per channel, every pixel is then a table hit
+		for i, value in enumerate(rgb):
+			table = bytes([_clamp_byte(op(c, value)) for c in range(256)])
+			out.data[i::3] = bytes(self.data[i::3]).translate(table)
+		return out
+
+	def __target(self, out):
+		return ColorBuffer(self.width, self.height) if out is None else out
+
+	def __init__(self, width=0, height=1) -> None:
+		self.width = width
+		self.height = height
+		self.data = bytearray(3 * width * height)
+
+
+	#region Creation methods
+
+	@staticmethod
+	def from_colors(colors):
+		colors = list(colors)
+		buffer = ColorBuffer(len(colors))
+		buffer.data[:] = bytes([channel for c in colors for channel in Color(c).get()])
+		return buffer
+
+	@staticmethod
+	def from_bytes(data, width, height=1):
+		buffer = ColorBuffer(width, height)
+		if len(data) != len(buffer.data):
+			raise ValueError(f'Expected {len(buffer.data)} bytes, got {len(data)}')
+
+		buffer.data[:] = data
+		return buffer
+
+	#endregion
 
-		r = self.r + t * (r - self.r)
-		g = self.g + t * (g - self.g)
-		b = self.b + t * (b - self.b)
 
-		return Color(r, g, b)
+	#region Conversion methods
+
+	def as_hex(self):
+		hexadecimal = self.data.hex().upper()
+		return [hexadecimal[i:i+6] for i in range(0, len(hexadecimal), 6)]
+
+	def as_unit(self):
+		table = [translate(i, 0, 255, 0, 1) for i in range(256)]
+		data = self.data
+		return [[table[data[i]], table[data[i + 1]], table[data[i + 2]]] for i in range(0, len(data), 3)]
+
+	def as_hsv(self):
+		data = self.data
+		return [rgb_to_hsv(data[i], data[i + 1], data[i + 2]) for i in range(0, len(data), 3)]
+
+	def memoryview(self):
+		return memoryview(self.data)
+
+	@property
+	def __array_interface__(self):
+		return {
+			'version': 3,
+			'shape': (self.height, self.width, 3),
+			'typestr': '|u1',
+			'data': self.data,
+		}
+
+	#endregion
+
+
+	#region General manipulation methods
+
+	def fill(self, *args):
+		self.data[:] = bytes(Color(*args).get()) * len(self)
+
+	def copy(self, out=None):
+		if out is None:
+			return ColorBuffer.from_bytes(self.data, self.width, self.height)
+		if len(out) != len(self):
+			raise ValueError(f'Length mismatch: {len(out)} != {len(self)}')
+		out.data[:] = self.data
+		return out
+
+	def clear(self):
+		self.data[:] = bytes(len(self.data))
+
+	#endregion
+
+
+	#region Mathematical manipulation methods
+
+	def iadd(self, *args):
+		self.__apply(args, lambda c, v: c + v)
+
+	def isub(self, *args):
+		self.__apply(args, lambda c, v: c - v)
+
+	def imult(self, *args):
+		self.__apply(args, lambda c, v: c * v)
+
+	def idiv(self, *args):
+		self.__apply(args, lambda c, v: c / v)
+
+	def ilerp(self, *args, t=0.5):
+		self.__apply(args, lambda c, v: c + t * (v - c))
+
+	def imadd(self, other, scale):
+		self.__apply((other,), lambda c, v: c + v * scale)
+
+	# With out the result goes into an existing buffer of the same length
+	# (which may be self or the other buffer) instead of a new one.
+
+	def add(self, *args, out=None):
+		return self.__apply(args, lambda c, v: c + v, self.__target(out))
+
+	def sub(self, *args, out=None):
+		return self.__apply(args, lambda c, v: c - v, self.__target(out))
+
+	def mult(self, *args, out=None):
+		return self.__apply(args, lambda c, v: c * v, self.__target(out))
+
+	def div(self, *args, out=None):
+		return self.__apply(args, lambda c, v: c / v, self.__target(out))
+
+	def lerp(self, *args, t=0.5, out=None):
+		return self.__apply(args, lambda c, v: c + t * (v - c), self.__target(out))
+
+	def madd(self, other, scale, out=None):
+		# self + other * scale, clamped per channel
+		return self.__apply((other,), lambda c, v: c + v * scale, self.__target(out))
+
+	#endregion
+
+
+	#region Dunder methods
+
+	def __len__(self):
+		return len(self.data) // 3
+
+	def __iter__(self):
+		data = self.data
+		for i in range(0, len(data), 3):
+			yield Color(data[i], data[i + 1], data[i + 2])
+
+	def __getitem__(self, index):
+		if index < 0:
+			index += len(self)
+		if not 0 <= index < len(self):
+			raise IndexError('ColorBuffer index out of range')
+
+		return Color(self.data[3 * index], self.data[3 * index + 1], self.data[3 * index + 2])
+
+	def __setitem__(self, index, value):
+		if index < 0:
+			index += len(self)
+		if not 0 <= index < len(self):  # a slice past the end would grow the buffer
+			raise IndexError('ColorBuffer assignment index out of range')
+
+		self.data[3 * index:3 * index + 3] = bytes(Color(value).get())
+
+	def __repr__(self):
+		return f'ColorBuffer {self.width}x{self.height}'
 
 	#endregion
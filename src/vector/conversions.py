@@ -0,0 +1,112 @@
+from functools import lru_cache
+
+
+# Table driven color space conversions shared by Color and ColorBuffer.
+# Hex and HSV use the same ranges as Color: hex strings are 'RRGGBB' with an
+# optional '#', h is in degrees 0-360, s and v are percentages 0-100.
+
+HEX_CACHE_SIZE = 4096
+HSV_CACHE_SIZE = 4096
+
+# 256-entry channel -> two digit table, and the reverse for either case
+HEX_DIGITS = tuple(f'{i:02X}' for i in range(256))
+_HEX_VALUES = {digits: i for i, digits in enumerate(HEX_DIGITS)}
+_HEX_VALUES.update({digits.lower(): i for i, digits in enumerate(HEX_DIGITS)})
+
+_HSV_TABLE = None  # [h * 101 + s] -> unit (r, g, b) at full value, built on first use
+
+
+def _hsv_unit(h, s):
+	# rgb in 0-1 at v = 100%, every channel of the full conversion is this times v
+	h = h % 360
+	s = s / 100
+
+	c = s
+	x = c * (1 - abs((h / 60) % 2 - 1))
+	m = 1 - c
+
+	if   h < 60  : r, g, b = c, x, 0
+	elif h < 120 : r, g, b = x, c, 0
+	elif h < 180 : r, g, b = 0, c, x
+	elif h < 240 : r, g, b = 0, x, c
+	elif h < 300 : r, g, b = x, 0, c
+	else         : r, g, b = c, 0, x
+
+	return (r + m, g + m, b + m)
+
+
+def _hsv_table():
+	global _HSV_TABLE
+	if _HSV_TABLE is None:
+		_HSV_TABLE = [_hsv_unit(h, s) for h in range(360) for s in range(101)]
+	return _HSV_TABLE
+
+
+#region Hex
+
+def rgb_to_hex(r, g, b):
+	return HEX_DIGITS[r] + HEX_DIGITS[g] + HEX_DIGITS[b]
+
+
+@lru_cache(maxsize=HEX_CACHE_SIZE)
+def hex_to_rgb(text):
+	text = text.replace('#', '')
+	values = _HEX_VALUES
+	try:
+		return (values[text[0:2]], values[text[2:4]], values[text[4:6]])
+	except KeyError:  # mixed case digits
+		return (int(text[0:2], 16), int(text[2:4], 16), int(text[4:6], 16))
+
+#endregion
+
+
+#region HSV
+
+def hsv_to_rgb(h, s, v):
+	# Whole degrees and percentages are a table hit, anything else is
+	# computed with the same function the table was built from
+	if type(h) is int and type(s) is int and 0 <= s <= 100:
+		r, g, b = _hsv_table()[(h % 360) * 101 + s]
+	else:
+		r, g, b = _hsv_unit(h, s)
+
+	scale = v * 2.55
+	return (round(r * scale), round(g * scale), round(b * scale))
+
+
+def _rgb_to_hsv(r, g, b):
+	cmax = max(r, g, b)
+	cmin = min(r, g, b)
+	delta = cmax - cmin
+
+	if   delta == 0 : h = 0
+	elif cmax  == r : h = 60 * (((g - b) / delta) % 6)
+	elif cmax  == g : h = 60 * (((b - r) / delta) + 2)
+	else            : h = 60 * (((r - g) / delta) + 4)
+
+	s = delta / cmax if cmax != 0 else 0
+	v = cmax / 255
+
+	return (int(h), int(s * 100), int(v * 100))
+
+
+rgb_to_hsv = lru_cache(maxsize=HSV_CACHE_SIZE)(_rgb_to_hsv)
+
+#endregion
+
+
+#region Statistics
+
+def cache_info():
+	# hits, misses, maxsize and currsize of every memoised conversion
+	return {
+		'hex_to_rgb': hex_to_rgb.cache_info(),
+		'rgb_to_hsv': rgb_to_hsv.cache_info(),
+	}
+
+
+def cache_clear():
+	hex_to_rgb.cache_clear()
+	rgb_to_hsv.cache_clear()
+
+#endregion
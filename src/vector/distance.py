@@ -0,0 +1,89 @@
+from array import array
+from heapq import nsmallest
+from math import sqrt
+from vector.vector2d import Vec2d, Vec2dArray
+from vector.vector3d import Vec3d, Vec3dArray
+
+
+# rows per block are chosen so a block holds about this many distances
+DEFAULT_BLOCK_ELEMENTS = 1 << 20
+
+
+def _columns(points):
+	if isinstance(points, (Vec2dArray, Vec3dArray)):
+		return points.columns
+
+	points = list(points)
+	if not points:
+		return ()
+
+	first = points[0]
+	if isinstance(first, Vec3d) or (type(first) in (list, tuple) and len(first) == 3):
+		floats = [Vec3d(p).as_floats() for p in points]
+	else:
+		floats = [Vec2d(p).as_floats() for p in points]
+
+	return tuple(array('d', column) for column in zip(*floats))
+
+
+def _is_empty(columns):
+	# no columns for an empty list, empty columns for an empty batch
+	return not columns or len(columns[0]) == 0
+
+
+def _row_function(a_columns, b_columns):
+	if len(a_columns) != len(b_columns):
+		raise ValueError(f'Dimension mismatch: {len(a_columns)} != {len(b_columns)}')
+
+	if len(a_columns) == 2:
+		bxs, bys = b_columns
+		def row(i):
+			x = a_columns[0][i] ; y = a_columns[1][i]
+			return array('d', [(x - bx)**2 + (y - by)**2 for bx, by in zip(bxs, bys)])
+		return row
+
+	bxs, bys, bzs = b_columns
+	def row(i):
+		x = a_columns[0][i] ; y = a_columns[1][i] ; z = a_columns[2][i]
+		return array('d', [(x - bx)**2 + (y - by)**2 + (z - bz)**2 for bx, by, bz in zip(bxs, bys, bzs)])
+	return row
+
+
+def pairwise_distances(a, b, squared=False, chunk_size=None):
+	# Yields (first_row, rows) blocks of the len(a) x len(b) distance
+	# matrix, each row an array('d'), so only one block is alive at a time.
+	a_columns = _columns(a)
+	b_columns = _columns(b)
+	if _is_empty(a_columns) or _is_empty(b_columns):
+		return
+
+	row = _row_function(a_columns, b_columns)
+	count = len(a_columns[0])
+	if chunk_size is None:
+		chunk_size = max(1, DEFAULT_BLOCK_ELEMENTS // len(b_columns[0]))
+
+	for start in range(0, count, chunk_size):
+		rows = [row(i) for i in range(start, min(start + chunk_size, count))]
+		if not squared:
+			rows = [array('d', map(sqrt, r)) for r in rows]
+		yield start, rows
+
+
+def pairwise_topk(a, b, k, squared=False):
+	# Yields, for every point of a, its k closest points of b as a list of
+	# (index into b, distance) pairs, closest first.
+	a_columns = _columns(a)
+	b_columns = _columns(b)
+	if _is_empty(a_columns) or _is_empty(b_columns):
+		return
+
+	row = _row_function(a_columns, b_columns)
+	indices = range(len(b_columns[0]))
+
+	for i in range(len(a_columns[0])):
+		distances = row(i)
+		closest = nsmallest(k, indices, key=distances.__getitem__)
+		if squared:
+			yield [(j, distances[j]) for j in closest]
+		else:
+			yield [(j, sqrt(distances[j])) for j in closest]
@@ -0,0 +1,111 @@
+from vector.color import Color, ColorBuffer
+
+
+DEFAULT_SIZE = 256
+
+
+class Gradient:
+	# Color stops baked into a fixed size lookup table, so shading a value is
+	# an index into the table instead of a Color.lerp per pixel.
+	#
+	#   heat = Gradient([Color.BLACK, Color.RED, Color.YELLOW, (255, 255, 255)])
+	#   heat = Gradient([(0.0, Color.BLUE), (0.8, Color.GREEN), (1.0, Color.RED)], space='hsv')
+	#   pixels = heat.map(temperatures, low=-20, high=45)
+	#
+	# Stops are colors (spread evenly) or (position, color) pairs with
+	# positions in 0-1. In the 'rgb' space every entry is exactly the
+	# Color.lerp between its two stops; 'hsv' blends hue along the shorter arc.
+
+	def __init__(self, stops, size=DEFAULT_SIZE, space='rgb') -> None:
+		if size < 2:
+			raise ValueError(f'A gradient needs at least 2 entries, got {size}')
+		if space not in ('rgb', 'hsv'):
+			raise ValueError(f"space must be 'rgb' or 'hsv', got {space!r}")
+
+		stops = list(stops)
+		if not stops:
+			raise ValueError('A gradient needs at least one stop')
+		if not all(type(stop) is tuple and len(stop) == 2 for stop in stops):
+			last = max(1, len(stops) - 1)
+			stops = [(i / last, stop) for i, stop in enumerate(stops)]
+
+		self.stops = sorted(((float(t), Color(c)) for t, c in stops), key=lambda stop: stop[0])
+		self.size = size
+		self.space = space
+		self.bake()
+
+
+	#region Creation methods
+
+	def bake(self):
+		# (re)builds the table, call after editing stops
+		last = self.size - 1
+		self.table = [self.__evaluate(i / last) for i in range(self.size)]
+		self.__rows = [bytes(c.get()) for c in self.table]
+
+	def __evaluate(self, t):
+		stops = self.stops
+		if t <= stops[0][0]:
+			return stops[0][1].copy()
+		if t >= stops[-1][0]:
+			return stops[-1][1].copy()
+
+		for (t0, c0), (t1, c1) in zip(stops, stops[1:]):
+			if t <= t1:
+				f = (t - t0) / (t1 - t0) if t1 > t0 else 1.0
+				if self.space == 'rgb':
+					return c0.lerp(c1, t=f)
+				return _hsv_lerp(c0, c1, f)
+
+	#endregion
+
+
+	#region Lookup methods
+
+	def color_at(self, value, low=0.0, high=1.0):
+		last = self.size - 1
+		index = int((value - low) * last / (high - low) + 0.5)
+		r, g, b = self.__rows[0 if index < 0 else last if index > last else index]
+		return Color(r, g, b)
+
+	def indices(self, values, low=0.0, high=1.0):
+		# table index of every value, clamped to the ends of the gradient
+		last = self.size - 1
+		scale = last / (high - low)
+		offset = 0.5 - low * scale
+		return [0 if i < 0 else last if i > last else i for i in (int(v * scale + offset) for v in values)]
+
+	def map(self, values, low=0.0, high=1.0, width=None, height=1):
+		# A ColorBuffer with one pixel per value, values outside low-high take
+		# the end colors. width/height shape the buffer, e.g. for a heatmap.
+		data = b''.join(map(self.__rows.__getitem__, self.indices(values, low, high)))
+		count = len(data) // 3
+		return ColorBuffer.from_bytes(data, count // height if width is None else width, height)
+
+	#endregion
+
+
+	#region Dunder methods
+
+	def __len__(self):
+		return self.size
+
+	def __getitem__(self, index):
+		return self.table[index].copy()
+
+	def __repr__(self):
+		return f'Gradient of {len(self.stops)} stops baked into {self.size} {self.space} entries'
+
+	#endregion
+
+
+def _hsv_lerp(c0, c1, t):
+	h0, s0, v0 = c0.as_hsv()
+	h1, s1, v1 = c1.as_hsv()
+
+	# grey stops have no hue of their own, borrow the other stop's
+	if s0 == 0 : h0 = h1
+	if s1 == 0 : h1 = h0
+
+	dh = (h1 - h0 + 180) % 360 - 180
+	return Color.from_hsv((h0 + t * dh) % 360, s0 + t * (s1 - s0), v0 + t * (v1 - v0))
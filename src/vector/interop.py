@@ -0,0 +1,90 @@
+from vector.vector2d import Vec2d, Vec2dArray
+from vector.vector3d import Vec3d, Vec3dArray
+from vector.color import Color, ColorBuffer
+
+
+def _numpy():
+	# imported on first use so `import vector` never pays for NumPy
+	try:
+		import numpy
+	except ImportError:
+		raise ImportError('NumPy is required for vector.interop, install it with `pip install numpy`') from None
+	return numpy
+
+
+def to_numpy(obj):
+	# Batch containers are shared, not copied: a Vec2dArray/Vec3dArray gives
+	# one float64 array per component column and a ColorBuffer gives a
+	# (height, width, 3) uint8 array over its pixel bytes. Writes through
+	# either side are visible to the other.
+	np = _numpy()
+
+	if isinstance(obj, (Vec2dArray, Vec3dArray)):
+		return tuple(
+			np.asarray(column) if isinstance(column, memoryview) else np.frombuffer(column, dtype=np.float64)
+			for column in obj.columns
+		)
+	if isinstance(obj, ColorBuffer):
+		return np.asarray(obj)
+
+	if isinstance(obj, (Vec2d, Vec3d)):
+		return np.array(obj.as_floats(), dtype=np.float64)
+	if isinstance(obj, Color):
+		return np.array(obj.get(), dtype=np.uint8)
+
+	# any other sequence of vectors or colors is copied into an (n, d) array
+	items = list(obj)
+	if items and isinstance(items[0], Color):
+		return np.array([c.get() for c in items], dtype=np.uint8).reshape(len(items), 3)
+	return np.array([v.as_floats() for v in items], dtype=np.float64)
+
+
+def _shared_column(np, column, copy):
+	if column.dtype != np.float64 or not column.flags.writeable:
+		if not copy:
+			raise TypeError(f'Cannot share memory with a {column.dtype} array, pass copy=True to convert it')
+		column = np.array(column, dtype=np.float64)
+
+	return memoryview(column)
+
+
+def from_numpy(*arrays, copy=False):
+	# Wraps NumPy memory in a batch container without copying.
+	#   from_numpy(xs, ys) / from_numpy(xs, ys, zs)  -> Vec2dArray / Vec3dArray
+	#   from_numpy(points)  with shape (n, 2) or (n, 3) -> Vec2dArray / Vec3dArray
+	#   from_numpy(pixels)  uint8 with shape (h, w, 3) or (n, 3) -> ColorBuffer
+	# The resulting containers are fixed size; append/extend are not available.
+	np = _numpy()
+
+	if len(arrays) == 1:
+		arr = arrays[0]
+
+		if arr.dtype == np.uint8 and arr.ndim in (2, 3) and arr.shape[-1] == 3:
+			if not (arr.flags.c_contiguous and arr.flags.writeable):
+				if not copy:
+					raise TypeError('Cannot share memory with a non-contiguous or read-only pixel array, pass copy=True')
+				arr = np.ascontiguousarray(arr).copy()
+
+			height, width = arr.shape[:2] if arr.ndim == 3 else (1, arr.shape[0])
+			buffer = ColorBuffer()
+			buffer.width = width
+			buffer.height = height
+			buffer.data = memoryview(arr).cast('B')
+			return buffer
+
+		if arr.ndim == 2 and arr.shape[1] in (2, 3):
+			arrays = tuple(arr[:, i] for i in range(arr.shape[1]))
+
+	if len(arrays) == 2:
+		batch = Vec2dArray()
+		batch.xs, batch.ys = (_shared_column(np, a, copy) for a in arrays)
+	elif len(arrays) == 3:
+		batch = Vec3dArray()
+		batch.xs, batch.ys, batch.zs = (_shared_column(np, a, copy) for a in arrays)
+	else:
+		raise TypeError(f'Invalid Input: {arrays}')
+
+	if len(set(len(column) for column in batch.columns)) != 1:
+		raise ValueError(f'Length mismatch: {[len(column) for column in batch.columns]}')
+
+	return batch
@@ -0,0 +1,241 @@
+from functools import partial
+from math import sqrt
+from vector.vector2d import Vec2d, Vec2dArray
+from vector.vector3d import Vec3d, Vec3dArray
+
+
+# Chained operations on a lazy expression only record a small tree:
+#
+#   e = lazy(a).add(b).mult(c).sub(d).normalised()
+#   v = e.evaluate()
+#
+# evaluate() turns the tree into one generated function that computes
+# every step with plain local floats, so no intermediate Vec2d/Vec3d (or
+# intermediate batch columns) are created. Every step uses the same float
+# expression as the eager method, so results are identical. The one
+# difference is normalised() on a zero vector: the eager method returns
+# None, here the zero vector passes through, like Vec2dArray.normalise.
+#
+# Operands are read when the expression is evaluated, not when it is
+# built, so one expression can be evaluated again after its inputs change.
+# If any operand is a Vec2dArray/Vec3dArray the whole expression runs as a
+# single loop over the batch and returns a new batch.
+
+_COMPONENTS = ('x', 'y', 'z')
+_compiled = {}  # (shape, dimensions, batch) -> generated function
+
+
+class Expr:
+	__slots__ = ('op', 'operands', 't', 'plan')
+
+	def __init__(self, op, operands, t=None) -> None:
+		self.op = op
+		self.operands = operands
+		self.t = t
+		self.plan = None  # built by the first evaluate()
+
+
+	#region Building methods
+
+	def add(self, *args):
+		return Expr('add', (self, _operand(args)))
+
+	def sub(self, *args):
+		return Expr('sub', (self, _operand(args)))
+
+	def mult(self, *args):
+		return Expr('mult', (self, _operand(args)))
+
+	def div(self, *args):
+		return Expr('div', (self, _operand(args)))
+
+	def lerp(self, *args, t=0.5):
+		return Expr('lerp', (self, _operand(args)), t)
+
+	def normalised(self):
+		return Expr('normalised', (self,))
+
+	#endregion
+
+
+	#region Evaluation methods
+
+	def evaluate(self):
+		if self.plan is None:
+			self.plan = self.__plan()
+		return self.plan()
+
+	def __plan(self):
+		# the generated function with its arguments bound: vectors and batches
+		# are passed as objects and read inside, constants as ready floats
+		leaves = []  # (kind, value) in visiting order
+		shape = self.__shape(leaves)
+
+		dims = {len(value.columns) if kind == 'b' else len(value.as_floats()) for kind, value in leaves if kind in 'vb'}
+		if len(dims) != 1:
+			raise TypeError('Cannot mix 2D and 3D operands in one expression')
+		dims = dims.pop()
+
+		args = []
+		for kind, value in leaves:
+			if   kind == 'k' : args.extend((Vec2d if dims == 2 else Vec3d)(*value).as_floats())
+			else             : args.append(value)
+
+		batch = any(kind == 'b' for kind, _ in leaves)
+		return partial(_compile(shape, dims, batch), *args)
+
+	def __shape(self, leaves):
+		# structure of the tree with every operand replaced by its kind:
+		# 'v' vector, 'b' batch, 'k' constant, 't' lerp amount
+		if self.op == 'leaf':
+			leaves.append(self.operands)
+			return self.operands[0]
+
+		shapes = tuple(operand.__shape(leaves) for operand in self.operands)
+		if self.op == 'lerp':
+			leaves.append(('t', self.t))
+			shapes += ('t',)
+		return (self.op,) + shapes
+
+	#endregion
+
+
+	#region Dunder methods
+
+	def __repr__(self):
+		if self.op == 'leaf':
+			kind, value = self.operands
+			return repr(value) if kind == 'k' else f'lazy({type(value).__name__})'
+
+		first, *rest = self.operands
+		args = ', '.join([repr(operand) for operand in rest] + ([f't={self.t}'] if self.op == 'lerp' else []))
+		return f'{first!r}.{self.op}({args})'
+
+	#endregion
+
+
+def lazy(vectors):
+	# starts an expression from a Vec2d, Vec3d, Vec2dArray or Vec3dArray
+	if isinstance(vectors, Expr):
+		return vectors
+	if isinstance(vectors, (Vec2dArray, Vec3dArray)):
+		return Expr('leaf', ('b', vectors))
+	if isinstance(vectors, (Vec2d, Vec3d)):
+		return Expr('leaf', ('v', vectors))
+	raise TypeError(f'Invalid Input: {vectors}')
+
+
+def _operand(args):
+	# the same inputs __get_xy/__get_xyz accept; numbers and lists are
+	# expanded once the dimension is known
+	if len(args) == 1:
+		arg = args[0]
+		if isinstance(arg, (Expr, Vec2d, Vec3d, Vec2dArray, Vec3dArray)):
+			return lazy(arg)
+		if type(arg) in (list, tuple):
+			args = tuple(arg)
+	return Expr('leaf', ('k', tuple(args)))
+
+
+#region Code generation
+
+def _compile(shape, dims, batch):
+	key = (shape, dims, batch)
+	if key not in _compiled:
+		_compiled[key] = _generate(shape, dims, batch)
+	return _compiled[key]
+
+
+def _generate(shape, dims, batch):
+	components = _COMPONENTS[:dims]
+	params = []   # function arguments in leaf order
+	setup = []    # lines run once per call, before any loop
+	columns = []  # (element name, column name) pairs walked together
+	batches = []
+	body = []
+	counter = [0]
+
+	def name(prefix):
+		counter[0] += 1
+		return f'{prefix}{counter[0]}'
+
+	def emit(node):
+		# returns the local names holding the node's components
+		if type(node) is tuple:
+			return emit_operation(node)
+		if node == 't':
+			t = name('t')
+			params.append(t)
+			return t
+
+		base = name('a')
+		names = [f'{base}{c}' for c in components]
+		if node == 'k':
+			params.extend(names)
+			return names
+
+		params.append(base)
+		if node == 'v':
+			setup.append('; '.join(f'{n} = {base}.{c}' for n, c in zip(names, components)))
+		elif node == 'b':
+			column_names = [f'{n}s' for n in names]
+			setup.append(f'{", ".join(column_names)} = {base}.columns')
+			columns.extend(zip(names, column_names))
+			batches.append(base)
+		return names
+
+	def emit_operation(node):
+		op, *operands = node
+		left = emit(operands[0])
+		right = emit(operands[1]) if op != 'normalised' else None
+		t = emit(operands[2]) if op == 'lerp' else None
+		out = [f'{name("v")}{c}' for c in components]
+
+		if op == 'add':
+			body.extend(f'{o} = {r} + {l}' for o, l, r in zip(out, left, right))
+		elif op == 'sub':
+			body.extend(f'{o} = {l} - {r}' for o, l, r in zip(out, left, right))
+		elif op == 'mult':
+			body.extend(f'{o} = {l} * {r}' for o, l, r in zip(out, left, right))
+		elif op == 'div':
+			body.extend(f'{o} = {l} / {r}' for o, l, r in zip(out, left, right))
+		elif op == 'lerp':
+			body.extend(f'{o} = {l} + {t} * ({r} - {l})' for o, l, r in zip(out, left, right))
+		elif op == 'normalised':
+			mag = name('m')
+			body.append(f'{mag} = sqrt({" + ".join(f"{l}**2" for l in left)})')
+			body.extend(f'{o} = {l} / {mag} if {mag} != 0 else {l}' for o, l in zip(out, left))
+		return out
+
+	result = emit(shape)
+
+	lines = [f'def fused({", ".join(params)}):']
+	lines += [f'\t{line}' for line in setup]
+	if not batch:
+		lines += [f'\t{line}' for line in body]
+		lines.append(f'\treturn Vector({", ".join(result)})')
+	else:
+		# one pass over every batch column, constants and vectors stay locals
+		lines.append(f'\tcheck_lengths({", ".join(batches)})')
+		lines += [f'\tr{c} = []' for c in components]
+		lines += [f'\tappend_{c} = r{c}.append' for c in components]
+		lines.append(f'\tfor {", ".join(n for n, _ in columns)}, in zip({", ".join(c for _, c in columns)}):')
+		lines += [f'\t\t{line}' for line in body]
+		lines += [f'\t\tappend_{c}({r})' for c, r in zip(components, result)]
+		lines.append(f'\treturn Batch.from_columns({", ".join(f"r{c}" for c in components)})')
+
+	namespace = {
+		'sqrt': sqrt,
+		'check_lengths': _check_lengths,
+		'Vector': Vec2d if dims == 2 else Vec3d,
+		'Batch': Vec2dArray if dims == 2 else Vec3dArray,
+	}
+	exec('\n'.join(lines), namespace)
+	return namespace['fused']
+
+
+def _check_lengths(*batches):
+	if len({len(b) for b in batches}) > 1:
+		raise ValueError(f'Length mismatch: {[len(b) for b in batches]}')
+
+#endregion
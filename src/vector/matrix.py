@@ -0,0 +1,411 @@
+from array import array
+from math import sin, cos, tan
+from vector.vector2d import Vec2d, Vec2dArray
+from vector.vector3d import Vec3d, Vec3dArray
+
+
+def _get_elements(args, size) -> list[float]:
+	number_of_args = len(args)
+	count = size * size
+
+	if number_of_args == 0:
+		return [1.0 if row == col else 0.0 for row in range(size) for col in range(size)]  # identity
+	elif number_of_args == count:
+		return [float(v) for v in args]  # every element passed in
+	elif number_of_args == 1:  # one argument
+		arg = args[0]
+
+		if isinstance(arg, (Mat3, Mat4)) and len(arg.m) == count:
+			return list(arg.m)
+		if type(arg) is list or type(arg) is tuple:
+			if len(arg) == count:
+				return [float(v) for v in arg]  # flat row-major list
+			if len(arg) == size and all(len(row) == size for row in arg):
+				return [float(v) for row in arg for v in row]  # list of rows
+
+	raise TypeError(f'Invalid Input: {args}')
+
+
+def _multiply(a, b, size):
+	m = []
+	for row in range(size):
+		for col in range(size):
+			m.append(sum(a[row * size + k] * b[k * size + col] for k in range(size)))
+	return m
+
+
+def _transpose(a, size):
+	return [a[col * size + row] for row in range(size) for col in range(size)]
+
+
+def _inverse(a, size):
+	# Gauss-Jordan elimination with partial pivoting on [a | I]
+	rows = [a[i * size:(i + 1) * size] + [1.0 if i == j else 0.0 for j in range(size)] for i in range(size)]
+
+	for col in range(size):
+		pivot = max(range(col, size), key=lambda r: abs(rows[r][col]))
+		if rows[pivot][col] == 0:
+			raise ValueError('Matrix is not invertible')
+		rows[col], rows[pivot] = rows[pivot], rows[col]
+
+		p = rows[col][col]
+		rows[col] = [v / p for v in rows[col]]
+
+		for r in range(size):
+			if r != col and rows[r][col] != 0:
+				f = rows[r][col]
+				rows[r] = [v - f * pv for v, pv in zip(rows[r], rows[col])]
+
+	return [v for row in rows for v in row[size:]]
+
+
+class Mat3:
+	# Acts on Vec3d as a 3x3 linear map and on Vec2d as a 2D affine
+	# transform of the homogeneous point (x, y, 1).
+
+	__slots__ = ('m',)
+
+	def __init__(self, *args) -> None:
+		self.m = _get_elements(args, 3)
+
+
+	#region Creation methods
+
+	@staticmethod
+	def identity():
+		return Mat3()
+
+	@staticmethod
+	def rotation_x(a):
+		ca = cos(a)
+		sa = sin(a)
+		return Mat3(
+			1, 0, 0,
+			0, ca, -sa,
+			0, sa, ca,
+		)
+
+	@staticmethod
+	def rotation_y(a):
+		ca = cos(a)
+		sa = sin(a)
+		return Mat3(
+			ca, 0, sa,
+			0, 1, 0,
+			-sa, 0, ca,
+		)
+
+	@staticmethod
+	def rotation_z(a):
+		ca = cos(a)
+		sa = sin(a)
+		return Mat3(
+			ca, -sa, 0,
+			sa, ca, 0,
+			0, 0, 1,
+		)
+
+	@staticmethod
+	def rotation(a):
+		return Mat3.rotation_z(a)
+
+	@staticmethod
+	def scale(*args):
+		if len(args) == 3:  # 3D scale
+			sx, sy, sz = args
+		else:  # 2D scale, keeps the homogeneous row intact
+			sx, sy = Vec2d(*args).as_floats()
+			sz = 1
+
+		return Mat3(
+			sx, 0, 0,
+			0, sy, 0,
+			0, 0, sz,
+		)
+
+	@staticmethod
+	def translation(*args):
+		x, y = Vec2d(*args).as_floats()
+		return Mat3(
+			1, 0, x,
+			0, 1, y,
+			0, 0, 1,
+		)
+
+	#endregion
+
+
+	#region General manipulation methods
+
+	def get(self):
+		return [self.m[0:3], self.m[3:6], self.m[6:9]]
+
+	def copy(self):
+		return Mat3(self.m)
+
+	def transpose(self):
+		return Mat3(_transpose(self.m, 3))
+
+	def inverse(self):
+		return Mat3(_inverse(self.m, 3))
+
+	def multiply(self, other):
+		if not isinstance(other, Mat3):
+			raise TypeError(f'Invalid Input: {other}')
+		return Mat3(_multiply(self.m, other.m, 3))
+
+	#endregion
+
+
+	#region Transform methods
+
+	def transform(self, v):
+		m0, m1, m2, m3, m4, m5, m6, m7, m8 = self.m
+
+		if isinstance(v, Vec2d):
+			x = v.x ; y = v.y
+			return Vec2d(m0 * x + m1 * y + m2, m3 * x + m4 * y + m5)
+		if isinstance(v, Vec3d):
+			x = v.x ; y = v.y ; z = v.z
+			return Vec3d(m0 * x + m1 * y + m2 * z, m3 * x + m4 * y + m5 * z, m6 * x + m7 * y + m8 * z)
+
+		raise TypeError(f'Invalid Input: {v}')
+
+	def transform_all(self, vectors):
+		if isinstance(vectors, (Vec2dArray, Vec3dArray)):
+			result = vectors.copy()
+			self.itransform_all(result)
+			return result
+
+		return [self.transform(v) for v in vectors]
+
+	def itransform_all(self, vectors):
+		m0, m1, m2, m3, m4, m5, m6, m7, m8 = self.m
+
+		if isinstance(vectors, Vec2dArray):
+			xs, ys = vectors.columns
+			nx = [m0 * x + m1 * y + m2 for x, y in zip(xs, ys)]
+			ny = [m3 * x + m4 * y + m5 for x, y in zip(xs, ys)]
+			xs[:] = array('d', nx)
+			ys[:] = array('d', ny)
+			return
+
+		if isinstance(vectors, Vec3dArray):
+			xs, ys, zs = vectors.columns
+			nx = [m0 * x + m1 * y + m2 * z for x, y, z in zip(xs, ys, zs)]
+			ny = [m3 * x + m4 * y + m5 * z for x, y, z in zip(xs, ys, zs)]
+			nz = [m6 * x + m7 * y + m8 * z for x, y, z in zip(xs, ys, zs)]
+			xs[:] = array('d', nx)
+			ys[:] = array('d', ny)
+			zs[:] = array('d', nz)
+			return
+
+		for v in vectors:
+			v.set(self.transform(v))
+
+	#endregion
+
+
+	#region Dunder methods
+
+	def __matmul__(self, other):
+		if isinstance(other, Mat3):
+			return self.multiply(other)
+		return self.transform(other)
+
+	def __getitem__(self, index):
+		row, col = index
+		return self.m[row * 3 + col]
+
+	def __setitem__(self, index, value):
+		row, col = index
+		self.m[row * 3 + col] = value
+
+	def __eq__(self, other):
+		return isinstance(other, Mat3) and self.m == other.m
+
+	def __repr__(self):
+		return f'Mat3 {self.get()}'
+
+	#endregion
+
+
+class Mat4:
+	# Acts on Vec3d as the homogeneous point (x, y, z, 1), dividing by w
+	# when the matrix is projective.
+
+	__slots__ = ('m',)
+
+	def __init__(self, *args) -> None:
+		self.m = _get_elements(args, 4)
+
+
+	#region Creation methods
+
+	@staticmethod
+	def identity():
+		return Mat4()
+
+	@staticmethod
+	def rotation_x(a):
+		ca = cos(a)
+		sa = sin(a)
+		return Mat4(
+			1, 0, 0, 0,
+			0, ca, -sa, 0,
+			0, sa, ca, 0,
+			0, 0, 0, 1,
+		)
+
+	@staticmethod
+	def rotation_y(a):
+		ca = cos(a)
+		sa = sin(a)
+		return Mat4(
+			ca, 0, sa, 0,
+			0, 1, 0, 0,
+			-sa, 0, ca, 0,
+			0, 0, 0, 1,
+		)
+
+	@staticmethod
+	def rotation_z(a):
+		ca = cos(a)
+		sa = sin(a)
+		return Mat4(
+			ca, -sa, 0, 0,
+			sa, ca, 0, 0,
+			0, 0, 1, 0,
+			0, 0, 0, 1,
+		)
+
+	@staticmethod
+	def scale(*args):
+		sx, sy, sz = Vec3d(*args).as_floats()
+		return Mat4(
+			sx, 0, 0, 0,
+			0, sy, 0, 0,
+			0, 0, sz, 0,
+			0, 0, 0, 1,
+		)
+
+	@staticmethod
+	def translation(*args):
+		x, y, z = Vec3d(*args).as_floats()
+		return Mat4(
+			1, 0, 0, x,
+			0, 1, 0, y,
+			0, 0, 1, z,
+			0, 0, 0, 1,
+		)
+
+	@staticmethod
+	def perspective(fov, aspect, near, far):
+		f = 1 / tan(fov / 2)
+		return Mat4(
+			f / aspect, 0, 0, 0,
+			0, f, 0, 0,
+			0, 0, (far + near) / (near - far), (2 * far * near) / (near - far),
+			0, 0, -1, 0,
+		)
+
+	#endregion
+
+
+	#region General manipulation methods
+
+	def get(self):
+		return [self.m[0:4], self.m[4:8], self.m[8:12], self.m[12:16]]
+
+	def copy(self):
+		return Mat4(self.m)
+
+	def transpose(self):
+		return Mat4(_transpose(self.m, 4))
+
+	def inverse(self):
+		return Mat4(_inverse(self.m, 4))
+
+	def multiply(self, other):
+		if not isinstance(other, Mat4):
+			raise TypeError(f'Invalid Input: {other}')
+		return Mat4(_multiply(self.m, other.m, 4))
+
+	#endregion
+
+
+	#region Transform methods
+
+	def transform(self, v):
+		if not isinstance(v, Vec3d):
+			raise TypeError(f'Invalid Input: {v}')
+
+		m = self.m
+		x = v.x ; y = v.y ; z = v.z
+
+		tx = m[0] * x + m[1] * y + m[2] * z + m[3]
+		ty = m[4] * x + m[5] * y + m[6] * z + m[7]
+		tz = m[8] * x + m[9] * y + m[10] * z + m[11]
+		w = m[12] * x + m[13] * y + m[14] * z + m[15]
+
+		if w != 1 and w != 0:
+			return Vec3d(tx / w, ty / w, tz / w)
+		return Vec3d(tx, ty, tz)
+
+	def transform_all(self, vectors):
+		if isinstance(vectors, Vec3dArray):
+			result = vectors.copy()
+			self.itransform_all(result)
+			return result
+
+		return [self.transform(v) for v in vectors]
+
+	def itransform_all(self, vectors):
+		if not isinstance(vectors, Vec3dArray):
+			for v in vectors:
+				v.set(self.transform(v))
+			return
+
+		m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, m11, m12, m13, m14, m15 = self.m
+		xs, ys, zs = vectors.columns
+
+		nx = [m0 * x + m1 * y + m2 * z + m3 for x, y, z in zip(xs, ys, zs)]
+		ny = [m4 * x + m5 * y + m6 * z + m7 for x, y, z in zip(xs, ys, zs)]
+		nz = [m8 * x + m9 * y + m10 * z + m11 for x, y, z in zip(xs, ys, zs)]
+
+		if (m12, m13, m14, m15) != (0, 0, 0, 1):  # projective, divide through by w
+			ws = [m12 * x + m13 * y + m14 * z + m15 for x, y, z in zip(xs, ys, zs)]
+			ws = [w if w != 0 else 1 for w in ws]
+			nx = [v / w for v, w in zip(nx, ws)]
+			ny = [v / w for v, w in zip(ny, ws)]
+			nz = [v / w for v, w in zip(nz, ws)]
+
+		xs[:] = array('d', nx)
+		ys[:] = array('d', ny)
+		zs[:] = array('d', nz)
+
+	#endregion
+
+
+	#region Dunder methods
+
+	def __matmul__(self, other):
+		if isinstance(other, Mat4):
+			return self.multiply(other)
+		return self.transform(other)
+
+	def __getitem__(self, index):
+		row, col = index
+		return self.m[row * 4 + col]
+
+	def __setitem__(self, index, value):
+		row, col = index
+		self.m[row * 4 + col] = value
+
+	def __eq__(self, other):
+		return isinstance(other, Mat4) and self.m == other.m
+
+	def __repr__(self):
+		return f'Mat4 {self.get()}'
+
+	#endregion
@@ -0,0 +1,197 @@
+from operator import add
+from vector.color import Color, ColorBuffer
+
+
+# 4x4 Bayer matrix, the threshold order for ordered dithering
+BAYER_4 = (
+	( 0,  8,  2, 10),
+	(12,  4, 14,  6),
+	( 3, 11,  1,  9),
+	(15,  7, 13,  5),
+)
+
+
+def _constant_colors():
+	# the Color class constants, first name wins for duplicated values
+	seen = {}
+	for name, value in vars(Color).items():
+		if name.isupper() and type(value) is tuple and value not in seen:
+			seen[value] = name
+	return list(seen)
+
+
+class Palette:
+	# Maps colors to their nearest entry (squared RGB distance) of a fixed
+	# palette of up to 256 colors.
+	#
+	# Whole buffers go through a lookup cube: every channel is cut down to
+	# `bits` bits and each of the 2^(3*bits) cells remembers the palette entry
+	# nearest its center, so a pixel costs three table reads and one cube
+	# read, all driven from C via map(). The cube is built on first use. A
+	# pixel may land on an entry up to one cell diagonal (about 14 units at
+	# the default 5 bits) further away than the true nearest;
+	# nearest()/index_of() are always exact.
+
+	def __init__(self, colors=None, bits=5) -> None:
+		colors = _constant_colors() if colors is None else colors
+		self.colors = [Color(c) for c in colors]
+		if not 0 < len(self.colors) <= 256:
+			raise ValueError(f'A palette needs 1 to 256 colors, got {len(self.colors)}')
+		if not 1 <= bits <= 8:
+			raise ValueError(f'bits must be between 1 and 8, got {bits}')
+
+		self.bits = bits
+		self.__cube = None  # (cube, r table, g table, b table)
+		self.__exact = {}  # (r, g, b) -> index, filled by index_of
+		self.__dither_tables = {}
+
+		# index -> channel tables, turn index bytes back into pixels with bytes.translate
+		self.__channels = [
+			bytes([c.get()[i] for c in self.colors] + [0] * (256 - len(self.colors)))
+			for i in range(3)
+		]
+
+
+	#region Creation methods
+
+	@staticmethod
+	def from_constants(bits=5):
+		# every distinct Color.RED, Color.DARK_GREY, ... constant
+		return Palette(None, bits)
+
+	#endregion
+
+
+	#region Lookup methods
+
+	def index_of(self, *args):
+		# exact nearest entry, memoised per color
+		key = tuple(Color(*args).get())
+		index = self.__exact.get(key)
+		if index is None:
+			r, g, b = key
+			index = min(
+				range(len(self.colors)),
+				key=lambda i: (self.colors[i].r - r)**2 + (self.colors[i].g - g)**2 + (self.colors[i].b - b)**2,
+			)
+			self.__exact[key] = index
+		return index
+
+	def nearest(self, *args):
+		return self.colors[self.index_of(*args)].copy()
+
+	def __get_cube(self):
+		if self.__cube is not None:
+			return self.__cube
+
+		shift = 8 - self.bits
+		centers = [(i << shift) + ((1 << shift) >> 1) for i in range(1 << self.bits)]
+		entries = range(len(self.colors))
+		prs, pgs, pbs = ([c.get()[i] for c in self.colors] for i in range(3))
+
+		# squared distance from every center to every entry, per channel
+		drs = [[(r - pr)**2 for pr in prs] for r in centers]
+		dgs = [[(g - pg)**2 for pg in pgs] for g in centers]
+		dbs = [[(b - pb)**2 for pb in pbs] for b in centers]
+
+		cube = bytearray()
+		for dr in drs:
+			for dg in dgs:
+				rg = list(map(add, dr, dg))
+				for db in dbs:
+					d = list(map(add, rg, db))
+					cube.append(min(entries, key=d.__getitem__))
+
+		# the cube index is r << 2*bits | g << bits | b, split into one table per channel
+		rt = [(v >> shift) << (2 * self.bits) for v in range(256)]
+		gt = [(v >> shift) << self.bits for v in range(256)]
+		bt = [v >> shift for v in range(256)]
+
+		self.__cube = (bytes(cube), rt, gt, bt)
+		return self.__cube
+
+	#endregion
+
+
+	#region Buffer methods
+
+	def indices(self, pixels, dither=0):
+		# Palette index of every pixel of a ColorBuffer (or list of colors) as
+		# bytes. dither is the ordered dithering strength in channel units,
+		# True picks one that suits the palette's spacing.
+		if not isinstance(pixels, ColorBuffer):
+			pixels = ColorBuffer.from_colors(pixels)
+
+		data = pixels.data
+		if dither:
+			data = self.__dithered(pixels, dither)
+
+		cube, rt, gt, bt = self.__get_cube()
+		keys = map(add, map(add, map(rt.__getitem__, data[0::3]), map(gt.__getitem__, data[1::3])), map(bt.__getitem__, data[2::3]))
+		return bytes(map(cube.__getitem__, keys))
+
+	def quantize(self, pixels, dither=0):
+		# a new ColorBuffer of the same size holding only palette colors
+		if not isinstance(pixels, ColorBuffer):
+			pixels = ColorBuffer.from_colors(pixels)
+
+		result = ColorBuffer(pixels.width, pixels.height)
+		self.__write(result, self.indices(pixels, dither))
+		return result
+
+	def iquantize(self, pixels, dither=0):
+		self.__write(pixels, self.indices(pixels, dither))
+
+	def __write(self, buffer, indices):
+		for i, table in enumerate(self.__channels):
+			buffer.data[i::3] = indices.translate(table)
+
+	def __dithered(self, pixels, strength):
+		if strength is True:
+			levels = max(2, round(len(self.colors) ** (1 / 3)))
+			strength = 255 / (levels - 1)
+
+		# one clamped offset table per Bayer threshold, kept per strength
+		tables = self.__dither_tables.get(strength)
+		if tables is None:
+			tables = {}
+			for row in BAYER_4:
+				for threshold in row:
+					offset = round(((threshold + 0.5) / 16 - 0.5) * strength)
+					tables[threshold] = bytes(min(255, max(0, v + offset)) for v in range(256))
+			self.__dither_tables[strength] = tables
+
+		# every pixel in a row that shares a column phase shares a threshold,
+		# so each row is four strided translates per channel
+		data = bytearray(pixels.data)
+		width = max(1, pixels.width if pixels.height > 1 else len(pixels))
+		for y in range(len(pixels) // width):
+			start = 3 * y * width
+			stop = start + 3 * width
+			row = BAYER_4[y % 4]
+			for phase in range(min(4, width)):
+				table = tables[row[phase]]
+				for channel in range(3):
+					first = start + 3 * phase + channel
+					data[first:stop:12] = bytes(data[first:stop:12]).translate(table)
+
+		return data
+
+	#endregion
+
+
+	#region Dunder methods
+
+	def __len__(self):
+		return len(self.colors)
+
+	def __iter__(self):
+		return iter(self.colors)
+
+	def __getitem__(self, index):
+		return self.colors[index]
+
+	def __repr__(self):
+		return f'Palette of {len(self.colors)} colors'
+
+	#endregion
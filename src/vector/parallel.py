@@ -0,0 +1,243 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from vector.vector2d import Vec2dArray
+from vector.vector3d import Vec3d, Vec3dArray
+
+
+# Batches handed to the pool live in shared memory as one block of float64
+# columns laid end to end (all xs, then all ys, ...). Workers only receive
+# the block name, a shard range and the operation, never the elements
+# themselves, and write their results straight into the block.
+
+DEFAULT_MIN_SHARD = 1 << 14  # smaller batches are not worth a round trip to the pool
+
+
+class _Block:
+	# picklable description of a shared batch, stands in for it in job args
+	__slots__ = ('name', 'count', 'components')
+
+	def __init__(self, name, count, components) -> None:
+		self.name = name
+		self.count = count
+		self.components = components
+
+	def __getstate__(self):
+		return self.name, self.count, self.components
+
+	def __setstate__(self, state):
+		self.name, self.count, self.components = state
+
+
+def _attach(block, start, stop, opened):
+	# builds a Vec2dArray/Vec3dArray over rows start:stop of a shared block
+	if block.name not in opened:
+		opened[block.name] = SharedMemory(name=block.name)
+	view = opened[block.name].buf.cast('d')
+
+	batch = Vec2dArray() if block.components == 2 else Vec3dArray()
+	columns = [view[c * block.count + start:c * block.count + stop] for c in range(block.components)]
+	if block.components == 2:
+		batch.xs, batch.ys = columns
+	else:
+		batch.xs, batch.ys, batch.zs = columns
+	return batch, columns + [view]
+
+
+def _run_shard(target, start, stop, op, args, kwargs):
+	opened = {}
+	views = []
+	shard = None
+	shard_args = []
+	try:
+		shard, attached = _attach(target, start, stop, opened)
+		views += attached
+		for arg in args:
+			if isinstance(arg, _Block):
+				arg, attached = _attach(arg, start, stop, opened)
+				views += attached
+			shard_args.append(arg)
+
+		if isinstance(op, str):
+			getattr(shard, op)(*shard_args, **kwargs)
+		else:
+			op(shard, *shard_args, **kwargs)
+	finally:
+		# every view must be released before the blocks can be closed
+		shard = shard_args = None
+		for view in reversed(views):
+			view.release()
+		for shm in opened.values():
+			shm.close()
+
+
+class ParallelExecutor:
+	# Runs in-place batch operations across a process pool.
+	#
+	#   with ParallelExecutor(workers=8) as pool:
+	#       points = pool.share(points)       # optional, copies into shared memory once
+	#       pool.apply(points, 'rotate_z', 0.1)
+	#       pool.apply(points, 'ilerp', targets, t=0.25)
+	#       pool.apply(points, my_kernel, 2.0)  # my_kernel(shard, 2.0), must be a top-level function
+	#
+	# op is the name of an in-place Vec2dArray/Vec3dArray method or a
+	# picklable callable that modifies the shard it is given. Batch
+	# arguments with the same length as the target are sharded alongside it.
+
+	def __init__(self, workers=None, min_shard=DEFAULT_MIN_SHARD) -> None:
+		self.workers = workers or os.cpu_count() or 1
+		self.min_shard = min_shard
+		self.__pool = None
+		self.__shared = {}  # id(batch) -> (batch, SharedMemory)
+
+
+	#region Shared memory methods
+
+	def share(self, vectors):
+		# Returns a copy of vectors whose columns live in shared memory, so
+		# repeated apply() calls on it skip the copy in and out. Like arrays
+		# from interop.from_numpy it is fixed size. The memory is freed by
+		# release() or close().
+		if isinstance(vectors, (Vec2dArray, Vec3dArray)):
+			source = vectors
+		else:
+			vectors = list(vectors)
+			source = Vec3dArray(vectors) if vectors and isinstance(vectors[0], Vec3d) else Vec2dArray(vectors)
+
+		count = len(source)
+		columns = source.columns
+		shm = SharedMemory(create=True, size=max(8, 8 * count * len(columns)))
+		view = shm.buf.cast('d')
+
+		shared = Vec2dArray() if len(columns) == 2 else Vec3dArray()
+		new_columns = []
+		for c, column in enumerate(columns):
+			new_column = view[c * count:(c + 1) * count]
+			new_column[:] = column if isinstance(column, array) else array('d', column)
+			new_columns.append(new_column)
+		view.release()
+
+		if len(columns) == 2:
+			shared.xs, shared.ys = new_columns
+		else:
+			shared.xs, shared.ys, shared.zs = new_columns
+
+		self.__shared[id(shared)] = (shared, shm)
+		return shared
+
+	def release(self, shared):
+		# Frees the shared memory behind a batch returned by share(). The
+		# batch keeps a private copy of its values.
+		copies = [array('d', column) for column in shared.columns]
+		self.__free(shared)
+
+		if len(copies) == 2:
+			shared.xs, shared.ys = copies
+		else:
+			shared.xs, shared.ys, shared.zs = copies
+
+	def __free(self, shared):
+		if id(shared) not in self.__shared:
+			raise ValueError('Not shared by this executor')
+
+		shared, shm = self.__shared.pop(id(shared))
+		for column in shared.columns:
+			column.release()
+		shm.close()
+		shm.unlink()
+
+	def __block(self, batch):
+		return _Block(self.__shared[id(batch)][1].name, len(batch), len(batch.columns))
+
+	#endregion
+
+
+	#region Execution methods
+
+	def apply(self, vectors, op, *args, **kwargs):
+		# Applies op in place to a Vec2dArray, Vec3dArray (shared or not) or a
+		# list of Vec2d/Vec3d, and returns vectors
+		if not isinstance(vectors, (Vec2dArray, Vec3dArray)):
+			batch = Vec3dArray(vectors) if vectors and isinstance(vectors[0], Vec3d) else Vec2dArray(vectors)
+			self.apply(batch, op, *args, **kwargs)
+			for v, x in zip(vectors, batch.as_list()):
+				v.set(x)
+			return vectors
+
+		count = len(vectors)
+		shards = min(self.workers, count // self.min_shard)
+		if shards < 2:
+			if isinstance(op, str):
+				getattr(vectors, op)(*args, **kwargs)
+			else:
+				op(vectors, *args, **kwargs)
+			return vectors
+
+		temporary = []
+		try:
+			# anything not already shared is copied in for the duration of the call
+			def block_of(batch):
+				if id(batch) not in self.__shared:
+					temporary.append((batch, self.share(batch)))
+					batch = temporary[-1][1]
+				return self.__block(batch)
+
+			target = block_of(vectors)
+			job_args = tuple(
+				block_of(arg) if isinstance(arg, (Vec2dArray, Vec3dArray)) and len(arg) == count else arg
+				for arg in args
+			)
+
+			bounds = [count * i // shards for i in range(shards + 1)]
+			pool = self.__get_pool()
+			jobs = [
+				pool.submit(_run_shard, target, start, stop, op, job_args, kwargs)
+				for start, stop in zip(bounds, bounds[1:])
+			]
+			for job in jobs:
+				job.result()
+
+			# results only need copying back into the batch that was operated on
+			if temporary and temporary[0][0] is vectors:
+				for column, shared_column in zip(vectors.columns, temporary[0][1].columns):
+					column[:] = array('d', shared_column.tobytes())
+		finally:
+			for _, shared in temporary:
+				self.__free(shared)
+
+		return vectors
+
+	def __get_pool(self):
+		if self.__pool is None:
+			self.__pool = ProcessPoolExecutor(self.workers)
+		return self.__pool
+
+	def close(self):
+		for shared, _ in list(self.__shared.values()):
+			self.release(shared)
+		if self.__pool is not None:
+			self.__pool.shutdown()
+			self.__pool = None
+
+	#endregion
+
+
+	#region Dunder methods
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc):
+		self.close()
+
+	def __repr__(self):
+		return f'ParallelExecutor of {self.workers} workers'
+
+	#endregion
+
+
+def parallel_apply(vectors, op, *args, workers=None, **kwargs):
+	# One-off convenience, pays for starting a pool on every call
+	with ParallelExecutor(workers) as pool:
+		return pool.apply(vectors, op, *args, **kwargs)
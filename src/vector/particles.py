@@ -0,0 +1,213 @@
+from array import array
+from itertools import compress, repeat
+from math import inf
+from vector.vector2d import Vec2d, Vec2dArray, _clamp_component
+from vector.vector3d import Vec3d, Vec3dArray
+
+
+class Particles:
+	# Positions, velocities and accelerations of many particles held as
+	# Vec2dArray/Vec3dArray columns, advanced a whole step at a time.
+	#
+	#   particles = Particles(2)
+	#   particles.emit_batch(rng.in_disc(100_000), rng.vec2_unit(100_000), lifetimes=3.0)
+	#   particles.step(dt, max_speed=10, damping=0.99)   # semi-implicit Euler
+	#   particles.position(0)                            # a live Vec2d view
+	#
+	# step() does exactly what the per particle loop
+	#   vel.iadd(acc.mult(dt)) ; vel.imult(damping) ; vel.clamp(max_speed) ; pos.iadd(vel.mult(dt))
+	# does, so at dt=1 and no damping the results are identical to
+	# vel.iadd(acc) ; vel.clamp(max_speed) ; pos.iadd(vel).
+	#
+	# Every particle has a remaining lifetime that each step counts down,
+	# particles reaching 0 are removed at the end of the step.
+
+	def __init__(self, dims=2) -> None:
+		if dims not in (2, 3):
+			raise ValueError(f'Particles are 2D or 3D, got {dims}')
+
+		self.dims = dims
+		self.__vector = Vec2d if dims == 2 else Vec3d
+		self.__batch = Vec2dArray if dims == 2 else Vec3dArray
+
+		self.positions = self.__batch()
+		self.velocities = self.__batch()
+		self.accelerations = self.__batch()
+		self.lifetimes = array('d')
+		self.mortal = False  # whether any particle has a finite lifetime
+		self.previous = None  # positions one step back, kept by verlet()
+
+	def __limits(self, max_speed):
+		# per component limits, a number or one per component like Vec2d.clamp takes
+		if max_speed is None:
+			return None
+		return self.__vector(max_speed).as_floats()
+
+
+	#region Creation methods
+
+	def emit(self, position, velocity=0, acceleration=0, lifetime=inf):
+		# converted first, so a bad argument appends nothing
+		position = self.__vector(position)
+		velocity = self.__vector(velocity)
+		acceleration = self.__vector(acceleration)
+		lifetime = float(lifetime)
+
+		self.positions.append(position)
+		self.velocities.append(velocity)
+		self.accelerations.append(acceleration)
+		self.lifetimes.append(lifetime)
+		self.mortal = self.mortal or lifetime != inf
+		self.previous = None
+
+	def emit_batch(self, positions, velocities=None, accelerations=None, lifetimes=inf):
+		# positions is a Vec2dArray/Vec3dArray (or list of vectors), velocities
+		# and accelerations are batches of the same length or one vector for all
+		if not isinstance(positions, self.__batch):
+			positions = self.__batch(positions)
+		count = len(positions)
+
+		# every input is converted and checked before any column grows, so a
+		# bad argument leaves the particles as they were
+		extensions = []
+		for target, values in ((self.velocities, velocities), (self.accelerations, accelerations)):
+			if isinstance(values, self.__batch):
+				if len(values) != count:
+					raise ValueError(f'Length mismatch: {len(values)} != {count}')
+				extensions.append((target, values))
+			else:
+				value = self.__vector(0 if values is None else values).as_floats()
+				extensions.append((target, self.__batch.from_columns(*(repeat(float(v), count) for v in value))))
+
+		if type(lifetimes) in (int, float):
+			mortal = lifetimes != inf
+			lifetimes = repeat(float(lifetimes), count)
+		else:
+			lifetimes = array('d', lifetimes)
+			if len(lifetimes) != count:
+				raise ValueError(f'Length mismatch: {len(lifetimes)} != {count}')
+			mortal = any(t != inf for t in lifetimes)
+
+		for target, values in extensions:
+			target.extend(values)
+		self.lifetimes.extend(lifetimes)
+		self.mortal = self.mortal or mortal
+		self.positions.extend(positions)
+		self.previous = None
+
+	#endregion
+
+
+	#region Integration methods
+
+	def step(self, dt=1.0, max_speed=None, damping=1.0):
+		# one semi-implicit Euler step: velocity first, then position with the
+		# new velocity
+		columns = zip(self.positions.columns, self.velocities.columns, self.accelerations.columns)
+		limits = self.__limits(max_speed)
+
+		for i, (ps, vs, acs) in enumerate(columns):
+			m = None if limits is None else limits[i]
+			if m is None:
+				new = [(v + a * dt) * damping for v, a in zip(vs, acs)]
+			elif m >= 0:  # _clamp_component inlined, it only differs for negative limits
+				new = [m if w > m else -m if w < -m else w for v, a in zip(vs, acs) for w in [(v + a * dt) * damping]]
+			else:
+				new = list(map(_clamp_component, [(v + a * dt) * damping for v, a in zip(vs, acs)], repeat(m)))
+
+			vs[:] = array('d', new)
+			ps[:] = array('d', [p + v * dt for p, v in zip(ps, new)])
+
+		self.previous = None
+		return self.age(dt)
+
+	def verlet(self, dt=1.0, max_speed=None, damping=1.0):
+		# One position Verlet step, x' = x + (x - x_prev) * damping + a * dt^2.
+		# The first step after emitting starts from x_prev = x - v * dt.
+		# max_speed limits the step (x' - x) to max_speed * dt per component
+		# and the velocities are kept as (x' - x) / dt.
+		if self.previous is None:
+			self.previous = self.positions.sub(self.velocities.mult(dt))
+
+		limits = self.__limits(max_speed)
+		dt2 = dt * dt
+		columns = zip(self.positions.columns, self.previous.columns, self.velocities.columns, self.accelerations.columns)
+
+		for i, (ps, qs, vs, acs) in enumerate(columns):
+			m = None if limits is None else limits[i] * dt
+			if m is None:
+				moves = [(p - q) * damping + a * dt2 for p, q, a in zip(ps, qs, acs)]
+			elif m >= 0:
+				moves = [m if w > m else -m if w < -m else w for p, q, a in zip(ps, qs, acs) for w in [(p - q) * damping + a * dt2]]
+			else:
+				moves = list(map(_clamp_component, [(p - q) * damping + a * dt2 for p, q, a in zip(ps, qs, acs)], repeat(m)))
+
+			qs[:] = ps
+			ps[:] = array('d', [p + m for p, m in zip(ps, moves)])
+			vs[:] = array('d', [m / dt for m in moves])
+
+		return self.age(dt)
+
+	def damp(self, factor):
+		self.velocities.imult(factor)
+
+	def clamp(self, *args):
+		# per component velocity limit, the same arguments and rule as Vec2d.clamp
+		self.velocities.clamp(*args)
+
+	#endregion
+
+
+	#region Lifetime methods
+
+	def age(self, dt):
+		# counts every lifetime down by dt and removes the expired particles,
+		# returns how many were removed
+		if not self.mortal:
+			return 0
+		self.lifetimes[:] = array('d', [t - dt for t in self.lifetimes])
+		return self.cull()
+
+	def cull(self):
+		alive = [t > 0 for t in self.lifetimes]
+		removed = len(alive) - sum(alive)
+		if removed == 0:
+			return 0
+
+		batches = [self.positions, self.velocities, self.accelerations]
+		if self.previous is not None:
+			batches.append(self.previous)
+
+		for batch in batches:
+			for column in batch.columns:
+				column[:] = array('d', compress(column, alive))
+		self.lifetimes[:] = array('d', compress(self.lifetimes, alive))
+		return removed
+
+	#endregion
+
+
+	#region Accessors
+
+	# live views, writing to one writes to the particle
+	def position(self, index):
+		return self.positions[index]
+
+	def velocity(self, index):
+		return self.velocities[index]
+
+	def acceleration(self, index):
+		return self.accelerations[index]
+
+	#endregion
+
+
+	#region Dunder methods
+
+	def __len__(self):
+		return len(self.lifetimes)
+
+	def __repr__(self):
+		return f'Particles of {len(self)} {self.dims}D particles'
+
+	#endregion
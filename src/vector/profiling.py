@@ -0,0 +1,235 @@
+import atexit
+import csv
+import json
+import os
+import sys
+from functools import wraps
+from time import perf_counter
+from vector.vector2d import Vec2d, Vec2dArray
+from vector.vector3d import Vec3d, Vec3dArray
+from vector.color import Color, ColorBuffer
+from vector.quaternion import Quat, QuatArray
+
+
+# Opt-in call counting and timing for the public methods and constructors
+# of the vector types.
+#
+#   with profiling.profiled():
+#       run_physics_step()
+#   profiling.report()
+#
+# or set VECTOR_PROFILE=1 before importing vector to profile the whole run
+# and print the report at exit (VECTOR_PROFILE=path.json / path.csv exports
+# it instead).
+#
+# Methods are only wrapped while profiling is enabled. Disabling puts the
+# original functions back, so a disabled profiler costs nothing at all.
+# Times are inclusive: a method calling another public method counts that
+# call's time too. Bound methods saved before enabling are not seen.
+# Every constructor call is also attributed to the innermost profiled method
+# running at the time, so instances_by_method() shows which method made the
+# temporaries. Only one thread should run profiled code at a time.
+
+ENV_VARIABLE = 'VECTOR_PROFILE'
+CLASSES = (Vec2d, Vec3d, Color, Quat, Vec2dArray, Vec3dArray, ColorBuffer, QuatArray)
+
+# dunders worth counting, the rest (repr, slots machinery, ...) are left alone
+DUNDERS = (
+	'__init__', '__add__', '__sub__', '__mul__', '__div__', '__truediv__',
+	'__iadd__', '__isub__', '__imul__', '__idiv__', '__itruediv__',
+	'__getitem__', '__setitem__', '__iter__', '__len__', '__call__',
+)
+
+_records = {}  # (class name, method name) -> [calls, seconds]
+_originals = {}  # (class, name) -> the class __dict__ entry replaced by a wrapper
+_depth = 0  # nested profiled() blocks
+_created = {}  # (allocating method or None, class name) -> constructor calls
+_running = []  # the profiled methods currently running, innermost last
+
+OUTSIDE = '<outside>'  # instances_by_method() key for objects made by other code
+
+
+#region Switching
+
+def is_enabled():
+	return bool(_originals)
+
+
+def enable():
+	global _depth
+	_depth += 1
+	if _originals:
+		return
+
+	for cls in CLASSES:
+		for name, entry in list(vars(cls).items()):
+			if name.startswith('_') and name not in DUNDERS:
+				continue
+
+			if isinstance(entry, staticmethod):
+				wrapped = staticmethod(_wrap(cls.__name__, name, entry.__func__))
+			elif callable(entry):
+				wrapped = _wrap(cls.__name__, name, entry)
+			else:  # properties, class constants, slot descriptors
+				continue
+
+			_originals[(cls, name)] = entry
+			setattr(cls, name, wrapped)
+
+
+def disable():
+	global _depth
+	_depth = max(0, _depth - 1)
+	if _depth:
+		return
+
+	for (cls, name), entry in _originals.items():
+		setattr(cls, name, entry)
+	_originals.clear()
+
+
+def profiled(reset_first=False):
+	# enables profiling for the block, usable as a decorator too
+	return _Profiled(reset_first)
+
+
+class _Profiled:
+	def __init__(self, reset_first=False) -> None:
+		self.reset_first = reset_first
+
+	def __enter__(self):
+		if self.reset_first:
+			reset()
+		enable()
+		return self
+
+	def __exit__(self, *exc):
+		disable()
+
+	def __call__(self, func):
+		@wraps(func)
+		def run(*args, **kwargs):
+			with self:
+				return func(*args, **kwargs)
+		return run
+
+
+def _wrap(owner, name, func):
+	record = _records.setdefault((owner, name), [0, 0.0])
+	key = f'{owner}.{name}'
+	push = _running.append
+	pop = _running.pop
+
+	if name == '__init__':
+		@wraps(func)
+		def wrapper(*args, **kwargs):
+			site = (_running[-1] if _running else None, owner)
+			_created[site] = _created.get(site, 0) + 1
+			push(key)
+			start = perf_counter()
+			try:
+				return func(*args, **kwargs)
+			finally:
+				record[0] += 1
+				record[1] += perf_counter() - start
+				pop()
+
+		return wrapper
+
+	@wraps(func)
+	def wrapper(*args, **kwargs):
+		push(key)
+		start = perf_counter()
+		try:
+			return func(*args, **kwargs)
+		finally:
+			record[0] += 1
+			record[1] += perf_counter() - start
+			pop()
+
+	return wrapper
+
+#endregion
+
+
+#region Reporting
+
+def stats():
+	# {'Vec2d.add': {'calls': ..., 'seconds': ..., 'per_call': ..., 'instances': ...}, ...}
+	# for every method called at least once, the slowest in total first.
+	# instances counts the objects constructed directly inside the method.
+	made = {}
+	for (method, _), count in _created.items():
+		made[method] = made.get(method, 0) + count
+
+	rows = sorted(((f'{owner}.{name}', calls, seconds) for (owner, name), (calls, seconds) in _records.items() if calls), key=lambda row: -row[2])
+	return {key: {'calls': calls, 'seconds': seconds, 'per_call': seconds / calls, 'instances': made.get(key, 0)} for key, calls, seconds in rows}
+
+
+def instances():
+	# constructor calls per class, each one is a new object
+	totals = {}
+	for (_, owner), count in _created.items():
+		totals[owner] = totals.get(owner, 0) + count
+	return totals
+
+
+def instances_by_method():
+	# {'Vec2d.add': {'Vec2d': ...}, OUTSIDE: {...}}: the objects each method
+	# constructed directly, per class, the method making the most first
+	by_method = {}
+	for (method, owner), count in _created.items():
+		by_method.setdefault(method or OUTSIDE, {})[owner] = count
+	return dict(sorted(by_method.items(), key=lambda item: -sum(item[1].values())))
+
+
+def reset():
+	for record in _records.values():
+		record[0] = 0
+		record[1] = 0.0
+	_created.clear()
+
+
+def report(limit=None, file=None):
+	file = sys.stdout if file is None else file
+	rows = list(stats().items())[:limit]
+
+	print(f'{"method":<32} {"calls":>12} {"total ms":>12} {"per call ns":>12}', file=file)
+	for key, row in rows:
+		print(f'{key:<32} {row["calls"]:>12} {row["seconds"] * 1e3:>12.3f} {row["per_call"] * 1e9:>12.1f}', file=file)
+
+	created = instances()
+	if created:
+		print('instances created: ' + ', '.join(f'{owner} {count}' for owner, count in created.items()), file=file)
+		for method, counts in list(instances_by_method().items())[:limit]:
+			print(f'  by {method:<29} ' + ', '.join(f'{owner} {count}' for owner, count in counts.items()), file=file)
+
+
+def export(path):
+	# .csv writes one row per method, anything else is JSON with the
+	# instance counts per class and per method included
+	if path.endswith('.csv'):
+		with open(path, 'w', newline='') as f:
+			writer = csv.writer(f)
+			writer.writerow(['method', 'calls', 'seconds', 'per_call', 'instances'])
+			for key, row in stats().items():
+				writer.writerow([key, row['calls'], row['seconds'], row['per_call'], row['instances']])
+		return
+
+	with open(path, 'w') as f:
+		json.dump({'methods': stats(), 'instances': instances(), 'instances_by_method': instances_by_method()}, f, indent=2)
+
+#endregion
+
+
+def enable_from_environment():
+	# VECTOR_PROFILE=1 reports to stderr at exit, any other value is an export path
+	value = os.environ.get(ENV_VARIABLE, '')
+	if value in ('', '0'):
+		return
+
+	enable()
+	if value == '1':
+		atexit.register(report, file=sys.stderr)
+	else:
+		atexit.register(export, value)
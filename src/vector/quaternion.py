@@ -0,0 +1,487 @@
+from array import array
+from itertools import repeat
+from math import sin, cos, acos, sqrt
+from vector.vector3d import Vec3d, Vec3dArray
+from vector.matrix import Mat3
+
+
+# above this cosine of the angle between two orientations slerp falls back to
+# a normalised lerp, sin(angle) is too small to divide by accurately
+SLERP_LINEAR_THRESHOLD = 0.9995
+
+
+def _unit_axis(axis):
+	x, y, z = Vec3d(axis).as_floats()
+	length = sqrt(x**2 + y**2 + z**2)
+	if length == 0:
+		raise ValueError(f'Invalid axis: {axis}')
+	return x / length, y / length, z / length
+
+
+class Quat:
+	# Rotation quaternion w + xi + yj + zk. Quat() is the identity, and the
+	# product a * b rotates by b first, then by a.
+
+	__slots__ = ('w', 'x', 'y', 'z')
+
+	def __get_wxyz(self, args) -> list[float]:
+		number_of_args = len(args)
+
+		if number_of_args == 0:
+			return [1.0, 0.0, 0.0, 0.0]  # identity
+		elif number_of_args == 4:
+			return list(args)  # w, x, y and z passed in
+		elif number_of_args == 1:  # one argument
+			arg = args[0]
+
+			if isinstance(arg, Quat):
+				return [arg.w, arg.x, arg.y, arg.z]
+			if (type(arg) is list or type(arg) is tuple) and len(arg) == 4:
+				return list(arg)
+
+		raise TypeError(f'Invalid Input: {args}')
+
+	def __init__(self, *args) -> None:
+		if len(args) == 4:  # fast path for Quat(w, x, y, z)
+			self.w, self.x, self.y, self.z = args
+		else:
+			self.w, self.x, self.y, self.z = self.__get_wxyz(args)
+
+
+	#region Creation methods
+
+	@staticmethod
+	def identity():
+		return Quat(1.0, 0.0, 0.0, 0.0)
+
+	@staticmethod
+	def from_axis_angle(axis, angle):
+		# a rotation of angle radians around axis, which does not need to be unit length
+		x, y, z = _unit_axis(axis)
+		s = sin(angle / 2)
+		return Quat(cos(angle / 2), x * s, y * s, z * s)
+
+	@staticmethod
+	def from_euler(x, y, z):
+		# the same rotation as v.rotate_x(x), then v.rotate_y(y), then v.rotate_z(z)
+		cx = cos(x / 2) ; sx = sin(x / 2)
+		cy = cos(y / 2) ; sy = sin(y / 2)
+		cz = cos(z / 2) ; sz = sin(z / 2)
+
+		return Quat(
+			cx * cy * cz + sx * sy * sz,
+			sx * cy * cz - cx * sy * sz,
+			cx * sy * cz + sx * cy * sz,
+			cx * cy * sz - sx * sy * cz,
+		)
+
+	#endregion
+
+
+	#region General manipulation methods
+
+	def as_floats(self):
+		return [self.w, self.x, self.y, self.z]
+
+	def set(self, *args):
+		self.w, self.x, self.y, self.z = self.__get_wxyz(args)
+
+	def copy(self, out=None):
+		if out is None : return Quat(self.w, self.x, self.y, self.z)
+		out.w = self.w ; out.x = self.x ; out.y = self.y ; out.z = self.z
+		return out
+
+	def to_matrix(self):
+		# the rotation as a Mat3, scaled by 2 / |q|^2 so slightly denormalised
+		# quaternions still give a rotation
+		w = self.w ; x = self.x ; y = self.y ; z = self.z
+		n = w**2 + x**2 + y**2 + z**2
+		s = 2 / n if n != 0 else 0.0
+
+		xx = x * x * s ; yy = y * y * s ; zz = z * z * s
+		xy = x * y * s ; xz = x * z * s ; yz = y * z * s
+		wx = w * x * s ; wy = w * y * s ; wz = w * z * s
+
+		return Mat3(
+			1 - (yy + zz), xy - wz, xz + wy,
+			xy + wz, 1 - (xx + zz), yz - wx,
+			xz - wy, yz + wx, 1 - (xx + yy),
+		)
+
+	#endregion
+
+
+	#region Mathematical manipulation methods
+
+	def get_magnitude(self):
+		return sqrt(self.w**2 + self.x**2 + self.y**2 + self.z**2)
+
+	def dot(self, other):
+		return self.w * other.w + self.x * other.x + self.y * other.y + self.z * other.z
+
+	def normalise(self):
+		mag = self.get_magnitude()
+		if mag == 0 : return
+		self.w /= mag ; self.x /= mag ; self.y /= mag ; self.z /= mag
+
+	def normalised(self, out=None):
+		mag = self.get_magnitude()
+		if mag == 0 : return
+		w = self.w / mag ; x = self.x / mag ; y = self.y / mag ; z = self.z / mag
+
+		if out is None : return Quat(w, x, y, z)
+		out.w = w ; out.x = x ; out.y = y ; out.z = z
+		return out
+
+	def conjugate(self, out=None):
+		# the inverse rotation of a unit quaternion
+		if out is None : return Quat(self.w, -self.x, -self.y, -self.z)
+		out.w = self.w ; out.x = -self.x ; out.y = -self.y ; out.z = -self.z
+		return out
+
+	def multiply(self, other, out=None):
+		aw = self.w ; ax = self.x ; ay = self.y ; az = self.z
+		bw = other.w ; bx = other.x ; by = other.y ; bz = other.z
+
+		w = aw * bw - ax * bx - ay * by - az * bz
+		x = aw * bx + ax * bw + ay * bz - az * by
+		y = aw * by - ax * bz + ay * bw + az * bx
+		z = aw * bz + ax * by - ay * bx + az * bw
+
+		if out is None : return Quat(w, x, y, z)
+		out.w = w ; out.x = x ; out.y = y ; out.z = z
+		return out
+
+	def slerp(self, other, t=0.5, out=None):
+		# spherical interpolation along the shorter arc at constant angular speed,
+		# both orientations are assumed to be unit length
+		aw = self.w ; ax = self.x ; ay = self.y ; az = self.z
+		bw = other.w ; bx = other.x ; by = other.y ; bz = other.z
+
+		d = aw * bw + ax * bx + ay * by + az * bz
+		sign = 1.0
+		if d < 0:  # q and -q are the same orientation, take the shorter way round
+			d = -d
+			sign = -1.0
+
+		if d > SLERP_LINEAR_THRESHOLD:  # normalised lerp, |sa a + sb b| folded into the weights
+			sa = 1 - t
+			sb = t * sign
+			mag = sqrt(sa * sa + sb * sb + 2 * sa * t * d)
+			sa /= mag ; sb /= mag
+		else:
+			angle = acos(d)
+			s = sin(angle)
+			sa = sin((1 - t) * angle) / s
+			sb = sin(t * angle) / s * sign
+
+		w = aw * sa + bw * sb ; x = ax * sa + bx * sb ; y = ay * sa + by * sb ; z = az * sa + bz * sb
+
+		if out is None : return Quat(w, x, y, z)
+		out.w = w ; out.x = x ; out.y = y ; out.z = z
+		return out
+
+	#endregion
+
+
+	#region Transform methods
+
+	def transform(self, v, out=None):
+		# v + w * t + q x t with t = 2 (q x v), cheaper than building the matrix
+		# for a single vector; q is assumed to be unit length
+		w = self.w ; x = self.x ; y = self.y ; z = self.z
+		vx = v.x ; vy = v.y ; vz = v.z
+
+		tx = 2 * (y * vz - z * vy)
+		ty = 2 * (z * vx - x * vz)
+		tz = 2 * (x * vy - y * vx)
+
+		rx = vx + w * tx + (y * tz - z * ty)
+		ry = vy + w * ty + (z * tx - x * tz)
+		rz = vz + w * tz + (x * ty - y * tx)
+
+		if out is None : return Vec3d(rx, ry, rz)
+		out.x = rx ; out.y = ry ; out.z = rz
+		return out
+
+	def transform_all(self, vectors):
+		if isinstance(vectors, Vec3dArray):
+			result = vectors.copy()
+			self.itransform_all(result)
+			return result
+
+		return [self.transform(v) for v in vectors]
+
+	def itransform_all(self, vectors):
+		# the nine matrix coefficients are computed once for the whole batch
+		if isinstance(vectors, Vec3dArray):
+			self.to_matrix().itransform_all(vectors)
+			return
+
+		for v in vectors:
+			self.transform(v, out=v)
+
+	#endregion
+
+
+	#region Dunder methods
+
+	def __mul__(self, other):
+		if isinstance(other, Quat):
+			return self.multiply(other)
+		return NotImplemented
+
+	def __matmul__(self, other):
+		if isinstance(other, Quat):
+			return self.multiply(other)
+		return self.transform(other)
+
+	def __getitem__(self, index):
+		return (self.w, self.x, self.y, self.z)[index]
+
+	def __eq__(self, other):
+		return isinstance(other, Quat) and self.as_floats() == other.as_floats()
+
+	def __repr__(self):
+		return f'quaternion W: {self.w}, X: {self.x}, Y: {self.y}, Z: {self.z}'
+
+	#endregion
+
+
+class QuatArray:
+	# One orientation per element, stored as four array('d') columns. The
+	# batch methods compute exactly what the Quat methods compute per element.
+
+	def __get_columns(self, args):
+		if len(args) == 1 and isinstance(args[0], QuatArray):
+			other = args[0]
+			if len(other) != len(self):
+				raise ValueError(f'Length mismatch: {len(other)} != {len(self)}')
+			return other.ws, other.xs, other.ys, other.zs
+
+		w, x, y, z = Quat(*args).as_floats()
+		return repeat(w, len(self)), repeat(x, len(self)), repeat(y, len(self)), repeat(z, len(self))
+
+	def __init__(self, quats=()) -> None:
+		self.ws = array('d')
+		self.xs = array('d')
+		self.ys = array('d')
+		self.zs = array('d')
+		self.extend(quats)
+
+
+	#region Properties
+
+	#---------------------- Columns
+	@property
+	def columns(self):
+		return self.ws, self.xs, self.ys, self.zs
+
+	#endregion
+
+
+	#region Creation methods
+
+	@staticmethod
+	def from_columns(ws, xs, ys, zs):
+		q = QuatArray()
+		q.ws = array('d', ws)
+		q.xs = array('d', xs)
+		q.ys = array('d', ys)
+		q.zs = array('d', zs)
+
+		if not len(q.ws) == len(q.xs) == len(q.ys) == len(q.zs):
+			raise ValueError(f'Length mismatch: {len(q.ws)}, {len(q.xs)}, {len(q.ys)}, {len(q.zs)}')
+
+		return q
+
+	@staticmethod
+	def identity(count):
+		return QuatArray.from_columns(
+			array('d', [1.0]) * count,
+			array('d', bytes(8 * count)),
+			array('d', bytes(8 * count)),
+			array('d', bytes(8 * count)),
+		)
+
+	@staticmethod
+	def from_axis_angles(axis, angles):
+		# one rotation around the same axis per angle, e.g. spinning objects
+		x, y, z = _unit_axis(axis)
+		halves = [a / 2 for a in angles]
+		sines = array('d', map(sin, halves))
+		return QuatArray.from_columns(
+			map(cos, halves),
+			[x * s for s in sines],
+			[y * s for s in sines],
+			[z * s for s in sines],
+		)
+
+	#endregion
+
+
+	#region General manipulation methods
+
+	def append(self, *args):
+		w, x, y, z = Quat(*args).as_floats()
+		self.ws.append(w)
+		self.xs.append(x)
+		self.ys.append(y)
+		self.zs.append(z)
+
+	def extend(self, quats):
+		if isinstance(quats, QuatArray):
+			self.ws.extend(quats.ws)
+			self.xs.extend(quats.xs)
+			self.ys.extend(quats.ys)
+			self.zs.extend(quats.zs)
+			return
+
+		for q in quats:
+			self.append(q)
+
+	def as_list(self):
+		return [Quat(w, x, y, z) for w, x, y, z in zip(self.ws, self.xs, self.ys, self.zs)]
+
+	def copy(self, out=None):
+		return self.__result(self.ws, self.xs, self.ys, self.zs, out)
+
+	#endregion
+
+
+	#region Mathematical manipulation methods
+
+	def __result(self, ws, xs, ys, zs, out):
+		# a new array, or the columns of out overwritten in place
+		if out is None:
+			return QuatArray.from_columns(ws, xs, ys, zs)
+		if len(out) != len(self):
+			raise ValueError(f'Length mismatch: {len(out)} != {len(self)}')
+
+		ws = array('d', ws)  # fully computed before out is touched, out may be an operand
+		xs = array('d', xs)
+		ys = array('d', ys)
+		zs = array('d', zs)
+		out.ws[:] = ws
+		out.xs[:] = xs
+		out.ys[:] = ys
+		out.zs[:] = zs
+		return out
+
+	def get_magnitude(self):
+		return array('d', [sqrt(w**2 + x**2 + y**2 + z**2) for w, x, y, z in zip(self.ws, self.xs, self.ys, self.zs)])
+
+	def normalise(self):
+		self.normalised(out=self)
+
+	def normalised(self, out=None):
+		# zero length elements are left as they are, like Quat.normalise
+		mags = self.get_magnitude()
+		ws = [w / m if m != 0 else w for w, m in zip(self.ws, mags)]
+		xs = [x / m if m != 0 else x for x, m in zip(self.xs, mags)]
+		ys = [y / m if m != 0 else y for y, m in zip(self.ys, mags)]
+		zs = [z / m if m != 0 else z for z, m in zip(self.zs, mags)]
+		return self.__result(ws, xs, ys, zs, out)
+
+	def conjugate(self, out=None):
+		return self.__result(self.ws, [-x for x in self.xs], [-y for y in self.ys], [-z for z in self.zs], out)
+
+	def multiply(self, *args, out=None):
+		# element wise self * other, other is a QuatArray or one Quat for every element
+		ows, oxs, oys, ozs = self.__get_columns(args)
+		ws, xs, ys, zs = [], [], [], []
+
+		for aw, ax, ay, az, bw, bx, by, bz in zip(self.ws, self.xs, self.ys, self.zs, ows, oxs, oys, ozs):
+			ws.append(aw * bw - ax * bx - ay * by - az * bz)
+			xs.append(aw * bx + ax * bw + ay * bz - az * by)
+			ys.append(aw * by - ax * bz + ay * bw + az * bx)
+			zs.append(aw * bz + ax * by - ay * bx + az * bw)
+
+		return self.__result(ws, xs, ys, zs, out)
+
+	def slerp(self, *args, t=0.5, out=None):
+		# element wise Quat.slerp, other is a QuatArray or one Quat for every
+		# element and t one float or one per element
+		ows, oxs, oys, ozs = self.__get_columns(args)
+		ts = repeat(t, len(self)) if type(t) is float or type(t) is int else t
+		ws, xs, ys, zs = [], [], [], []
+
+		for aw, ax, ay, az, bw, bx, by, bz, t in zip(self.ws, self.xs, self.ys, self.zs, ows, oxs, oys, ozs, ts):
+			d = aw * bw + ax * bx + ay * by + az * bz
+			sign = 1.0
+			if d < 0:
+				d = -d
+				sign = -1.0
+
+			if d > SLERP_LINEAR_THRESHOLD:
+				sa = 1 - t
+				sb = t * sign
+				mag = sqrt(sa * sa + sb * sb + 2 * sa * t * d)
+				sa /= mag ; sb /= mag
+			else:
+				angle = acos(d)
+				s = sin(angle)
+				sa = sin((1 - t) * angle) / s
+				sb = sin(t * angle) / s * sign
+
+			ws.append(aw * sa + bw * sb) ; xs.append(ax * sa + bx * sb) ; ys.append(ay * sa + by * sb) ; zs.append(az * sa + bz * sb)
+
+		return self.__result(ws, xs, ys, zs, out)
+
+	#endregion
+
+
+	#region Transform methods
+
+	def transform_all(self, vectors):
+		# vectors[i] rotated by self[i], as a new Vec3dArray
+		result = vectors.copy()
+		self.itransform_all(result)
+		return result
+
+	def itransform_all(self, vectors):
+		if len(vectors) != len(self):
+			raise ValueError(f'Length mismatch: {len(vectors)} != {len(self)}')
+
+		nx, ny, nz = [], [], []
+		for w, x, y, z, vx, vy, vz in zip(self.ws, self.xs, self.ys, self.zs, vectors.xs, vectors.ys, vectors.zs):
+			tx = 2 * (y * vz - z * vy)
+			ty = 2 * (z * vx - x * vz)
+			tz = 2 * (x * vy - y * vx)
+
+			nx.append(vx + w * tx + (y * tz - z * ty))
+			ny.append(vy + w * ty + (z * tx - x * tz))
+			nz.append(vz + w * tz + (x * ty - y * tx))
+
+		vectors.xs[:] = array('d', nx)
+		vectors.ys[:] = array('d', ny)
+		vectors.zs[:] = array('d', nz)
+
+	#endregion
+
+
+	#region Dunder methods
+
+	def __len__(self):
+		return len(self.ws)
+
+	def __iter__(self):
+		for w, x, y, z in zip(self.ws, self.xs, self.ys, self.zs):
+			yield Quat(w, x, y, z)
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return QuatArray.from_columns(self.ws[index], self.xs[index], self.ys[index], self.zs[index])
+		return Quat(self.ws[index], self.xs[index], self.ys[index], self.zs[index])
+
+	def __setitem__(self, index, value):
+		w, x, y, z = Quat(value).as_floats()
+		self.ws[index] = w
+		self.xs[index] = x
+		self.ys[index] = y
+		self.zs[index] = z
+
+	def __repr__(self):
+		return f'QuatArray of {len(self)} quaternions'
+
+	#endregion
@@ -0,0 +1,651 @@
+from array import array
+from heapq import heappop, heappush, heappushpop
+from math import ceil, floor
+from vector.vector2d import Vec2d
+from vector.vector3d import Vec3d, Vec3dArray
+
+
+class SpatialHash:
+	# Uniform grid over 2D positions. Every distance it reports or compares
+	# against is squared, matching Vec2d.dist.
+
+	def __init__(self, cell_size) -> None:
+		if cell_size <= 0:
+			raise ValueError(f'cell_size must be positive, got {cell_size}')
+
+		self.cell_size = cell_size
+		self.cells = {}  # (cx, cy) -> {item: (x, y)}
+		self.__keys = {}  # item -> (cx, cy)
+
+	def __key(self, x, y):
+		return (floor(x / self.cell_size), floor(y / self.cell_size))
+
+
+	#region Creation methods
+
+	@staticmethod
+	def from_positions(positions, cell_size):
+		grid = SpatialHash(cell_size)
+		for i, position in enumerate(positions):
+			grid.insert(i, position)
+		return grid
+
+	#endregion
+
+
+	#region General manipulation methods
+
+	def insert(self, item, *args):
+		if item in self.__keys:
+			raise KeyError(f'{item!r} is already in the grid')
+
+		x, y = Vec2d(*args).as_floats()
+		key = self.__key(x, y)
+
+		self.cells.setdefault(key, {})[item] = (x, y)
+		self.__keys[item] = key
+
+	def move(self, item, *args):
+		x, y = Vec2d(*args).as_floats()
+		old_key = self.__keys[item]
+		new_key = self.__key(x, y)
+
+		if old_key == new_key:
+			self.cells[old_key][item] = (x, y)
+			return
+
+		self.__discard(item, old_key)
+		self.cells.setdefault(new_key, {})[item] = (x, y)
+		self.__keys[item] = new_key
+
+	def remove(self, item):
+		self.__discard(item, self.__keys.pop(item))
+
+	def __discard(self, item, key):
+		cell = self.cells[key]
+		del cell[item]
+		if not cell:
+			del self.cells[key]
+
+	def position(self, item):
+		return Vec2d(self.cells[self.__keys[item]][item])
+
+	def clear(self):
+		self.cells.clear()
+		self.__keys.clear()
+
+	#endregion
+
+
+	#region Query methods
+
+	def query_radius(self, position, radius):
+		x, y = Vec2d(position).as_floats()
+		radius_sqr = radius**2
+		found = []
+
+		for cell in self.__cells_in(x - radius, y - radius, x + radius, y + radius):
+			for item, (px, py) in cell.items():
+				if (x - px)**2 + (y - py)**2 <= radius_sqr:
+					found.append(item)
+
+		return found
+
+	def query_box(self, lower, upper):
+		min_x, min_y = Vec2d(lower).as_floats()
+		max_x, max_y = Vec2d(upper).as_floats()
+		found = []
+
+		for cell in self.__cells_in(min_x, min_y, max_x, max_y):
+			for item, (px, py) in cell.items():
+				if min_x <= px <= max_x and min_y <= py <= max_y:
+					found.append(item)
+
+		return found
+
+	def nearest(self, position, k=1):
+		x, y = Vec2d(position).as_floats()
+		k = min(k, len(self))
+		if k <= 0:
+			return []
+
+		cx, cy = self.__key(x, y)
+		best = []  # heap of (-dist, -order, item), worst candidate on top
+		order = 0
+
+		# walk outward ring by ring; anything beyond ring r is at least
+		# (r * cell_size) away, so stop once the k-th best is closer than that
+		ring = 0
+		while True:
+			if 8 * ring > len(self.cells):  # rings are mostly empty now, scan the rest directly
+				cells = [cell for (kx, ky), cell in self.cells.items() if max(abs(kx - cx), abs(ky - cy)) >= ring]
+				last = True
+			else:
+				cells = [self.cells[key] for key in self.__ring(cx, cy, ring) if key in self.cells]
+				last = False
+
+			for cell in cells:
+				for item, (px, py) in cell.items():
+					entry = (-((x - px)**2 + (y - py)**2), -order, item)
+					order += 1
+					if len(best) < k:
+						heappush(best, entry)
+					elif entry[:2] > best[0][:2]:
+						heappushpop(best, entry)
+
+			if last or (len(best) == k and -best[0][0] <= (ring * self.cell_size)**2):
+				break
+			ring += 1
+
+		return [(item, -dist) for dist, _, item in sorted(best, key=lambda e: e[:2], reverse=True)]
+
+	def pairs_within(self, radius):
+		radius_sqr = radius**2
+		reach = ceil(radius / self.cell_size)
+		pairs = []
+
+		for (cx, cy), cell in self.cells.items():
+			entries = list(cell.items())
+
+			for i, (a, (ax, ay)) in enumerate(entries):
+				for b, (bx, by) in entries[i + 1:]:
+					if (ax - bx)**2 + (ay - by)**2 <= radius_sqr:
+						pairs.append((a, b))
+
+			# only look at neighbours that sort after this cell so every
+			# pair of cells is visited once
+			for dx in range(-reach, reach + 1):
+				for dy in range(-reach, reach + 1):
+					key = (cx + dx, cy + dy)
+					if key <= (cx, cy):
+						continue
+
+					other = self.cells.get(key)
+					if other is None:
+						continue
+
+					for a, (ax, ay) in entries:
+						for b, (bx, by) in other.items():
+							if (ax - bx)**2 + (ay - by)**2 <= radius_sqr:
+								pairs.append((a, b))
+
+		return pairs
+
+	def __cells_in(self, min_x, min_y, max_x, max_y):
+		lx, ly = self.__key(min_x, min_y)
+		hx, hy = self.__key(max_x, max_y)
+
+		if (hx - lx + 1) * (hy - ly + 1) > len(self.cells):  # sparse grid, scan what exists
+			return [cell for (cx, cy), cell in self.cells.items() if lx <= cx <= hx and ly <= cy <= hy]
+
+		cells = []
+		for cx in range(lx, hx + 1):
+			for cy in range(ly, hy + 1):
+				cell = self.cells.get((cx, cy))
+				if cell is not None:
+					cells.append(cell)
+		return cells
+
+	@staticmethod
+	def __ring(cx, cy, ring):
+		if ring == 0:
+			return [(cx, cy)]
+
+		keys = []
+		for d in range(-ring, ring + 1):
+			keys.append((cx + d, cy - ring))
+			keys.append((cx + d, cy + ring))
+		for d in range(-ring + 1, ring):
+			keys.append((cx - ring, cy + d))
+			keys.append((cx + ring, cy + d))
+		return keys
+
+	#endregion
+
+
+	#region Dunder methods
+
+	def __len__(self):
+		return len(self.__keys)
+
+	def __contains__(self, item):
+		return item in self.__keys
+
+	def __iter__(self):
+		return iter(self.__keys)
+
+	def __repr__(self):
+		return f'SpatialHash of {len(self)} items in {len(self.cells)} cells'
+
+	#endregion
+
+
+def _point_columns(points):
+	if isinstance(points, Vec3dArray):
+		return points.columns
+
+	xs, ys, zs = array('d'), array('d'), array('d')
+	for p in points:
+		x, y, z = Vec3d(p).as_floats()
+		xs.append(x) ; ys.append(y) ; zs.append(z)
+	return xs, ys, zs
+
+
+def _push_best(best, k, dist, order, item):
+	entry = (-dist, -order, item)
+	if len(best) < k:
+		heappush(best, entry)
+	elif entry[:2] > best[0][:2]:
+		heappushpop(best, entry)
+
+
+def _sorted_best(best):
+	return [(item, -dist) for dist, _, item in sorted(best, key=lambda e: e[:2], reverse=True)]
+
+
+class KDTree:
+	# Static, bulk-loaded tree over 3D points. The tree is implicit: points
+	# are stored in tree order in flat columns and the node covering
+	# [lo, hi) splits at (lo + hi) // 2 on axis depth % 3. Queries return
+	# indices into the sequence the tree was built from, and distances are
+	# squared, matching Vec3d.dist.
+
+	def __init__(self, points) -> None:
+		xs, ys, zs = _point_columns(points)
+		n = len(xs)
+		columns = (xs, ys, zs)
+
+		self.index = array('q', bytes(8 * n))
+
+		# sort once per axis, then split those orders in O(n) per level
+		lists = [sorted(range(n), key=column.__getitem__) for column in columns]
+		is_left = bytearray(n)
+		stack = [(0, n, 0, lists)]
+
+		while stack:
+			lo, hi, depth, lists = stack.pop()
+			if hi <= lo:
+				continue
+
+			axis = depth % 3
+			mid = (lo + hi) // 2
+			by_axis = lists[axis]
+			median = by_axis[mid - lo]
+			self.index[mid] = median
+
+			left = by_axis[:mid - lo]
+			for i in left:
+				is_left[i] = 1
+
+			left_lists, right_lists = [], []
+			for a in range(3):
+				if a == axis:
+					left_lists.append(left)
+					right_lists.append(by_axis[mid - lo + 1:])
+				else:
+					left_lists.append([i for i in lists[a] if is_left[i]])
+					right_lists.append([i for i in lists[a] if not is_left[i] and i != median])
+
+			for i in left:
+				is_left[i] = 0
+
+			stack.append((lo, mid, depth + 1, left_lists))
+			stack.append((mid + 1, hi, depth + 1, right_lists))
+
+		self.xs = array('d', [xs[i] for i in self.index])
+		self.ys = array('d', [ys[i] for i in self.index])
+		self.zs = array('d', [zs[i] for i in self.index])
+
+
+	#region Query methods
+
+	def nearest(self, position, k=1):
+		x, y, z = Vec3d(position).as_floats()
+		query = (x, y, z)
+		columns = (self.xs, self.ys, self.zs)
+		k = min(k, len(self))
+		if k <= 0:
+			return []
+
+		best = []
+		order = 0
+
+		stack = [(0, len(self), 0, 0.0)]  # lo, hi, depth, squared distance to the region
+		while stack:
+			lo, hi, depth, bound = stack.pop()
+			if hi <= lo or (len(best) == k and bound > -best[0][0]):
+				continue
+
+			mid = (lo + hi) // 2
+			dist = (self.xs[mid] - x)**2 + (self.ys[mid] - y)**2 + (self.zs[mid] - z)**2
+			_push_best(best, k, dist, order, self.index[mid])
+			order += 1
+
+			axis = depth % 3
+			diff = query[axis] - columns[axis][mid]
+			if diff < 0:
+				near, far = (lo, mid), (mid + 1, hi)
+			else:
+				near, far = (mid + 1, hi), (lo, mid)
+
+			stack.append((far[0], far[1], depth + 1, max(bound, diff**2)))
+			stack.append((near[0], near[1], depth + 1, bound))
+
+		return _sorted_best(best)
+
+	def query_radius(self, position, radius):
+		x, y, z = Vec3d(position).as_floats()
+		query = (x, y, z)
+		columns = (self.xs, self.ys, self.zs)
+		radius_sqr = radius**2
+		found = []
+
+		stack = [(0, len(self), 0)]
+		while stack:
+			lo, hi, depth = stack.pop()
+			if hi <= lo:
+				continue
+
+			mid = (lo + hi) // 2
+			if (self.xs[mid] - x)**2 + (self.ys[mid] - y)**2 + (self.zs[mid] - z)**2 <= radius_sqr:
+				found.append(self.index[mid])
+
+			axis = depth % 3
+			split = columns[axis][mid]
+			if query[axis] - radius <= split:
+				stack.append((lo, mid, depth + 1))
+			if query[axis] + radius >= split:
+				stack.append((mid + 1, hi, depth + 1))
+
+		return found
+
+	def query_box(self, lower, upper):
+		lower = Vec3d(lower).as_floats()
+		upper = Vec3d(upper).as_floats()
+		columns = (self.xs, self.ys, self.zs)
+		found = []
+
+		stack = [(0, len(self), 0)]
+		while stack:
+			lo, hi, depth = stack.pop()
+			if hi <= lo:
+				continue
+
+			mid = (lo + hi) // 2
+			if all(lower[a] <= columns[a][mid] <= upper[a] for a in range(3)):
+				found.append(self.index[mid])
+
+			axis = depth % 3
+			split = columns[axis][mid]
+			if lower[axis] <= split:
+				stack.append((lo, mid, depth + 1))
+			if upper[axis] >= split:
+				stack.append((mid + 1, hi, depth + 1))
+
+		return found
+
+	#endregion
+
+
+	#region Dunder methods
+
+	def __len__(self):
+		return len(self.index)
+
+	def __repr__(self):
+		return f'KDTree of {len(self)} points'
+
+	#endregion
+
+
+class Octree:
+	# Dynamic octree over a fixed cubic region. Nodes and points live in
+	# flat arrays: a node is either a leaf holding a linked list of point
+	# ids or the parent of 8 consecutive child nodes. Inserting returns an
+	# integer id used by move, remove and the queries.
+
+	def __init__(self, center, half_size, capacity=8, max_depth=16) -> None:
+		cx, cy, cz = Vec3d(center).as_floats()
+
+		self.capacity = capacity
+		self.max_depth = max_depth
+
+		# nodes
+		self.__cx = array('d', [cx])
+		self.__cy = array('d', [cy])
+		self.__cz = array('d', [cz])
+		self.__half = array('d', [half_size])
+		self.__depth = array('B', [0])
+		self.__child = array('q', [-1])  # first of 8 children, -1 for a leaf
+		self.__head = array('q', [-1])  # first point in a leaf
+		self.__count = array('q', [0])  # points in a leaf
+
+		# points
+		self.xs = array('d')
+		self.ys = array('d')
+		self.zs = array('d')
+		self.__next = array('q')
+		self.__leaf = array('q')  # -1 once removed
+		self.__free = []
+		self.__size = 0
+
+	def __child_of(self, node, x, y, z):
+		return self.__child[node] + (x >= self.__cx[node]) + 2 * (y >= self.__cy[node]) + 4 * (z >= self.__cz[node])
+
+	def __find_leaf(self, x, y, z):
+		node = 0
+		while self.__child[node] != -1:
+			node = self.__child_of(node, x, y, z)
+		return node
+
+	def __contains_point(self, node, x, y, z):
+		h = self.__half[node]
+		return abs(x - self.__cx[node]) <= h and abs(y - self.__cy[node]) <= h and abs(z - self.__cz[node]) <= h
+
+	def __link(self, node, point):
+		self.__next[point] = self.__head[node]
+		self.__head[node] = point
+		self.__leaf[point] = node
+		self.__count[node] += 1
+
+		if self.__count[node] > self.capacity and self.__depth[node] < self.max_depth:
+			self.__split(node)
+
+	def __unlink(self, point):
+		node = self.__leaf[point]
+		previous = -1
+		current = self.__head[node]
+
+		while current != point:
+			previous = current
+			current = self.__next[current]
+
+		if previous == -1:
+			self.__head[node] = self.__next[point]
+		else:
+			self.__next[previous] = self.__next[point]
+
+		self.__count[node] -= 1
+		self.__leaf[point] = -1
+
+	def __split(self, node):
+		first = len(self.__half)
+		quarter = self.__half[node] / 2
+
+		for i in range(8):
+			self.__cx.append(self.__cx[node] + (quarter if i & 1 else -quarter))
+			self.__cy.append(self.__cy[node] + (quarter if i & 2 else -quarter))
+			self.__cz.append(self.__cz[node] + (quarter if i & 4 else -quarter))
+			self.__half.append(quarter)
+			self.__depth.append(self.__depth[node] + 1)
+			self.__child.append(-1)
+			self.__head.append(-1)
+			self.__count.append(0)
+
+		self.__child[node] = first
+
+		point = self.__head[node]
+		self.__head[node] = -1
+		self.__count[node] = 0
+
+		while point != -1:
+			following = self.__next[point]
+			self.__link(self.__child_of(node, self.xs[point], self.ys[point], self.zs[point]), point)
+			point = following
+
+	def __check(self, point):
+		# ids are only valid while their point is live, freed ids included
+		if not 0 <= point < len(self.__leaf) or self.__leaf[point] == -1:
+			raise KeyError(point)
+
+
+	#region General manipulation methods
+
+	def insert(self, *args):
+		x, y, z = Vec3d(*args).as_floats()
+		if not self.__contains_point(0, x, y, z):
+			raise ValueError(f'Point {(x, y, z)} is outside the octree bounds')
+
+		if self.__free:
+			point = self.__free.pop()
+			self.xs[point] = x ; self.ys[point] = y ; self.zs[point] = z
+		else:
+			point = len(self.xs)
+			self.xs.append(x) ; self.ys.append(y) ; self.zs.append(z)
+			self.__next.append(-1)
+			self.__leaf.append(-1)
+
+		self.__link(self.__find_leaf(x, y, z), point)
+		self.__size += 1
+		return point
+
+	def insert_all(self, points):
+		xs, ys, zs = _point_columns(points)
+		return [self.insert(x, y, z) for x, y, z in zip(xs, ys, zs)]
+
+	def move(self, point, *args):
+		x, y, z = Vec3d(*args).as_floats()
+		self.__check(point)
+		if not self.__contains_point(0, x, y, z):
+			raise ValueError(f'Point {(x, y, z)} is outside the octree bounds')
+
+		leaf = self.__leaf[point]
+		self.xs[point] = x ; self.ys[point] = y ; self.zs[point] = z
+		if self.__contains_point(leaf, x, y, z):
+			return
+
+		self.__unlink(point)
+		self.__link(self.__find_leaf(x, y, z), point)
+
+	def remove(self, point):
+		self.__check(point)
+
+		self.__unlink(point)
+		self.__free.append(point)
+		self.__size -= 1
+
+	def position(self, point):
+		self.__check(point)
+		return Vec3d(self.xs[point], self.ys[point], self.zs[point])
+
+	#endregion
+
+
+	#region Query methods
+
+	def __box_dist(self, node, x, y, z):
+		h = self.__half[node]
+		dx = max(abs(x - self.__cx[node]) - h, 0)
+		dy = max(abs(y - self.__cy[node]) - h, 0)
+		dz = max(abs(z - self.__cz[node]) - h, 0)
+		return dx**2 + dy**2 + dz**2
+
+	def __points(self, node):
+		point = self.__head[node]
+		while point != -1:
+			yield point
+			point = self.__next[point]
+
+	def query_radius(self, position, radius):
+		x, y, z = Vec3d(position).as_floats()
+		radius_sqr = radius**2
+		found = []
+
+		stack = [0]
+		while stack:
+			node = stack.pop()
+			if self.__box_dist(node, x, y, z) > radius_sqr:
+				continue
+
+			if self.__child[node] != -1:
+				stack.extend(range(self.__child[node], self.__child[node] + 8))
+				continue
+
+			for point in self.__points(node):
+				if (self.xs[point] - x)**2 + (self.ys[point] - y)**2 + (self.zs[point] - z)**2 <= radius_sqr:
+					found.append(point)
+
+		return found
+
+	def query_box(self, lower, upper):
+		lx, ly, lz = Vec3d(lower).as_floats()
+		ux, uy, uz = Vec3d(upper).as_floats()
+		found = []
+
+		stack = [0]
+		while stack:
+			node = stack.pop()
+			h = self.__half[node]
+			cx, cy, cz = self.__cx[node], self.__cy[node], self.__cz[node]
+			if cx + h < lx or cx - h > ux or cy + h < ly or cy - h > uy or cz + h < lz or cz - h > uz:
+				continue
+
+			if self.__child[node] != -1:
+				stack.extend(range(self.__child[node], self.__child[node] + 8))
+				continue
+
+			for point in self.__points(node):
+				if lx <= self.xs[point] <= ux and ly <= self.ys[point] <= uy and lz <= self.zs[point] <= uz:
+					found.append(point)
+
+		return found
+
+	def nearest(self, position, k=1):
+		x, y, z = Vec3d(position).as_floats()
+		k = min(k, len(self))
+		if k <= 0:
+			return []
+
+		best = []
+		order = 0
+		nodes = [(0.0, 0)]  # closest node first
+
+		while nodes:
+			bound, node = heappop(nodes)
+			if len(best) == k and bound > -best[0][0]:
+				break
+
+			if self.__child[node] != -1:
+				for child in range(self.__child[node], self.__child[node] + 8):
+					heappush(nodes, (self.__box_dist(child, x, y, z), child))
+				continue
+
+			for point in self.__points(node):
+				dist = (self.xs[point] - x)**2 + (self.ys[point] - y)**2 + (self.zs[point] - z)**2
+				_push_best(best, k, dist, order, point)
+				order += 1
+
+		return _sorted_best(best)
+
+	#endregion
+
+
+	#region Dunder methods
+
+	def __len__(self):
+		return self.__size
+
+	def __repr__(self):
+		return f'Octree of {len(self)} points in {len(self.__half)} nodes'
+
+	#endregion
@@ -0,0 +1,268 @@
+import mmap
+import struct
+import sys
+from array import array
+from vector.vector2d import Vec2d, Vec2dArray
+from vector.vector3d import Vec3d, Vec3dArray
+from vector.color import Color, ColorBuffer, _clamp_byte
+
+
+# File layout, all integers and components little-endian:
+#
+#   offset  size  field
+#   0       4     magic b'VECB'
+#   4       1     format version, currently 1
+#   5       1     kind: 0 = Vec2d, 1 = Vec3d, 2 = Color
+#   6       1     component type as an array typecode: 'd' float64, 'f' float32, 'B' uint8
+#   7       1     components per record (2 for Vec2d, 3 for Vec3d and Color)
+#   8       8     record count, uint64
+#   16      ...   records, components stored one after another: x y [z] or r g b
+#
+# The header is 16 bytes so float64 records stay 8-byte aligned.
+
+MAGIC = b'VECB'
+VERSION = 1
+HEADER = struct.Struct('<4sBBBBQ')
+
+KIND_VEC2D = 0
+KIND_VEC3D = 1
+KIND_COLOR = 2
+
+_KINDS = {
+	KIND_VEC2D: (Vec2d, Vec2dArray, 2),
+	KIND_VEC3D: (Vec3d, Vec3dArray, 3),
+	KIND_COLOR: (Color, ColorBuffer, 3),
+}
+_TYPECODES = ('d', 'f', 'B')
+_CHUNK = 1 << 16  # records encoded per write
+
+
+def _kind_of(items):
+	if isinstance(items, (Vec2d, Vec2dArray)):
+		return KIND_VEC2D
+	if isinstance(items, (Vec3d, Vec3dArray)):
+		return KIND_VEC3D
+	if isinstance(items, (Color, ColorBuffer)):
+		return KIND_COLOR
+	raise TypeError(f'Cannot store {type(items).__name__}')
+
+
+def _to_little_endian(values):
+	if sys.byteorder == 'big':
+		values.byteswap()
+	return values
+
+
+def _encode_chunks(items, kind, typecode):
+	# yields array chunks of interleaved components, raising TypeError for
+	# an item of another kind than the file's
+	if isinstance(items, (Vec2dArray, Vec3dArray)):
+		columns = items.columns
+		for start in range(0, len(items), _CHUNK):
+			parts = [column[start:start + _CHUNK] for column in columns]
+			values = array(typecode, bytes(array(typecode).itemsize * len(parts[0]) * len(parts)))
+			for i, part in enumerate(parts):
+				values[i::len(parts)] = array(typecode, part)
+			yield values
+		return
+
+	if isinstance(items, ColorBuffer):
+		for start in range(0, len(items.data), 3 * _CHUNK):
+			chunk = items.data[start:start + 3 * _CHUNK]
+			# array() reads bytes as raw machine values, so widen through a list
+			yield array(typecode, chunk if typecode == 'B' else list(chunk))
+		return
+
+	single = _KINDS[kind][0]
+	values = array(typecode)
+	for item in items:
+		if type(item) is not single:
+			if _kind_of(item) != kind:
+				raise TypeError(f'Cannot store {type(item).__name__} in a file of {single.__name__}')
+
+			if isinstance(item, (Vec2dArray, Vec3dArray, ColorBuffer)):  # a stream of batches
+				if values:
+					yield values
+					values = array(typecode)
+				yield from _encode_chunks(item, kind, typecode)
+				continue
+
+		values.extend(item.get() if kind == KIND_COLOR else item.as_floats())
+		if len(values) >= 3 * _CHUNK:
+			yield values
+			values = array(typecode)
+	if values:
+		yield values
+
+
+def _chain_first(first, rest):
+	yield first
+	yield from rest
+
+
+def _parse_header(raw, name):
+	# returns (kind, typecode, components, count) or raises ValueError
+	if len(raw) < HEADER.size:
+		raise ValueError(f'{name} is not a vector file')
+
+	magic, version, kind, typecode, components, count = HEADER.unpack_from(raw, 0)
+	if magic != MAGIC:
+		raise ValueError(f'{name} is not a vector file')
+	if version != VERSION:
+		raise ValueError(f'Unsupported vector file version {version}')
+	if kind not in _KINDS or chr(typecode) not in _TYPECODES:
+		raise ValueError(f'{name} has an unknown kind {kind} or component type {typecode}')
+
+	return kind, chr(typecode), components, count
+
+
+def _decode_batch(kind, typecode, components, raw):
+	# turns packed records into a Vec2dArray, Vec3dArray or ColorBuffer
+	values = array(typecode, raw)
+	if sys.byteorder == 'big':
+		values.byteswap()
+
+	if kind == KIND_COLOR:
+		data = values.tobytes() if typecode == 'B' else bytes(map(_clamp_byte, values))
+		return ColorBuffer.from_bytes(data, len(values) // 3)
+
+	return _KINDS[kind][1].from_columns(*(values[i::components] for i in range(components)))
+
+
+def save(path, items, typecode=None):
+	# Writes a sequence of Vec2d/Vec3d/Color (or a Vec2dArray, Vec3dArray or
+	# ColorBuffer) to a path or an open binary file and returns the number
+	# of records written. Plain iterables are consumed once, so generators
+	# work too.
+	if not isinstance(items, (Vec2dArray, Vec3dArray, ColorBuffer)):
+		items = iter(items)
+		first = next(items, None)
+		if first is None:
+			raise ValueError('Cannot infer the kind of an empty sequence')
+		kind = _kind_of(first)
+		items = _chain_first(first, items)
+	else:
+		kind = _kind_of(items)
+
+	components = _KINDS[kind][2]
+	if typecode is None:
+		typecode = 'B' if kind == KIND_COLOR else 'd'
+	if typecode not in _TYPECODES:
+		raise ValueError(f'Unsupported component type {typecode!r}, expected one of {_TYPECODES}')
+	if typecode == 'B' and kind != KIND_COLOR:
+		raise ValueError(f"Component type 'B' only stores colors, not {_KINDS[kind][0].__name__}")
+
+	if hasattr(path, 'write'):  # an open binary file, written from its current position and left open
+		return _write(path, items, kind, typecode, components)
+
+	with open(path, 'wb') as f:
+		return _write(f, items, kind, typecode, components)
+
+
+def _write(f, items, kind, typecode, components):
+	# the record count is only known at the end, so the header is written
+	# twice and the file has to be seekable
+	start = f.tell()
+	f.write(HEADER.pack(MAGIC, VERSION, kind, ord(typecode), components, 0))
+
+	count = 0
+	for values in _encode_chunks(items, kind, typecode):
+		count += len(values) // components
+		_to_little_endian(values).tofile(f)
+
+	end = f.tell()
+	f.seek(start)
+	f.write(HEADER.pack(MAGIC, VERSION, kind, ord(typecode), components, count))
+	f.seek(end)
+	return count
+
+
+def load(path, use_mmap=True):
+	return VectorFile(path, use_mmap)
+
+
+class VectorFile:
+	# Read-only, lazily decoded view of a file written by save(). With
+	# use_mmap the file is memory-mapped, so opening is instant and only the
+	# pages that are actually indexed get read from disk.
+
+	def __init__(self, path, use_mmap=True) -> None:
+		self.__file = open(path, 'rb')
+		self.__data = b''
+		try:
+			if use_mmap:
+				self.__data = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+			else:
+				self.__data = self.__file.read()
+
+			kind, typecode, components, count = _parse_header(self.__data, path)
+
+			self.kind = kind
+			self.typecode = typecode
+			self.components = components
+			self.count = count
+
+			self.__type = _KINDS[kind][0]
+			self.__record = struct.Struct('<' + self.typecode * components)
+
+			expected = HEADER.size + count * self.__record.size
+			if len(self.__data) < expected:
+				raise ValueError(f'{path} is truncated, expected {expected} bytes, got {len(self.__data)}')
+		except BaseException:
+			self.close()  # a bad header or a short file must not leak the handle
+			raise
+
+
+	#region General manipulation methods
+
+	def read(self, start=0, stop=None):
+		# decodes a whole range of records into a Vec2dArray, Vec3dArray or ColorBuffer
+		start, stop, _ = slice(start, stop).indices(self.count)
+		stop = max(start, stop)
+
+		offset = HEADER.size + start * self.__record.size
+		raw = self.__data[offset:HEADER.size + stop * self.__record.size]
+		return _decode_batch(self.kind, self.typecode, self.components, raw)
+
+	def close(self):
+		if isinstance(self.__data, mmap.mmap):
+			self.__data.close()
+		self.__file.close()
+
+	#endregion
+
+
+	#region Dunder methods
+
+	def __len__(self):
+		return self.count
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return [self[i] for i in range(*index.indices(self.count))]
+
+		if index < 0:
+			index += self.count
+		if not 0 <= index < self.count:
+			raise IndexError('VectorFile index out of range')
+
+		return self.__type(*self.__record.unpack_from(self.__data, HEADER.size + index * self.__record.size))
+
+	def __iter__(self):
+		record = self.__record
+		for start in range(0, self.count, _CHUNK):
+			stop = min(start + _CHUNK, self.count)
+			chunk = self.__data[HEADER.size + start * record.size:HEADER.size + stop * record.size]
+			for values in record.iter_unpack(chunk):
+				yield self.__type(*values)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc):
+		self.close()
+
+	def __repr__(self):
+		return f'VectorFile of {self.count} {self.__type.__name__} records'
+
+	#endregion
@@ -0,0 +1,274 @@
+import csv
+import struct
+from array import array
+from contextlib import nullcontext
+from vector.vector2d import Vec2d, Vec2dArray
+from vector.vector3d import Vec3d, Vec3dArray
+from vector.color import Color, ColorBuffer, _clamp_byte
+from vector import storage
+
+
+# Everything here is a generator: items are read, transformed and written
+# one block at a time, so memory stays bounded by the batch size rather
+# than by the size of the file.
+
+DEFAULT_BATCH_SIZE = 1 << 14
+
+_BATCH_TYPES = {Vec2d: Vec2dArray, Vec3d: Vec3dArray, Color: ColorBuffer}
+_HEADERS = {Vec2d: ('x', 'y'), Vec3d: ('x', 'y', 'z'), Color: ('r', 'g', 'b')}
+
+
+def _open(source, mode):
+	# paths are opened (and closed) here, file objects are used as they are
+	if hasattr(source, 'read') or hasattr(source, 'write'):
+		return nullcontext(source)
+	return open(source, mode, newline=None if 'b' in mode else '')
+
+
+def _item_type(item):
+	for kind in _BATCH_TYPES:
+		if isinstance(item, (kind, _BATCH_TYPES[kind])):
+			return kind
+	raise TypeError(f'Cannot stream {type(item).__name__}')
+
+
+def _batch_from_columns(kind, columns):
+	if kind is Color:
+		r, g, b = (map(_clamp_byte, map(float, c)) for c in columns)
+		data = bytes(channel for pixel in zip(r, g, b) for channel in pixel)
+		return ColorBuffer.from_bytes(data, len(data) // 3)
+
+	return _BATCH_TYPES[kind].from_columns(*(array('d', map(float, c)) for c in columns))
+
+
+def _batch_from_items(items):
+	if isinstance(items[0], Color):
+		return ColorBuffer.from_colors(items)
+	return _BATCH_TYPES[_item_type(items[0])](items)
+
+
+def _is_batch(item):
+	return isinstance(item, (Vec2dArray, Vec3dArray, ColorBuffer))
+
+
+#region Readers
+
+def read_csv(source, kind=None, delimiter=',', batch_size=None):
+	# Yields Vec2d/Vec3d/Color from a path or text file, one row per item.
+	# Without a kind, rows of 2 values give Vec2d and rows of 3 give Vec3d;
+	# pass kind=Color for r,g,b rows. A header row (any row whose first
+	# field is not a number) is skipped. With batch_size, Vec2dArray,
+	# Vec3dArray or ColorBuffer blocks of up to batch_size items are
+	# yielded instead.
+	with _open(source, 'r') as f:
+		rows = csv.reader(f, delimiter=delimiter)
+
+		for first in rows:
+			if not first:
+				continue
+			try:
+				float(first[0])
+			except ValueError:
+				continue  # header
+			break
+		else:
+			return
+
+		if kind is None:
+			if len(first) not in (2, 3):
+				raise ValueError(f'Cannot infer a vector type from {len(first)} columns, pass kind=')
+			kind = Vec2d if len(first) == 2 else Vec3d
+		width = len(_HEADERS[kind])
+
+		if batch_size is None:
+			yield kind(*map(float, first[:width]))
+			for row in rows:
+				if row:
+					yield kind(*map(float, row[:width]))
+			return
+
+		block = [first]
+		for row in rows:
+			if row:
+				block.append(row)
+				if len(block) == batch_size:
+					yield _batch_from_columns(kind, list(zip(*block))[:width])
+					block = []
+		if block:
+			yield _batch_from_columns(kind, list(zip(*block))[:width])
+
+
+def read_binary(source, batch_size=None):
+	# Yields the items of a file written by storage.save (or write_binary)
+	# from a path or binary file, reading sequentially in fixed blocks, so
+	# it also works on pipes and sockets. With batch_size, batch containers
+	# of up to batch_size items are yielded instead.
+	with _open(source, 'rb') as f:
+		kind, typecode, components, count = storage._parse_header(f.read(storage.HEADER.size), source)
+		item_type = storage._KINDS[kind][0]
+		record = struct.Struct('<' + typecode * components)
+		block = batch_size or DEFAULT_BATCH_SIZE
+
+		for start in range(0, count, block):
+			wanted = min(block, count - start)
+			raw = f.read(wanted * record.size)
+			if len(raw) != wanted * record.size:
+				raise ValueError(f'{source} is truncated, expected {count} records, got {start + len(raw) // record.size}')
+
+			if batch_size is None:
+				for values in record.iter_unpack(raw):
+					yield item_type(*values)
+			else:
+				yield storage._decode_batch(kind, typecode, components, raw)
+
+#endregion
+
+
+#region Stages
+
+def apply(items, op, *args, **kwargs):
+	# Runs op on every item. op is either a callable or the name of a method
+	# shared by the vector and batch types, e.g. 'normalised', 'lerp' or
+	# 'clamp', so batches take their columnar path. In-place methods that
+	# return None yield the (modified) item itself.
+	for item in items:
+		if isinstance(op, str):
+			result = getattr(item, op)(*args, **kwargs)
+		else:
+			result = op(item, *args, **kwargs)
+		yield item if result is None else result
+
+
+def keep(items, predicate):
+	# Yields the items for which predicate is true. Batches are filtered
+	# element by element and yielded as (possibly empty) smaller batches.
+	for item in items:
+		if not _is_batch(item):
+			if predicate(item):
+				yield item
+			continue
+
+		kind = _item_type(item)
+		kept = [v.get() if kind is Color else v.as_floats() for v in item if predicate(v)]
+		yield _batch_from_columns(kind, list(zip(*kept)) if kept else [()] * len(_HEADERS[kind]))
+
+
+def batched(items, batch_size=DEFAULT_BATCH_SIZE):
+	# Groups single items into batch containers of up to batch_size items
+	block = []
+	for item in items:
+		block.append(item)
+		if len(block) == batch_size:
+			yield _batch_from_items(block)
+			block = []
+	if block:
+		yield _batch_from_items(block)
+
+
+def unbatched(items):
+	# Flattens batch containers back into independent Vec2d/Vec3d/Color
+	for item in items:
+		if isinstance(item, (Vec2dArray, Vec3dArray)):
+			yield from item.as_list()
+		elif isinstance(item, ColorBuffer):
+			yield from item
+		else:
+			yield item
+
+#endregion
+
+
+#region Writers
+
+def write_csv(target, items, delimiter=',', header=True):
+	# Writes single items or batches to a path or text file and returns the
+	# number of items written
+	count = 0
+	with _open(target, 'w') as f:
+		writer = csv.writer(f, delimiter=delimiter, lineterminator='\n')
+
+		for item in items:
+			if header:
+				writer.writerow(_HEADERS[_item_type(item)])
+				header = False
+
+			if isinstance(item, (Vec2dArray, Vec3dArray)):
+				writer.writerows(zip(*item.columns))
+				count += len(item)
+			elif isinstance(item, ColorBuffer):
+				data = item.data
+				writer.writerows(zip(data[0::3], data[1::3], data[2::3]))
+				count += len(item)
+			else:
+				writer.writerow(item.get() if isinstance(item, Color) else item.as_floats())
+				count += 1
+
+	return count
+
+
+def write_binary(target, items, typecode=None):
+	# storage.save already encodes in bounded chunks, including streams of
+	# batches, and takes a path or a seekable binary file like _open does
+	return storage.save(target, items, typecode)
+
+#endregion
+
+
+class Pipeline:
+	# Chainable wrapper over the functions above:
+	#
+	#   Pipeline.csv('in.csv').apply('normalised').keep(lambda v: v.z > 0).write_binary('out.vec')
+	#
+	# Nothing is read until the pipeline is iterated or written.
+
+	def __init__(self, items) -> None:
+		self.items = items
+
+
+	#region Creation methods
+
+	@staticmethod
+	def csv(source, kind=None, delimiter=',', batch_size=None):
+		return Pipeline(read_csv(source, kind, delimiter, batch_size))
+
+	@staticmethod
+	def binary(source, batch_size=None):
+		return Pipeline(read_binary(source, batch_size))
+
+	#endregion
+
+
+	#region Stage methods
+
+	def apply(self, op, *args, **kwargs):
+		return Pipeline(apply(self.items, op, *args, **kwargs))
+
+	def keep(self, predicate):
+		return Pipeline(keep(self.items, predicate))
+
+	def batched(self, batch_size=DEFAULT_BATCH_SIZE):
+		return Pipeline(batched(self.items, batch_size))
+
+	def unbatched(self):
+		return Pipeline(unbatched(self.items))
+
+	#endregion
+
+
+	#region Output methods
+
+	def write_csv(self, target, delimiter=',', header=True):
+		return write_csv(target, self.items, delimiter, header)
+
+	def write_binary(self, target, typecode=None):
+		return write_binary(target, self.items, typecode)
+
+	#endregion
+
+
+	#region Dunder methods
+
+	def __iter__(self):
+		return iter(self.items)
+
+	#endregion
@@ -1,9 +1,14 @@
+from array import array
+from itertools import repeat
 from math import sin, cos, atan2, sqrt
 from random import randint
+from vector import backends
 from vector.assistive_functions import get_normal, get_unit
 
 
 class Vec2d:
+	__slots__ = ('x', 'y')
+
 	def __get_xy(self, *args) -> list[float]:
 		args = args[0]
 		number_of_args = len(args)
@@ -22,48 +27,35 @@ class Vec2d:
 				if len(args[0]) == 1:
 					return [args[0][0], args[0][0]]
 				return [args[0][0], args[0][1]]  # single list argument
-			if arg_type is Vec2d:
+			if isinstance(args[0], Vec2d):
 				return [args[0].x, args[0].y]
 
 		raise TypeError(f'Invalid Input: {args}')
 
 	def __init__(self, *args) -> None:
-		self.__elements = self.__get_xy(args)
+		if len(args) == 2:  # fast path for Vec2d(x, y)
+			self.x, self.y = args
+		else:
+			self.x, self.y = self.__get_xy(args)
 
 
 	#region Properties
 
-	#---------------------- X
-	@property
-	def x(self):
-		return self.__elements[0]
-	@x.setter
-	def x(self, val):
-		self.__elements[0] = val
-
-	#---------------------- Y
-	@property
-	def y(self):
-		return self.__elements[1]
-	@y.setter
-	def y(self, val):
-		self.__elements[1] = val
-
 	#---------------------- W
 	@property
 	def w(self):
-		return self.__elements[0]
+		return self.x
 	@w.setter
 	def w(self, val):
-		self.__elements[0] = val
+		self.x = val
 
 	#---------------------- H
 	@property
 	def h(self):
-		return self.__elements[1]
+		return self.y
 	@h.setter
 	def h(self, val):
-		self.__elements[1] = val
+		self.y = val
 
 	#---------------------- Magnitude
 	@property
@@ -90,7 +82,7 @@ class Vec2d:
 
 	@staticmethod
 	def zero():
-		return Vec2d()
+		return Vec2d(0, 0)
 
 	#endregion
 
@@ -98,17 +90,21 @@ class Vec2d:
 	#region General manipulation methods
 
 	def as_floats(self):
-		return list(self.__elements)
+		return [self.x, self.y]
 
 	def as_ints(self):
 		return [int(self.x), int(self.y)]
 
 	def set(self, *args):
-		x, y = self.__get_xy(args)
-		self.__elements = [x, y]
+		if len(args) == 1 and type(args[0]) is Vec2d:
+			self.x = args[0].x ; self.y = args[0].y
+			return
+		self.x, self.y = self.__get_xy(args)
 
-	def copy(self):
-		return Vec2d(self.x, self.y)
+	def copy(self, out=None):
+		if out is None : return Vec2d(self.x, self.y)
+		out.x = self.x ; out.y = self.y
+		return out
 
 	def clear(self):
 		self.x = self.y = 0
@@ -119,7 +115,7 @@ class Vec2d:
 	#region Mathematical manipulation methods
 
 	def rotate(self, a):
-		x, y = self.as_floats()
+		x = self.x ; y = self.y
 		ca = cos(a)
 		sa = sin(a)
 
@@ -127,10 +123,16 @@ class Vec2d:
 		self.y = (sa * x) + (ca * y)
 
 	def dist_sqrt(self, *args):
+		if len(args) == 1 and type(args[0]) is Vec2d:
+			o = args[0]
+			return sqrt((self.x - o.x)**2 + (self.y - o.y)**2)
 		x, y = self.__get_xy(args)
 		return sqrt((self.x - x)**2 + (self.y - y)**2)
 
 	def dist(self, *args):
+		if len(args) == 1 and type(args[0]) is Vec2d:
+			o = args[0]
+			return (self.x - o.x)**2 + (self.y - o.y)**2
 		x, y = self.__get_xy(args)
 		return (self.x - x)**2 + (self.y - y)**2
 
@@ -141,19 +143,24 @@ class Vec2d:
 		return sqrt(self.x**2 + self.y**2)
 
 	def normalise(self):
-		mag = self.length
+		mag = self.get_magnitude()
 		if mag == 0 : return
-		self.idiv(mag)
+		self.x /= mag ; self.y /= mag
 
-	def normalised(self):
-		v = self.copy()
-		mag = v.length
+	def normalised(self, out=None):
+		mag = self.get_magnitude()
 		if mag == 0 : return
-		v.idiv(mag)
-		return v
+		x = self.x / mag ; y = self.y / mag
+
+		if out is None : return Vec2d(x, y)
+		out.x = x ; out.y = y
+		return out
 
 	def clamp(self, *args):
-		max_x, max_y = self.__get_xy(args)
+		if len(args) == 1 and type(args[0]) is Vec2d:
+			max_x = args[0].x ; max_y = args[0].y
+		else:
+			max_x, max_y = self.__get_xy(args)
 
 		if self.x > max_x : self.x = max_x
 		if self.y > max_y : self.y = max_y
@@ -162,104 +169,201 @@ class Vec2d:
 		if self.y < -max_y : self.y = -max_y
 
 	def iadd(self, *args):
+		if len(args) == 1 and type(args[0]) is Vec2d:
+			o = args[0]
+			self.x += o.x ; self.y += o.y
+			return
 		x, y = self.__get_xy(args)
 		self.x += x
 		self.y += y
 
 	def isub(self, *args):
+		if len(args) == 1 and type(args[0]) is Vec2d:
+			o = args[0]
+			self.x -= o.x ; self.y -= o.y
+			return
 		x, y = self.__get_xy(args)
 		self.x -= x
 		self.y -= y
 
 	def imult(self, *args):
+		if len(args) == 1 and type(args[0]) is Vec2d:
+			o = args[0]
+			self.x *= o.x ; self.y *= o.y
+			return
 		x, y = self.__get_xy(args)
 		self.x *= x
 		self.y *= y
 
 	def idiv(self, *args):
+		if len(args) == 1 and type(args[0]) is Vec2d:
+			o = args[0]
+			self.x /= o.x ; self.y /= o.y
+			return
 		x, y = self.__get_xy(args)
 		self.x /= x
 		self.y /= y
 
 	def ilerp(self, *args, t=0.5):
-		x, y = self.__get_xy(args)
+		if len(args) == 1 and type(args[0]) is Vec2d:
+			x = args[0].x ; y = args[0].y
+		else:
+			x, y = self.__get_xy(args)
+
+		self.x = self.x + t * (x - self.x)
+		self.y = self.y + t * (y - self.y)
+
+	def imadd(self, other, scale):
+		# self += other * scale without a temporary, e.g. pos.imadd(vel, dt)
+		if type(other) is not Vec2d:
+			other = Vec2d(other)
+		self.x += other.x * scale ; self.y += other.y * scale
+
+	# add, sub, mult, div, lerp and madd (like copy and normalised) return a
+	# new Vec2d, or write into out and return it when one is given, so hot
+	# loops can reuse their temporaries. out may be self or an operand.
+
+	def add(self, *args, out=None):
+		if len(args) == 1 and type(args[0]) is Vec2d:
+			o = args[0]
+			x = o.x + self.x ; y = o.y + self.y
+		else:
+			x, y = self.__get_xy(args)
+			x = x + self.x ; y = y + self.y
+
+		if out is None : return Vec2d(x, y)
+		out.x = x ; out.y = y
+		return out
+
+	def sub(self, *args, out=None):
+		if len(args) == 1 and type(args[0]) is Vec2d:
+			o = args[0]
+			x = self.x - o.x ; y = self.y - o.y
+		else:
+			x, y = self.__get_xy(args)
+			x = self.x - x ; y = self.y - y
+
+		if out is None : return Vec2d(x, y)
+		out.x = x ; out.y = y
+		return out
+
+	def mult(self, *args, out=None):
+		if len(args) == 1 and type(args[0]) is Vec2d:
+			o = args[0]
+			x = self.x * o.x ; y = self.y * o.y
+		else:
+			x, y = self.__get_xy(args)
+			x = self.x * x ; y = self.y * y
+
+		if out is None : return Vec2d(x, y)
+		out.x = x ; out.y = y
+		return out
+
+	def div(self, *args, out=None):
+		if len(args) == 1 and type(args[0]) is Vec2d:
+			o = args[0]
+			x = self.x / o.x ; y = self.y / o.y
+		else:
+			x, y = self.__get_xy(args)
+			x = self.x / x ; y = self.y / y
+
+		if out is None : return Vec2d(x, y)
+		out.x = x ; out.y = y
+		return out
+
+	def lerp(self, *args, t=0.5, out=None):
+		if len(args) == 1 and type(args[0]) is Vec2d:
+			x = args[0].x ; y = args[0].y
+		else:
+			x, y = self.__get_xy(args)
 
 		x = self.x + t * (x - self.x)
 		y = self.y + t * (y - self.y)
 
-		self.set(x, y)
+		if out is None : return Vec2d(x, y)
+		out.x = x ; out.y = y
+		return out
 
-	def add(self, *args):
-		x, y = self.__get_xy(args)
-		return Vec2d(x + self.x, y + self.y)
+	def madd(self, other, scale, out=None):
+		# self + other * scale in one step
+		if type(other) is not Vec2d:
+			other = Vec2d(other)
+		x = self.x + other.x * scale ; y = self.y + other.y * scale
 
-	def sub(self, *args):
-		x, y = self.__get_xy(args)
-		return Vec2d(self.x - x, self.y - y)
-
-	def mult(self, *args):
-		x, y = self.__get_xy(args)
-		return Vec2d(self.x * x, self.y * y)
-
-	def div(self, *args):
-		x, y = self.__get_xy(args)
-		return Vec2d(self.x / x, self.y / y)
-
-	def lerp(self, *args, t=0.5):
-		x, y = self.__get_xy(args)
-
-		x = self.x + t * (x - self.x)
-		y = self.y + t * (y - self.y)
-
-		return Vec2d(x, y)
+		if out is None : return Vec2d(x, y)
+		out.x = x ; out.y = y
+		return out
 
 	def dot(self, *args):
+		if len(args) == 1 and type(args[0]) is Vec2d:
+			o = args[0]
+			return self.x * o.x + self.y * o.y
 		x, y = self.__get_xy(args)
-		return sum([self.x * x, self.y * y])
+		return self.x * x + self.y * y
 
 	#endregion
 
 
 	#region Dunder methods
 
-	def __iadd__(self, *args):
-		x, y = self.__get_xy(args)
+	def __iadd__(self, other):
+		if type(other) is Vec2d:
+			self.x += other.x ; self.y += other.y
+			return self
+		x, y = self.__get_xy((other,))
 		self.x += x ; self.y += y
 		return self
 
-	def __isub__(self, *args):
-		x, y = self.__get_xy(args)
+	def __isub__(self, other):
+		if type(other) is Vec2d:
+			self.x -= other.x ; self.y -= other.y
+			return self
+		x, y = self.__get_xy((other,))
 		self.x -= x ; self.y -= y
 		return self
 
-	def __imul__(self, *args):
-		x, y = self.__get_xy(args)
+	def __imul__(self, other):
+		if type(other) is Vec2d:
+			self.x *= other.x ; self.y *= other.y
+			return self
+		x, y = self.__get_xy((other,))
 		self.x *= x ; self.y *= y
 		return self
 
-	def __idiv__(self, *args):
-		x, y = self.__get_xy(args)
+	def __idiv__(self, other):
+		if type(other) is Vec2d:
+			self.x /= other.x ; self.y /= other.y
+			return self
+		x, y = self.__get_xy((other,))
 		self.x /= x ; self.y /= y
 		return self
 
-	def __add__(self, *args):
-		x, y = self.__get_xy(args)
+	def __add__(self, other):
+		if type(other) is Vec2d:
+			return Vec2d(self.x + other.x, self.y + other.y)
+		x, y = self.__get_xy((other,))
 		return Vec2d(self.x + x, self.y + y)
 
-	def __sub__(self, *args):
-		x, y = self.__get_xy(args)
+	def __sub__(self, other):
+		if type(other) is Vec2d:
+			return Vec2d(self.x - other.x, self.y - other.y)
+		x, y = self.__get_xy((other,))
 		return Vec2d(self.x - x, self.y - y)
 
-	def __mul__(self, *args):
-		x, y = self.__get_xy(args)
+	def __mul__(self, other):
+		if type(other) is Vec2d:
+			return Vec2d(self.x * other.x, self.y * other.y)
+		x, y = self.__get_xy((other,))
 		return Vec2d(self.x * x, self.y * y)
 
-	def __div__(self, *args):
-		x, y = self.__get_xy(args)
+	def __div__(self, other):
+		if type(other) is Vec2d:
+			return Vec2d(self.x / other.x, self.y / other.y)
+		x, y = self.__get_xy((other,))
 		return Vec2d(self.x / x, self.y / y)
 
 	def __getitem__(self, index):
-		return self.__elements[index]
+		return (self.x, self.y)[index]
 
 	def __repr__(self):
 		return f'vector X: {self.x}, Y: {self.y}'
@@ -267,4 +371,244 @@ class Vec2d:
 	#endregion
 
 
+class _Vec2dView(Vec2d):
+	__slots__ = ('_array', '_index')
+
+	def __init__(self, array, index) -> None:
+		self._array = array
+		self._index = index
+
+
+	#region Properties
+
+	#---------------------- X
+	@property
+	def x(self):
+		return self._array.xs[self._index]
+	@x.setter
+	def x(self, val):
+		self._array.xs[self._index] = val
+
+	#---------------------- Y
+	@property
+	def y(self):
+		return self._array.ys[self._index]
+	@y.setter
+	def y(self, val):
+		self._array.ys[self._index] = val
 
+	#endregion
+
+
+def _iterables(operands, count):
+	# __get_columns operands for zip and map, floats repeated for every element
+	return [repeat(operand, count) if type(operand) is float else operand for operand in operands]
+
+
+def _clamp_component(value, limit):
+	if value > limit : value = limit
+	if value < -limit : value = -limit
+	return value
+
+
+class Vec2dArray:
+	def __get_columns(self, args):
+		# per component the other batch's column, or one float for every element
+		if len(args) == 1 and isinstance(args[0], Vec2dArray):
+			other = args[0]
+			if len(other) != len(self):
+				raise ValueError(f'Length mismatch: {len(other)} != {len(self)}')
+			return other.xs, other.ys
+
+		x, y = Vec2d(*args).as_floats()
+		return float(x), float(y)
+
+	def __result(self, columns, out):
+		# a new array, or the columns of out overwritten in place; columns are
+		# fully computed before out is touched, so out may be self or an operand
+		if out is None:
+			return Vec2dArray.from_columns(*columns)
+		if len(out) != len(self):
+			raise ValueError(f'Length mismatch: {len(out)} != {len(self)}')
+
+		for target, values in zip(out.columns, columns):
+			if target is not values:
+				target[:] = values if type(values) is array else array('d', values)
+		return out
+
+	def __init__(self, vectors=()) -> None:
+		self.xs = array('d')
+		self.ys = array('d')
+		self.extend(vectors)
+
+
+	#region Properties
+
+	#---------------------- Columns
+	@property
+	def columns(self):
+		return self.xs, self.ys
+
+	#endregion
+
+
+	#region Creation methods
+
+	@staticmethod
+	def from_columns(xs, ys):
+		v = Vec2dArray()
+		v.xs = array('d', xs)
+		v.ys = array('d', ys)
+
+		if len(v.xs) != len(v.ys):
+			raise ValueError(f'Length mismatch: {len(v.xs)} != {len(v.ys)}')
+
+		return v
+
+	@staticmethod
+	def zeros(count):
+		return Vec2dArray.from_columns(array('d', bytes(8 * count)), array('d', bytes(8 * count)))
+
+	#endregion
+
+
+	#region General manipulation methods
+
+	def append(self, *args):
+		x, y = Vec2d(*args).as_floats()
+		self.xs.append(x)
+		self.ys.append(y)
+
+	def extend(self, vectors):
+		if isinstance(vectors, Vec2dArray):
+			self.xs.extend(vectors.xs)
+			self.ys.extend(vectors.ys)
+			return
+
+		for v in vectors:
+			self.append(v)
+
+	def as_list(self):
+		return [Vec2d(x, y) for x, y in zip(self.xs, self.ys)]
+
+	def copy(self, out=None):
+		return self.__result(self.columns, out)
+
+	def clear(self):
+		self.xs[:] = array('d', bytes(8 * len(self)))
+		self.ys[:] = array('d', bytes(8 * len(self)))
+
+	#endregion
+
+
+	#region Mathematical manipulation methods
+
+	def rotate(self, a):
+		ca = cos(a)
+		sa = sin(a)
+
+		xs = array('d', [(ca * x) + (-sa * y) for x, y in zip(self.xs, self.ys)])
+		ys = array('d', [(sa * x) + (ca * y) for x, y in zip(self.xs, self.ys)])
+		self.xs[:] = xs
+		self.ys[:] = ys
+
+	def dist_sqrt(self, *args):
+		ox, oy = _iterables(self.__get_columns(args), len(self))
+		return array('d', [sqrt((x - bx)**2 + (y - by)**2) for x, y, bx, by in zip(self.xs, self.ys, ox, oy)])
+
+	def dist(self, *args):
+		ox, oy = _iterables(self.__get_columns(args), len(self))
+		return array('d', [(x - bx)**2 + (y - by)**2 for x, y, bx, by in zip(self.xs, self.ys, ox, oy)])
+
+	def get_heading_angle(self):
+		return array('d', map(atan2, self.xs, self.ys))
+
+	# The element wise operations below run on a compute backend, the
+	# default one unless backend= names another (see vector.backends).
+
+	def get_magnitude(self, backend=None):
+		return backends.get(backend).magnitude(self.columns)
+
+	def normalise(self, backend=None):
+		self.__result(backends.get(backend).normalise(self.columns), self)
+
+	def normalised(self, out=None, backend=None):
+		return self.__result(backends.get(backend).normalise(self.columns), out)
+
+	def clamp(self, *args):
+		max_x, max_y = _iterables(self.__get_columns(args), len(self))
+		self.xs[:] = array('d', map(_clamp_component, self.xs, max_x))
+		self.ys[:] = array('d', map(_clamp_component, self.ys, max_y))
+
+	def iadd(self, *args, backend=None):
+		self.__result(backends.get(backend).arith('add', self.columns, self.__get_columns(args)), self)
+
+	def isub(self, *args, backend=None):
+		self.__result(backends.get(backend).arith('sub', self.columns, self.__get_columns(args)), self)
+
+	def imult(self, *args, backend=None):
+		self.__result(backends.get(backend).arith('mul', self.columns, self.__get_columns(args)), self)
+
+	def idiv(self, *args, backend=None):
+		self.__result(backends.get(backend).arith('div', self.columns, self.__get_columns(args)), self)
+
+	def ilerp(self, *args, t=0.5, backend=None):
+		self.__result(backends.get(backend).lerp(self.columns, self.__get_columns(args), t), self)
+
+	def imadd(self, other, scale, backend=None):
+		self.madd(other, scale, out=self, backend=backend)
+
+	def add(self, *args, out=None, backend=None):
+		return self.__result(backends.get(backend).arith('add', self.columns, self.__get_columns(args)), out)
+
+	def sub(self, *args, out=None, backend=None):
+		return self.__result(backends.get(backend).arith('sub', self.columns, self.__get_columns(args)), out)
+
+	def mult(self, *args, out=None, backend=None):
+		return self.__result(backends.get(backend).arith('mul', self.columns, self.__get_columns(args)), out)
+
+	def div(self, *args, out=None, backend=None):
+		return self.__result(backends.get(backend).arith('div', self.columns, self.__get_columns(args)), out)
+
+	def lerp(self, *args, t=0.5, out=None, backend=None):
+		return self.__result(backends.get(backend).lerp(self.columns, self.__get_columns(args), t), out)
+
+	def madd(self, other, scale, out=None, backend=None):
+		# self + other * scale, other is a Vec2dArray or one vector for every element
+		return self.__result(backends.get(backend).madd(self.columns, self.__get_columns((other,)), scale), out)
+
+	def dot(self, *args, backend=None):
+		return backends.get(backend).dot(self.columns, self.__get_columns(args))
+
+	#endregion
+
+
+	#region Dunder methods
+
+	def __len__(self):
+		return len(self.xs)
+
+	def __iter__(self):
+		for i in range(len(self)):
+			yield _Vec2dView(self, i)
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return Vec2dArray.from_columns(self.xs[index], self.ys[index])
+
+		if index < 0:
+			index += len(self)
+		if not 0 <= index < len(self):
+			raise IndexError('Vec2dArray index out of range')
+
+		return _Vec2dView(self, index)
+
+	def __setitem__(self, index, value):
+		x, y = Vec2d(value).as_floats()
+		self.xs[index] = x
+		self.ys[index] = y
+
+	def __repr__(self):
+		return f'Vec2dArray of {len(self)} vectors'
+
+	#endregion
@@ -1,9 +1,14 @@
+from array import array
+from itertools import repeat
 from math import sin, cos, atan2, sqrt
 from random import randint
+from vector import backends
 from vector.assistive_functions import get_normal, get_unit
 
 
 class Vec3d:
+	__slots__ = ('x', 'y', 'z')
+
 	def __get_xyz(self, *args) -> list[float]:
 		args = args[0]
 		number_of_args = len(args)
@@ -21,88 +26,67 @@ class Vec3d:
 				if len(args[0]) == 1:
 					return [args[0][0], args[0][0], args[0][0]]
 				return [args[0][0], args[0][1], args[0][2]]  # single list argument
-			if arg_type is Vec3d:
+			if isinstance(args[0], Vec3d):
 				return [args[0].x, args[0].y, args[0].z]
 
 		raise TypeError(f'Invalid Input: {args}')
 
 	def __init__(self, *args) -> None:
-		self.__elements = self.__get_xyz(args)
+		if len(args) == 3:  # fast path for Vec3d(x, y, z)
+			self.x, self.y, self.z = args
+		else:
+			self.x, self.y, self.z = self.__get_xyz(args)
 
 
 	#region Properties
 
-	#---------------------- X
-	@property
-	def x(self):
-		return self.__elements[0]
-	@x.setter
-	def x(self, val):
-		self.__elements[0] = val
-
-	#---------------------- Y
-	@property
-	def y(self):
-		return self.__elements[1]
-	@y.setter
-	def y(self, val):
-		self.__elements[1] = val
-
-	#---------------------- Z
-	@property
-	def z(self):
-		return self.__elements[2]
-	@z.setter
-	def z(self, val):
-		self.__elements[2] = val
-
 	#---------------------- W
 	@property
 	def w(self):
-		return self.__elements[0]
+		return self.x
 	@w.setter
 	def w(self, val):
-		self.__elements[0] = val
+		self.x = val
 
 	#---------------------- H
 	@property
 	def h(self):
-		return self.__elements[1]
+		return self.y
 	@h.setter
 	def h(self, val):
-		self.__elements[1] = val
+		self.y = val
 
 	#---------------------- D
 	@property
 	def d(self):
-		return self.__elements[2]
+		return self.z
 	@d.setter
 	def d(self, val):
-		self.__elements[2] = val
+		self.z = val
 
 	#---------------------- R
 	@property
 	def r(self):
-		return self.__elements[0]
+		return self.x
 	@r.setter
 	def r(self, val):
-		self.__elements[0] = val
+		self.x = val
 
 	#---------------------- G
 	@property
 	def g(self):
-		return self.__elements[1]
+		return self.y
 	@g.setter
 	def g(self, val):
-		self.__elements[1] = val
+		self.y = val
 
 	#---------------------- B
 	@property
 	def b(self):
-		return self.__elements[2]
+		return self.z
 	@b.setter
 	def b(self, val):
-		self.__elements[2] = val
+		self.z = val
 
 
 	#---------------------- Magnitude
@@ -126,7 +110,7 @@ class Vec3d:
 
 	@staticmethod
 	def zero():
-		return Vec3d()
+		return Vec3d(0, 0, 0)
 
 	#endregion
 
@@ -134,17 +118,22 @@ class Vec3d:
 	#region General manipulation methods
 
 	def as_floats(self):
-		return list(self.__elements)
+		return [self.x, self.y, self.z]
 
 	def as_ints(self):
 		return [int(self.x), int(self.y), int(self.z)]
 
 	def set(self, *args):
-		x, y, z = self.__get_xyz(args)
-		self.__elements = [x, y, z]
+		if len(args) == 1 and type(args[0]) is Vec3d:
+			o = args[0]
+			self.x = o.x ; self.y = o.y ; self.z = o.z
+			return
+		self.x, self.y, self.z = self.__get_xyz(args)
 
-	def copy(self):
-		return Vec3d(self.x, self.y, self.z)
+	def copy(self, out=None):
+		if out is None : return Vec3d(self.x, self.y, self.z)
+		out.x = self.x ; out.y = self.y ; out.z = self.z
+		return out
 
 	def clear(self):
 		self.x = self.y = self.z = 0
@@ -154,49 +143,52 @@ class Vec3d:
 
 	#region Mathematical manipulation methods
 
-	def cross_product(self, *args):
-		a = self
-		b = Vec3d(self.__get_xyz(args))
-		c = Vec3d()
+	def cross_product(self, *args, out=None):
+		if len(args) == 1 and type(args[0]) is Vec3d:
+			o = args[0]
+			x = o.x ; y = o.y ; z = o.z
+		else:
+			x, y, z = self.__get_xyz(args)
 
-		c.x = (a.y * b.z) - (a.z * b.y)
-		c.y = (a.z * b.x) - (a.x * b.z)
-		c.z = (a.x * b.y) - (a.y * b.x)
+		cx = (self.y * z) - (self.z * y)
+		cy = (self.z * x) - (self.x * z)
+		cz = (self.x * y) - (self.y * x)
 
-		return c
+		if out is None : return Vec3d(cx, cy, cz)
+		out.x = cx ; out.y = cy ; out.z = cz
+		return out
 
 	def rotate_x(self, a):
-		x, y, z = self.as_floats()
+		y = self.y ; z = self.z
 		ca = cos(a)
 		sa = sin(a)
 
-		self.x = (1 * x) + (0 * y) + (0 * z)
-		self.y = (0 * x) + (ca * y) + (-sa * z)
-		self.z = (0 * x) + (sa * y) + (ca * z)
+		self.y = (ca * y) + (-sa * z)
+		self.z = (sa * y) + (ca * z)
 
 	def rotate_y(self, a):
-		x, y, z = self.as_floats()
+		x = self.x ; z = self.z
 		ca = cos(a)
 		sa = sin(a)
 
-		self.x = (ca * x) + (0 * y) + (sa * z)
-		self.y = (0 * x) + (1 * y) + (0 * z)
-		self.z = (-sa * x) + (0 * y) + (ca * z)
+		self.x = (ca * x) + (sa * z)
+		self.z = (-sa * x) + (ca * z)
 
 	def rotate_z(self, a):
-		x, y, z = self.as_floats()
+		x = self.x ; y = self.y
 		ca = cos(a)
 		sa = sin(a)
 
-		self.x = (ca * x) + (-sa * y) + (0 * z)
-		self.y = (sa * x) + (ca * y) + (0 * z)
-		self.z = (0 * x) + (0 * y) + (1 * z)
+		self.x = (ca * x) + (-sa * y)
+		self.y = (sa * x) + (ca * y)
 
 	def dist_sqrt(self, *args):
-		x, y, z = self.__get_xyz(args)
-		return sqrt((self.x - x)**2 + (self.y - y)**2 + (self.z - z)**2)
+		return sqrt(self.dist(*args))
 
 	def dist(self, *args):
+		if len(args) == 1 and type(args[0]) is Vec3d:
+			o = args[0]
+			return (self.x - o.x)**2 + (self.y - o.y)**2 + (self.z - o.z)**2
 		x, y, z = self.__get_xyz(args)
 		return (self.x - x)**2 + (self.y - y)**2 + (self.z - z)**2
 
@@ -204,19 +196,25 @@ class Vec3d:
 		return sqrt(self.x**2 + self.y**2 + self.z**2)
 
 	def normalise(self):
-		mag = self.length
+		mag = self.get_magnitude()
 		if mag == 0 : return
-		self.idiv(mag)
+		self.x /= mag ; self.y /= mag ; self.z /= mag
 
-	def normalised(self):
-		v = self.copy()
-		mag = v.length
+	def normalised(self, out=None):
+		mag = self.get_magnitude()
 		if mag == 0 : return
-		v.idiv(mag)
-		return v
+		x = self.x / mag ; y = self.y / mag ; z = self.z / mag
+
+		if out is None : return Vec3d(x, y, z)
+		out.x = x ; out.y = y ; out.z = z
+		return out
 
 	def clamp(self, *args):
-		max_x, max_y, max_z = self.__get_xyz(args)
+		if len(args) == 1 and type(args[0]) is Vec3d:
+			o = args[0]
+			max_x = o.x ; max_y = o.y ; max_z = o.z
+		else:
+			max_x, max_y, max_z = self.__get_xyz(args)
 
 		if self.x > max_x : self.x = max_x
 		if self.y > max_y : self.y = max_y
@@ -227,110 +225,210 @@ class Vec3d:
 		if self.z < -max_z : self.z = -max_z
 
 	def iadd(self, *args):
+		if len(args) == 1 and type(args[0]) is Vec3d:
+			o = args[0]
+			self.x += o.x ; self.y += o.y ; self.z += o.z
+			return
 		x, y, z = self.__get_xyz(args)
 		self.x += x
 		self.y += y
 		self.z += z
 
 	def isub(self, *args):
+		if len(args) == 1 and type(args[0]) is Vec3d:
+			o = args[0]
+			self.x -= o.x ; self.y -= o.y ; self.z -= o.z
+			return
 		x, y, z = self.__get_xyz(args)
 		self.x -= x
 		self.y -= y
 		self.z -= z
 
 	def imult(self, *args):
+		if len(args) == 1 and type(args[0]) is Vec3d:
+			o = args[0]
+			self.x *= o.x ; self.y *= o.y ; self.z *= o.z
+			return
 		x, y, z = self.__get_xyz(args)
 		self.x *= x
 		self.y *= y
 		self.z *= z
 
 	def idiv(self, *args):
+		if len(args) == 1 and type(args[0]) is Vec3d:
+			o = args[0]
+			self.x /= o.x ; self.y /= o.y ; self.z /= o.z
+			return
 		x, y, z = self.__get_xyz(args)
 		self.x /= x
 		self.y /= y
 		self.z /= z
 
 	def ilerp(self, *args, t=0.5):
-		x, y, z = self.__get_xyz(args)
+		if len(args) == 1 and type(args[0]) is Vec3d:
+			o = args[0]
+			x = o.x ; y = o.y ; z = o.z
+		else:
+			x, y, z = self.__get_xyz(args)
+
+		self.x = self.x + t * (x - self.x)
+		self.y = self.y + t * (y - self.y)
+		self.z = self.z + t * (z - self.z)
+
+	def imadd(self, other, scale):
+		# self += other * scale without a temporary, e.g. pos.imadd(vel, dt)
+		if type(other) is not Vec3d:
+			other = Vec3d(other)
+		self.x += other.x * scale ; self.y += other.y * scale ; self.z += other.z * scale
+
+	# add, sub, mult, div, lerp and madd (like copy, normalised and
+	# cross_product) return a new Vec3d, or write into out and return it when
+	# one is given, so hot loops can reuse their temporaries. out may be self
+	# or an operand.
+
+	def add(self, *args, out=None):
+		if len(args) == 1 and type(args[0]) is Vec3d:
+			o = args[0]
+			x = self.x + o.x ; y = self.y + o.y ; z = self.z + o.z
+		else:
+			x, y, z = self.__get_xyz(args)
+			x = self.x + x ; y = self.y + y ; z = self.z + z
+
+		if out is None : return Vec3d(x, y, z)
+		out.x = x ; out.y = y ; out.z = z
+		return out
+
+	def sub(self, *args, out=None):
+		if len(args) == 1 and type(args[0]) is Vec3d:
+			o = args[0]
+			x = self.x - o.x ; y = self.y - o.y ; z = self.z - o.z
+		else:
+			x, y, z = self.__get_xyz(args)
+			x = self.x - x ; y = self.y - y ; z = self.z - z
+
+		if out is None : return Vec3d(x, y, z)
+		out.x = x ; out.y = y ; out.z = z
+		return out
+
+	def mult(self, *args, out=None):
+		if len(args) == 1 and type(args[0]) is Vec3d:
+			o = args[0]
+			x = self.x * o.x ; y = self.y * o.y ; z = self.z * o.z
+		else:
+			x, y, z = self.__get_xyz(args)
+			x = self.x * x ; y = self.y * y ; z = self.z * z
+
+		if out is None : return Vec3d(x, y, z)
+		out.x = x ; out.y = y ; out.z = z
+		return out
+
+	def div(self, *args, out=None):
+		if len(args) == 1 and type(args[0]) is Vec3d:
+			o = args[0]
+			x = self.x / o.x ; y = self.y / o.y ; z = self.z / o.z
+		else:
+			x, y, z = self.__get_xyz(args)
+			x = self.x / x ; y = self.y / y ; z = self.z / z
+
+		if out is None : return Vec3d(x, y, z)
+		out.x = x ; out.y = y ; out.z = z
+		return out
+
+	def lerp(self, *args, t=0.5, out=None):
+		if len(args) == 1 and type(args[0]) is Vec3d:
+			o = args[0]
+			x = o.x ; y = o.y ; z = o.z
+		else:
+			x, y, z = self.__get_xyz(args)
 
 		x = self.x + t * (x - self.x)
 		y = self.y + t * (y - self.y)
-		z = self.z + t * (y - self.z)
+		z = self.z + t * (z - self.z)
 
-		self.set(x, y, z)
+		if out is None : return Vec3d(x, y, z)
+		out.x = x ; out.y = y ; out.z = z
+		return out
 
-	def add(self, *args):
-		x, y, z = self.__get_xyz(args)
-		return Vec3d(self.x + x, self.y + y, self.z + z)
+	def madd(self, other, scale, out=None):
+		# self + other * scale in one step
+		if type(other) is not Vec3d:
+			other = Vec3d(other)
+		x = self.x + other.x * scale ; y = self.y + other.y * scale ; z = self.z + other.z * scale
 
-	def sub(self, *args):
-		x, y, z = self.__get_xyz(args)
-		return Vec3d(self.x - x, self.y - y, self.z - z)
-
-	def mult(self, *args):
-		x, y, z = self.__get_xyz(args)
-		return Vec3d(self.x * x, self.y * y, self.z * z)
-
-	def div(self, *args):
-		x, y, z = self.__get_xyz(args)
-		return Vec3d(self.x / x, self.y / y, self.z / z)
-
-	def lerp(self, *args, t=0.5):
-		x, y, z = self.__get_xyz(args)
-
-		x = self.x + t * (x - self.x)
-		y = self.y + t * (y - self.y)
-		z = self.z + t * (y - self.z)
-
-		return Vec3d(x, y, z)
+		if out is None : return Vec3d(x, y, z)
+		out.x = x ; out.y = y ; out.z = z
+		return out
 
 	def dot(self, *args):
+		if len(args) == 1 and type(args[0]) is Vec3d:
+			o = args[0]
+			return self.x * o.x + self.y * o.y + self.z * o.z
 		x, y, z = self.__get_xyz(args)
-		return sum([self.x * x, self.y * y, self.z * z])
+		return self.x * x + self.y * y + self.z * z
 
 	#endregion
 
 
 	#region Dunder methods
 
-	def __iadd__(self, *args):
-		x, y, z = self.__get_xyz(args)
+	def __iadd__(self, other):
+		if type(other) is Vec3d:
+			self.x += other.x ; self.y += other.y ; self.z += other.z
+			return self
+		x, y, z = self.__get_xyz((other,))
 		self.x += x ; self.y += y ; self.z += z
 		return self
 
-	def __isub__(self, *args):
-		x, y, z = self.__get_xyz(args)
+	def __isub__(self, other):
+		if type(other) is Vec3d:
+			self.x -= other.x ; self.y -= other.y ; self.z -= other.z
+			return self
+		x, y, z = self.__get_xyz((other,))
 		self.x -= x ; self.y -= y ; self.z -= z
 		return self
 
-	def __imul__(self, *args):
-		x, y, z = self.__get_xyz(args)
+	def __imul__(self, other):
+		if type(other) is Vec3d:
+			self.x *= other.x ; self.y *= other.y ; self.z *= other.z
+			return self
+		x, y, z = self.__get_xyz((other,))
 		self.x *= x ; self.y *= y ; self.z *= z
 		return self
 
-	def __idiv__(self, *args):
-		x, y, z = self.__get_xyz(args)
+	def __idiv__(self, other):
+		if type(other) is Vec3d:
+			self.x /= other.x ; self.y /= other.y ; self.z /= other.z
+			return self
+		x, y, z = self.__get_xyz((other,))
 		self.x /= x ; self.y /= y ; self.z /= z
 		return self
 
-	def __add__(self, *args):
-		x, y, z = self.__get_xyz(args)
+	def __add__(self, other):
+		if type(other) is Vec3d:
+			return Vec3d(self.x + other.x, self.y + other.y, self.z + other.z)
+		x, y, z = self.__get_xyz((other,))
 		return Vec3d(self.x + x, self.y + y, self.z + z)
 
-	def __sub__(self, *args):
-		x, y, z = self.__get_xyz(args)
+	def __sub__(self, other):
+		if type(other) is Vec3d:
+			return Vec3d(self.x - other.x, self.y - other.y, self.z - other.z)
+		x, y, z = self.__get_xyz((other,))
 		return Vec3d(self.x - x, self.y - y, self.z - z)
 
-	def __mul__(self, *args):
-		x, y, z = self.__get_xyz(args)
+	def __mul__(self, other):
+		if type(other) is Vec3d:
+			return Vec3d(self.x * other.x, self.y * other.y, self.z * other.z)
+		x, y, z = self.__get_xyz((other,))
 		return Vec3d(self.x * x, self.y * y, self.z * z)
 
-	def __div__(self, *args):
-		x, y, z = self.__get_xyz(args)
+	def __div__(self, other):
+		if type(other) is Vec3d:
+			return Vec3d(self.x / other.x, self.y / other.y, self.z / other.z)
+		x, y, z = self.__get_xyz((other,))
 		return Vec3d(self.x / x, self.y / y, self.z / z)
 
 	def __getitem__(self, index):
-		return self.__elements[index]
+		return (self.x, self.y, self.z)[index]
 
 	def __repr__(self):
 		return f'vector X: {self.x}, Y: {self.y}, Z: {self.z}'
@@ -338,4 +436,291 @@ class Vec3d:
 	#endregion
 
 
+class _Vec3dView(Vec3d):
+	__slots__ = ('_array', '_index')
+
+	def __init__(self, array, index) -> None:
+		self._array = array
+		self._index = index
+
+
+	#region Properties
+
+	#---------------------- X
+	@property
+	def x(self):
+		return self._array.xs[self._index]
+	@x.setter
+	def x(self, val):
+		self._array.xs[self._index] = val
+
+	#---------------------- Y
+	@property
+	def y(self):
+		return self._array.ys[self._index]
+	@y.setter
+	def y(self, val):
+		self._array.ys[self._index] = val
+
+	#---------------------- Z
+	@property
+	def z(self):
+		return self._array.zs[self._index]
+	@z.setter
+	def z(self, val):
+		self._array.zs[self._index] = val
+
+	#endregion
+
+
+def _iterables(operands, count):
+	# __get_columns operands for zip and map, floats repeated for every element
+	return [repeat(operand, count) if type(operand) is float else operand for operand in operands]
+
+
+def _clamp_component(value, limit):
+	if value > limit : value = limit
+	if value < -limit : value = -limit
+	return value
+
+
+class Vec3dArray:
+	def __get_columns(self, args):
+		# per component the other batch's column, or one float for every element
+		if len(args) == 1 and isinstance(args[0], Vec3dArray):
+			other = args[0]
+			if len(other) != len(self):
+				raise ValueError(f'Length mismatch: {len(other)} != {len(self)}')
+			return other.xs, other.ys, other.zs
+
+		x, y, z = Vec3d(*args).as_floats()
+		return float(x), float(y), float(z)
+
+	def __result(self, columns, out):
+		# a new array, or the columns of out overwritten in place; columns are
+		# fully computed before out is touched, so out may be self or an operand
+		if out is None:
+			return Vec3dArray.from_columns(*columns)
+		if len(out) != len(self):
+			raise ValueError(f'Length mismatch: {len(out)} != {len(self)}')
+
+		for target, values in zip(out.columns, columns):
+			if target is not values:
+				target[:] = values if type(values) is array else array('d', values)
+		return out
+
+	def __init__(self, vectors=()) -> None:
+		self.xs = array('d')
+		self.ys = array('d')
+		self.zs = array('d')
+		self.extend(vectors)
+
+
+	#region Properties
+
+	#---------------------- Columns
+	@property
+	def columns(self):
+		return self.xs, self.ys, self.zs
+
+	#endregion
+
+
+	#region Creation methods
+
+	@staticmethod
+	def from_columns(xs, ys, zs):
+		v = Vec3dArray()
+		v.xs = array('d', xs)
+		v.ys = array('d', ys)
+		v.zs = array('d', zs)
+
+		if not len(v.xs) == len(v.ys) == len(v.zs):
+			raise ValueError(f'Length mismatch: {len(v.xs)}, {len(v.ys)}, {len(v.zs)}')
+
+		return v
+
+	@staticmethod
+	def zeros(count):
+		return Vec3dArray.from_columns(
+			array('d', bytes(8 * count)),
+			array('d', bytes(8 * count)),
+			array('d', bytes(8 * count)),
+		)
+
+	#endregion
+
+
+	#region General manipulation methods
+
+	def append(self, *args):
+		x, y, z = Vec3d(*args).as_floats()
+		self.xs.append(x)
+		self.ys.append(y)
+		self.zs.append(z)
+
+	def extend(self, vectors):
+		if isinstance(vectors, Vec3dArray):
+			self.xs.extend(vectors.xs)
+			self.ys.extend(vectors.ys)
+			self.zs.extend(vectors.zs)
+			return
+
+		for v in vectors:
+			self.append(v)
+
+	def as_list(self):
+		return [Vec3d(x, y, z) for x, y, z in zip(self.xs, self.ys, self.zs)]
+
+	def copy(self, out=None):
+		return self.__result(self.columns, out)
+
+	def clear(self):
+		self.xs[:] = array('d', bytes(8 * len(self)))
+		self.ys[:] = array('d', bytes(8 * len(self)))
+		self.zs[:] = array('d', bytes(8 * len(self)))
+
+	#endregion
+
+
+	#region Mathematical manipulation methods
+
+	def cross_product(self, *args, out=None):
+		ox, oy, oz = _iterables(self.__get_columns(args), len(self))
+		xs, ys, zs = [], [], []
+
+		for ax, ay, az, bx, by, bz in zip(self.xs, self.ys, self.zs, ox, oy, oz):
+			xs.append((ay * bz) - (az * by))
+			ys.append((az * bx) - (ax * bz))
+			zs.append((ax * by) - (ay * bx))
+
+		return self.__result((xs, ys, zs), out)
+
+	def rotate_x(self, a):
+		ca = cos(a)
+		sa = sin(a)
+
+		ys = array('d', [(ca * y) + (-sa * z) for y, z in zip(self.ys, self.zs)])
+		zs = array('d', [(sa * y) + (ca * z) for y, z in zip(self.ys, self.zs)])
+		self.ys[:] = ys
+		self.zs[:] = zs
+
+	def rotate_y(self, a):
+		ca = cos(a)
+		sa = sin(a)
+
+		xs = array('d', [(ca * x) + (sa * z) for x, z in zip(self.xs, self.zs)])
+		zs = array('d', [(-sa * x) + (ca * z) for x, z in zip(self.xs, self.zs)])
+		self.xs[:] = xs
+		self.zs[:] = zs
+
+	def rotate_z(self, a):
+		ca = cos(a)
+		sa = sin(a)
+
+		xs = array('d', [(ca * x) + (-sa * y) for x, y in zip(self.xs, self.ys)])
+		ys = array('d', [(sa * x) + (ca * y) for x, y in zip(self.xs, self.ys)])
+		self.xs[:] = xs
+		self.ys[:] = ys
+
+	def dist_sqrt(self, *args):
+		return array('d', map(sqrt, self.dist(*args)))
+
+	def dist(self, *args):
+		ox, oy, oz = _iterables(self.__get_columns(args), len(self))
+		return array('d', [
+			(x - bx)**2 + (y - by)**2 + (z - bz)**2
+			for x, y, z, bx, by, bz in zip(self.xs, self.ys, self.zs, ox, oy, oz)
+		])
+
+	# The element wise operations below run on a compute backend, the
+	# default one unless backend= names another (see vector.backends).
+
+	def get_magnitude(self, backend=None):
+		return backends.get(backend).magnitude(self.columns)
+
+	def normalise(self, backend=None):
+		self.__result(backends.get(backend).normalise(self.columns), self)
+
+	def normalised(self, out=None, backend=None):
+		return self.__result(backends.get(backend).normalise(self.columns), out)
+
+	def clamp(self, *args):
+		max_x, max_y, max_z = _iterables(self.__get_columns(args), len(self))
+		self.xs[:] = array('d', map(_clamp_component, self.xs, max_x))
+		self.ys[:] = array('d', map(_clamp_component, self.ys, max_y))
+		self.zs[:] = array('d', map(_clamp_component, self.zs, max_z))
+
+	def iadd(self, *args, backend=None):
+		self.__result(backends.get(backend).arith('add', self.columns, self.__get_columns(args)), self)
+
+	def isub(self, *args, backend=None):
+		self.__result(backends.get(backend).arith('sub', self.columns, self.__get_columns(args)), self)
+
+	def imult(self, *args, backend=None):
+		self.__result(backends.get(backend).arith('mul', self.columns, self.__get_columns(args)), self)
+
+	def idiv(self, *args, backend=None):
+		self.__result(backends.get(backend).arith('div', self.columns, self.__get_columns(args)), self)
+
+	def ilerp(self, *args, t=0.5, backend=None):
+		self.__result(backends.get(backend).lerp(self.columns, self.__get_columns(args), t), self)
+
+	def imadd(self, other, scale, backend=None):
+		self.madd(other, scale, out=self, backend=backend)
+
+	def add(self, *args, out=None, backend=None):
+		return self.__result(backends.get(backend).arith('add', self.columns, self.__get_columns(args)), out)
+
+	def sub(self, *args, out=None, backend=None):
+		return self.__result(backends.get(backend).arith('sub', self.columns, self.__get_columns(args)), out)
+
+	def mult(self, *args, out=None, backend=None):
+		return self.__result(backends.get(backend).arith('mul', self.columns, self.__get_columns(args)), out)
+
+	def div(self, *args, out=None, backend=None):
+		return self.__result(backends.get(backend).arith('div', self.columns, self.__get_columns(args)), out)
+
+	def lerp(self, *args, t=0.5, out=None, backend=None):
+		return self.__result(backends.get(backend).lerp(self.columns, self.__get_columns(args), t), out)
+
+	def madd(self, other, scale, out=None, backend=None):
+		# self + other * scale, other is a Vec3dArray or one vector for every element
+		return self.__result(backends.get(backend).madd(self.columns, self.__get_columns((other,)), scale), out)
+
+	def dot(self, *args, backend=None):
+		return backends.get(backend).dot(self.columns, self.__get_columns(args))
+
+	#endregion
+
+
+	#region Dunder methods
 
+	def __len__(self):
+		return len(self.xs)
+
+	def __iter__(self):
+		for i in range(len(self)):
+			yield _Vec3dView(self, i)
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return Vec3dArray.from_columns(self.xs[index], self.ys[index], self.zs[index])
+
+		if index < 0:
+			index += len(self)
+		if not 0 <= index < len(self):
+			raise IndexError('Vec3dArray index out of range')
+
+		return _Vec3dView(self, index)
+
+	def __setitem__(self, index, value):
+		x, y, z = Vec3d(value).as_floats()
+		self.xs[index] = x
+		self.ys[index] = y
+		self.zs[index] = z
+
+	def __repr__(self):
+		return f'Vec3dArray of {len(self)} vectors'
+
+	#endregion
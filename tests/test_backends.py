@@ -0,0 +1,94 @@
+import random
+import pytest
+from vector import Vec2d, Vec3d, Vec2dArray, Vec3dArray
+from vector import backends
+
+
+def _batch(batch, count, seed=0):
+	rng = random.Random(seed)
+	vector = Vec2d if batch is Vec2dArray else Vec3d
+	dims = 2 if batch is Vec2dArray else 3
+	return batch([vector(*(rng.uniform(-5, 5) for _ in range(dims))) for _ in range(count)])
+
+
+def _columns(result):
+	return [list(column) for column in result.columns] if hasattr(result, 'columns') else list(result)
+
+
+CALLS = {
+	'add': lambda a, b, backend: a.add(b, backend=backend),
+	'sub(scalar)': lambda a, b, backend: a.sub(1.5, backend=backend),
+	'mult': lambda a, b, backend: a.mult(b, backend=backend),
+	'div': lambda a, b, backend: a.div(b, backend=backend),
+	'lerp': lambda a, b, backend: a.lerp(b, t=0.3, backend=backend),
+	'madd': lambda a, b, backend: a.madd(b, 0.016, backend=backend),
+	'dot': lambda a, b, backend: a.dot(b, backend=backend),
+	'get_magnitude': lambda a, b, backend: a.get_magnitude(backend=backend),
+	'normalised': lambda a, b, backend: a.normalised(backend=backend),
+}
+
+
+@pytest.mark.parametrize('batch', [Vec2dArray, Vec3dArray])
+@pytest.mark.parametrize('call', list(CALLS))
+def test_array_backend_matches_python_exactly(batch, call):
+	a, b = _batch(batch, 50, 1), _batch(batch, 50, 2)
+	expected = _columns(CALLS[call](a, b, 'python'))
+
+	assert _columns(CALLS[call](a, b, 'array')) == expected
+	assert _columns(a) == _columns(_batch(batch, 50, 1))  # inputs untouched
+
+
+@pytest.mark.parametrize('backend', ['python', 'array'])
+def test_in_place_and_edge_cases(backend):
+	a = _batch(Vec3dArray, 20)
+	expected = a.add(a, backend='python')
+	a.iadd(a, backend=backend)
+	assert _columns(a) == _columns(expected)
+
+	zero = Vec2dArray([Vec2d(0, 0), Vec2d(3, 4)])
+	zero.normalise(backend=backend)
+	assert _columns(zero) == [[0, 0.6], [0, 0.8]]
+
+	with pytest.raises(ZeroDivisionError):
+		Vec2dArray([Vec2d(1, 1)]).div(Vec2dArray([Vec2d(0, 1)]), backend=backend)
+	with pytest.raises(ZeroDivisionError):
+		Vec2dArray([Vec2d(1, 1)]).div(0, backend=backend)
+
+
+def test_default_and_registry():
+	assert backends.default() == backends.DEFAULT
+	assert {'python', 'array'} <= set(backends.available())
+
+	try:
+		backends.set_default('python')
+		assert backends.get() is backends.get('python')
+	finally:
+		backends.set_default(backends.DEFAULT)
+
+	with pytest.raises(ValueError):
+		backends.get('fortran')
+	with pytest.raises(ValueError):
+		backends.set_default('fortran')
+	assert backends.default() == backends.DEFAULT
+
+
+def test_registered_objects():
+	python = backends.get('python')
+	backends.register('custom', python)
+	try:
+		a = _batch(Vec2dArray, 5)
+		assert _columns(a.add(1, backend='custom')) == _columns(a.add(1, backend='python'))
+	finally:
+		backends._modules.pop('custom')
+		backends._loaded.pop('custom', None)
+
+
+def test_numpy_is_reported_missing_when_not_installed(monkeypatch):
+	import sys
+	monkeypatch.setitem(sys.modules, 'numpy', None)
+	monkeypatch.delitem(sys.modules, 'vector.backends.numpy_backend', raising=False)
+	monkeypatch.delitem(backends._loaded, 'numpy', raising=False)
+
+	with pytest.raises(ImportError, match='pip install numpy'):
+		backends.get('numpy')
+	assert 'numpy' not in backends.available()
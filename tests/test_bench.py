@@ -0,0 +1,32 @@
+import os
+import pytest
+from vector import bench
+
+
+@pytest.fixture(scope='module')
+def cleanup():
+	yield
+	for executor in bench._executors.values():
+		executor.close()
+	for path in (bench._scratch, bench._scratch_csv):
+		if os.path.exists(path):
+			os.remove(path)
+
+
+@pytest.mark.parametrize('name', list(bench.CASES))
+def test_every_case_runs(name, cleanup):
+	bench.CASES[name](3)()
+
+
+def test_run_reports_every_size():
+	result = bench.run(['Vec2d.add'], sizes=(1, 5), repeat=1)
+
+	assert set(result['results']['Vec2d.add']) == {'1', '5'}
+	assert result['meta']['sizes'] == [1, 5]
+
+
+def test_compare_flags_slower_cases_only():
+	baseline = {'results': {'a': {'10': 1.0}, 'b': {'10': 1.0}, 'gone': {'10': 1.0}}}
+	current = {'results': {'a': {'10': 1.05}, 'b': {'10': 1.5}, 'new': {'10': 9.0}}}
+
+	assert bench.compare(current, baseline, threshold=0.1) == [('b', 10, 1.0, 1.5, 1.5)]
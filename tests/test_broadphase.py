@@ -0,0 +1,69 @@
+import random
+import pytest
+from vector import Vec2d, Vec2dArray
+from vector.broadphase import SweepAndPrune
+
+
+def _boxes(count, seed=0, spread=100):
+	rng = random.Random(seed)
+	return [(Vec2d(rng.uniform(0, spread), rng.uniform(0, spread / 3)), Vec2d(rng.uniform(1, 8), rng.uniform(1, 8))) for _ in range(count)]
+
+
+def _brute_pairs(boxes):
+	found = set()
+	for a, (pa, sa) in boxes.items():
+		for b, (pb, sb) in boxes.items():
+			if a < b and pa.x < pb.x + sb.x and pb.x < pa.x + sa.x and pa.y < pb.y + sb.y and pb.y < pa.y + sa.y:
+				found.add((a, b))
+	return found
+
+
+def _pairs(broadphase):
+	pairs = broadphase.pairs()
+	normalised = {tuple(sorted(pair)) for pair in pairs}
+	assert len(normalised) == len(pairs)  # every pair once
+	return normalised
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_pairs_match_brute_force(seed):
+	boxes = _boxes(200, seed)
+	assert _pairs(SweepAndPrune.from_boxes(boxes)) == _brute_pairs(dict(enumerate(boxes)))
+
+
+def test_update_move_and_remove_match_brute_force():
+	boxes = dict(enumerate(_boxes(150, 3)))
+	broadphase = SweepAndPrune.from_boxes(boxes.values())
+	broadphase.pairs()
+
+	rng = random.Random(4)
+	for _ in range(5):
+		positions = [boxes[item][0].add(rng.uniform(-3, 3), rng.uniform(-3, 3)) for item in broadphase.items]
+		broadphase.update(Vec2dArray(positions))
+		for item, position in zip(broadphase.items, positions):
+			boxes[item] = (position, boxes[item][1])
+		assert _pairs(broadphase) == _brute_pairs(boxes)
+
+	for item in rng.sample(sorted(boxes), 40):
+		broadphase.remove(item)
+		del boxes[item]
+	item = next(iter(boxes))
+	boxes[item] = (Vec2d(50, 10), Vec2d(30, 30))
+	broadphase.move(item, *boxes[item])
+
+	assert _pairs(broadphase) == _brute_pairs(boxes)
+	assert [v.as_floats() for v in broadphase.box(item)] == [[50, 10], [30, 30]]
+
+
+def test_touching_edges_do_not_overlap():
+	broadphase = SweepAndPrune()
+	broadphase.insert('a', (0, 0), (10, 10))
+	broadphase.insert('b', (10, 0), (10, 10))
+	broadphase.insert('c', (5, 5), (1, 1))
+
+	assert _pairs(broadphase) == {('a', 'c')}
+	with pytest.raises(KeyError):
+		broadphase.insert('a', (0, 0), (1, 1))
+
+	broadphase.clear()
+	assert broadphase.pairs() == []
@@ -0,0 +1,69 @@
+import random
+import pytest
+from vector import Color, ColorBuffer
+
+
+def _colors(count, seed=0):
+	rng = random.Random(seed)
+	return [Color(rng.randrange(256), rng.randrange(256), rng.randrange(256)) for _ in range(count)]
+
+
+def test_round_trip():
+	colors = _colors(12)
+	buffer = ColorBuffer.from_colors(colors)
+
+	assert len(buffer) == 12
+	assert [c.get() for c in buffer] == [c.get() for c in colors]
+	assert ColorBuffer.from_bytes(bytes(buffer.data), 4, 3).data == buffer.data
+
+
+@pytest.mark.parametrize('method', ['add', 'sub', 'mult', 'lerp'])
+def test_matches_single_colors(method):
+	a, b = _colors(30, 1), _colors(30, 2)
+	result = getattr(ColorBuffer.from_colors(a), method)(ColorBuffer.from_colors(b))
+
+	for got, x, y in zip(result, a, b):
+		assert got.get() == getattr(x, method)(y).get()
+
+
+def test_one_color_for_every_pixel_clamps():
+	colors = _colors(20)
+	buffer = ColorBuffer.from_colors(colors)
+	buffer.iadd(Color(100, 0, 200))
+
+	assert [c.get() for c in buffer] == [c.add(Color(100, 0, 200)).get() for c in colors]
+
+
+def test_fill_and_clear():
+	buffer = ColorBuffer(3, 2)
+	buffer.fill(1, 2, 3)
+	assert bytes(buffer.data) == bytes([1, 2, 3]) * 6
+
+	buffer.clear()
+	assert bytes(buffer.data) == bytes(18)
+
+
+def test_index_out_of_range():
+	buffer = ColorBuffer.from_colors(_colors(3))
+	for index in (3, -4, 10, -10):
+		with pytest.raises(IndexError):
+			buffer[index]
+		with pytest.raises(IndexError):
+			buffer[index] = Color(1, 2, 3)
+
+	assert len(buffer.data) == 9
+
+
+def test_setitem():
+	buffer = ColorBuffer(3)
+	buffer[-1] = (4, 5, 6)
+	buffer[0] = Color(1, 1, 1)
+
+	assert list(buffer.data) == [1, 1, 1, 0, 0, 0, 4, 5, 6]
+
+
+def test_length_mismatch():
+	with pytest.raises(ValueError):
+		ColorBuffer(3).add(ColorBuffer(4))
+	with pytest.raises(ValueError):
+		ColorBuffer.from_bytes(bytes(5), 2)
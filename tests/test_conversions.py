@@ -0,0 +1,39 @@
+import colorsys
+import random
+from vector import Color
+from vector import conversions
+
+
+def test_hex_round_trip():
+	for value in range(256):
+		text = conversions.rgb_to_hex(value, 255 - value, value // 2)
+		assert conversions.hex_to_rgb(text) == (value, 255 - value, value // 2)
+		assert conversions.hex_to_rgb('#' + text.lower()) == (value, 255 - value, value // 2)
+
+	assert conversions.hex_to_rgb('aB10fF') == (0xAB, 0x10, 0xFF)
+	assert Color.from_hex('#102030').get() == [16, 32, 48]
+	assert Color(16, 32, 48).as_hex() == '102030'
+
+
+def test_hsv_table_matches_direct_computation():
+	for h in range(0, 360, 7):
+		for s in range(0, 101, 9):
+			assert conversions.hsv_to_rgb(h, s, 80) == conversions.hsv_to_rgb(float(h), float(s), 80)
+
+
+def test_hsv_matches_colorsys():
+	rng = random.Random(0)
+	for _ in range(500):
+		h, s, v = rng.randrange(360), rng.randrange(101), rng.randrange(101)
+		expected = colorsys.hsv_to_rgb(h / 360, s / 100, v / 100)
+		got = conversions.hsv_to_rgb(h, s, v)
+		assert all(abs(a - b * 255) <= 1 for a, b in zip(got, expected))
+
+
+def test_rgb_to_hsv_cache_is_transparent():
+	conversions.cache_clear()
+	rng = random.Random(1)
+	colors = [(rng.randrange(256), rng.randrange(256), rng.randrange(256)) for _ in range(200)]
+
+	assert [conversions.rgb_to_hsv(*c) for c in colors * 2] == [conversions._rgb_to_hsv(*c) for c in colors * 2]
+	assert conversions.cache_info()['rgb_to_hsv'].hits >= 200
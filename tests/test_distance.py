@@ -0,0 +1,53 @@
+import random
+import pytest
+from vector import Vec2d, Vec3d, Vec2dArray, Vec3dArray
+from vector.distance import pairwise_distances, pairwise_topk
+
+
+def _points(count, seed=0):
+	rng = random.Random(seed)
+	return [Vec3d(rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(count)]
+
+
+def _matrix(blocks):
+	rows = []
+	for start, block in blocks:
+		assert start == len(rows)
+		rows.extend(list(row) for row in block)
+	return rows
+
+
+@pytest.mark.parametrize('chunk_size', [None, 1, 7, 100])
+def test_matrix_matches_brute_force(chunk_size):
+	a, b = _points(23, 1), _points(17, 2)
+	rows = _matrix(pairwise_distances(Vec3dArray(a), b, chunk_size=chunk_size))
+
+	assert len(rows) == 23
+	for row, p in zip(rows, a):
+		assert row == pytest.approx([p.dist_sqrt(q) for q in b])
+
+
+def test_squared_2d():
+	a = [Vec2d(1, 2), Vec2d(-3, 0.5)]
+	b = Vec2dArray([Vec2d(0, 0), Vec2d(4, 4), Vec2d(-1, 1)])
+	rows = _matrix(pairwise_distances(a, b, squared=True))
+
+	assert rows == [[p.dist(q) for q in b.as_list()] for p in a]
+
+
+def test_topk_matches_brute_force():
+	a, b = _points(15, 3), _points(40, 4)
+	for found, p in zip(pairwise_topk(a, b, 5), a):
+		expected = sorted((p.dist_sqrt(q), j) for j, q in enumerate(b))[:5]
+		assert [(d, j) for j, d in found] == pytest.approx(expected)
+
+
+def test_empty_inputs():
+	assert list(pairwise_distances([], _points(3))) == []
+	assert list(pairwise_distances(Vec3dArray(), _points(3))) == []
+	assert list(pairwise_topk(_points(3), Vec3dArray(), 2)) == []
+
+
+def test_dimension_mismatch():
+	with pytest.raises(ValueError):
+		list(pairwise_distances([Vec2d(1, 1)], [Vec3d(1, 1, 1)]))
@@ -0,0 +1,50 @@
+import random
+import pytest
+from vector import Color
+from vector.gradient import Gradient
+
+
+def test_rgb_table_is_color_lerp():
+	gradient = Gradient([Color.BLACK, Color.RED, (255, 255, 255)], size=101)
+
+	for i in range(101):
+		t = i / 100
+		if t <= 0.5:
+			expected = Color(Color.BLACK).lerp(Color(Color.RED), t=t / 0.5)
+		else:
+			expected = Color(Color.RED).lerp(Color(255, 255, 255), t=(t - 0.5) / 0.5)
+		assert gradient[i].get() == expected.get()
+
+
+def test_map_matches_color_at():
+	gradient = Gradient([(0.0, Color.BLUE), (0.8, Color.GREEN), (1.0, Color.RED)], size=64, space='hsv')
+	rng = random.Random(0)
+	values = [rng.uniform(-30, 60) for _ in range(200)]
+	pixels = gradient.map(values, low=-20, high=45, width=20, height=10)
+
+	assert (pixels.width, pixels.height) == (20, 10)
+	assert [c.get() for c in pixels] == [gradient.color_at(v, -20, 45).get() for v in values]
+
+
+def test_values_outside_take_the_end_colors():
+	gradient = Gradient([Color.BLACK, Color.YELLOW])
+
+	assert gradient.color_at(-5).get() == [0, 0, 0]
+	assert gradient.color_at(5).get() == list(Color.YELLOW)
+	assert gradient.indices([-1, 0, 0.5, 1, 2]) == [0, 0, 128, 255, 255]
+
+
+def test_hsv_takes_the_shorter_arc():
+	gradient = Gradient([Color(255, 0, 32), Color(255, 32, 0)], size=3, space='hsv')
+	h = gradient[1].as_hsv()[0]
+
+	assert h < 10 or h > 350
+
+
+def test_invalid_gradients():
+	with pytest.raises(ValueError):
+		Gradient([])
+	with pytest.raises(ValueError):
+		Gradient([Color.RED], size=1)
+	with pytest.raises(ValueError):
+		Gradient([Color.RED], space='lab')
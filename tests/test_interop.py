@@ -0,0 +1,57 @@
+import sys
+import pytest
+from vector import Vec2d, Vec3d, Color, Vec2dArray, Vec3dArray, ColorBuffer
+from vector import interop
+
+
+@pytest.fixture
+def np():
+	return pytest.importorskip('numpy')
+
+
+def test_requires_numpy(monkeypatch):
+	monkeypatch.setitem(sys.modules, 'numpy', None)
+	with pytest.raises(ImportError, match='pip install numpy'):
+		interop.to_numpy(Vec2d(1, 2))
+
+
+def test_batch_columns_are_shared(np):
+	batch = Vec3dArray([Vec3d(1, 2, 3), Vec3d(4, 5, 6)])
+	xs, ys, zs = interop.to_numpy(batch)
+	xs[0] = 10
+	batch.zs[1] = 60
+
+	assert batch[0].x == 10
+	assert zs[1] == 60
+
+
+def test_from_numpy_is_zero_copy(np):
+	points = np.arange(12, dtype=np.float64).reshape(6, 2)
+	batch = interop.from_numpy(points[:, 0].copy(), points[:, 1].copy())
+	assert isinstance(batch, Vec2dArray)
+
+	xs = np.arange(4, dtype=np.float64)
+	batch = interop.from_numpy(xs, xs * 2, xs * 3)
+	batch.iadd(1)
+	assert list(xs) == [1, 2, 3, 4]
+
+
+def test_pixels_round_trip(np):
+	pixels = np.zeros((2, 3, 3), dtype=np.uint8)
+	buffer = interop.from_numpy(pixels)
+	buffer[4] = Color(1, 2, 3)
+
+	assert isinstance(buffer, ColorBuffer)
+	assert list(pixels[1, 1]) == [1, 2, 3]
+	assert interop.to_numpy(buffer).shape == (2, 3, 3)
+
+
+def test_conversions_need_copy(np):
+	with pytest.raises(TypeError):
+		interop.from_numpy(np.arange(3, dtype=np.float32), np.arange(3, dtype=np.float32))
+
+	batch = interop.from_numpy(np.arange(3, dtype=np.float32), np.arange(3, dtype=np.float32), copy=True)
+	assert batch[2].as_floats() == [2, 2]
+
+	with pytest.raises(ValueError):
+		interop.from_numpy(np.arange(3.0), np.arange(4.0))
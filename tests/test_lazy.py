@@ -0,0 +1,53 @@
+import random
+import pytest
+from vector import Vec2d, Vec3d, Vec2dArray, Vec3dArray
+from vector.lazy import lazy
+
+
+def _vectors(cls, count, seed=0):
+	rng = random.Random(seed)
+	return [cls(*(rng.uniform(-5, 5) for _ in range(2 if cls is Vec2d else 3))) for _ in range(count)]
+
+
+def _eager(a, b, c, d):
+	return a.add(b).mult(c).sub(d).lerp(b, t=0.3).div(2).normalised()
+
+
+def _fused(a, b, c, d):
+	return lazy(a).add(b).mult(c).sub(d).lerp(b, t=0.3).div(2).normalised().evaluate()
+
+
+@pytest.mark.parametrize('cls', [Vec2d, Vec3d])
+def test_single_vectors_match_eager_exactly(cls):
+	for a, b, c, d in zip(*(_vectors(cls, 20, seed) for seed in range(4))):
+		assert _fused(a, b, c, d).as_floats() == _eager(a, b, c, d).as_floats()
+
+
+@pytest.mark.parametrize('cls, batch', [(Vec2d, Vec2dArray), (Vec3d, Vec3dArray)])
+def test_batches_match_eager_exactly(cls, batch):
+	a, b, c, d = (_vectors(cls, 30, seed) for seed in range(4))
+	fused = _fused(batch(a), batch(b), c[0], batch(d))
+
+	assert [v.as_floats() for v in fused.as_list()] == [_eager(*args).as_floats() for args in zip(a, b, [c[0]] * 30, d)]
+
+
+def test_constants_and_reevaluation():
+	v = Vec2d(1, 2)
+	expression = lazy(v).add(3).mult([2, 0.5]).sub(1, 1)
+	assert expression.evaluate().as_floats() == v.add(3).mult([2, 0.5]).sub(1, 1).as_floats()
+
+	v.set(10, 20)
+	assert expression.evaluate().as_floats() == [25, 10.5]
+
+
+def test_zero_vector_passes_through_normalised():
+	assert lazy(Vec3d()).normalised().evaluate().as_floats() == [0, 0, 0]
+
+
+def test_invalid_expressions():
+	with pytest.raises(TypeError):
+		lazy([1, 2])
+	with pytest.raises(TypeError):
+		lazy(Vec2d(1, 2)).add(Vec3d(1, 2, 3)).evaluate()
+	with pytest.raises(ValueError):
+		lazy(Vec2dArray(_vectors(Vec2d, 3))).add(Vec2dArray(_vectors(Vec2d, 4))).evaluate()
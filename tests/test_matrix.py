@@ -0,0 +1,74 @@
+import random
+import pytest
+from vector import Vec2d, Vec3d, Vec2dArray, Vec3dArray, Mat3, Mat4
+
+
+def _vectors(count, seed=0):
+	rng = random.Random(seed)
+	return [Vec3d(rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(count)]
+
+
+def _close(a, b):
+	return a.as_floats() == pytest.approx(b.as_floats())
+
+
+def test_rotations_match_vector_rotations():
+	for matrix, axis in ((Mat4.rotation_x(0.4), 'rotate_x'), (Mat4.rotation_y(0.4), 'rotate_y'), (Mat4.rotation_z(0.4), 'rotate_z')):
+		for v in _vectors(5):
+			expected = v.copy()
+			getattr(expected, axis)(0.4)
+			assert _close(matrix.transform(v), expected)
+
+
+def test_composition_applies_right_to_left():
+	model = Mat4.translation(1, 2, 3) @ Mat4.rotation_y(0.5) @ Mat4.scale(2)
+	for v in _vectors(5):
+		step = Mat4.scale(2).transform(v)
+		step = Mat4.rotation_y(0.5).transform(step)
+		assert _close(model.transform(v), Mat4.translation(1, 2, 3).transform(step))
+
+
+def test_inverse():
+	model = Mat4.translation(1, -2, 3) @ Mat4.rotation_x(0.3) @ Mat4.scale(2, 3, 4)
+	product = model @ model.inverse()
+	assert product.m == pytest.approx(Mat4().m)
+
+	with pytest.raises(ValueError):
+		Mat3(1, 2, 3, 2, 4, 6, 0, 0, 1).inverse()
+
+
+def test_mat3_affine_2d():
+	transform = Mat3.translation(5, -1) @ Mat3.rotation(0.25)
+	v = Vec2d(3, 4)
+	expected = v.copy()
+	expected.rotate(0.25)
+
+	assert _close(transform @ v, expected.add(5, -1))
+
+
+def test_batches_match_single_vectors():
+	vectors = _vectors(20)
+	model = Mat4.perspective(1.0, 1.5, 0.1, 100) @ Mat4.translation(0, 0, -20)
+
+	batch = model.transform_all(Vec3dArray(vectors))
+	for got, v in zip(batch.as_list(), vectors):
+		assert _close(got, model.transform(v))
+
+	flat = [Vec2d(v.x, v.y) for v in vectors]
+	batch = Vec2dArray(flat)
+	Mat3.rotation(0.5).itransform_all(batch)
+	for got, v in zip(batch.as_list(), flat):
+		assert _close(got, Mat3.rotation(0.5).transform(v))
+
+
+def test_invalid_operands():
+	with pytest.raises(TypeError):
+		Mat3().multiply(Mat4())
+	with pytest.raises(TypeError):
+		Mat4().multiply(Mat3())
+	with pytest.raises(TypeError):
+		Mat4() @ Mat3()
+	with pytest.raises(TypeError):
+		Mat4().transform(Vec2d(1, 2))
+	with pytest.raises(TypeError):
+		Mat3(1, 2, 3)
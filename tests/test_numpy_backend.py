@@ -0,0 +1,83 @@
+import random
+from array import array
+import pytest
+from vector import Vec2d, Vec3d, Vec2dArray, Vec3dArray
+from vector import backends
+
+np = pytest.importorskip('numpy')
+
+
+def _columns(count, dims, seed=0):
+	rng = random.Random(seed)
+	return [array('d', [rng.uniform(-5, 5) for _ in range(count)]) for _ in range(dims)]
+
+
+def _lists(columns):
+	return [list(column) for column in columns]
+
+
+KERNELS = {
+	'add': lambda k, a, b: k.arith('add', a, b),
+	'sub': lambda k, a, b: k.arith('sub', a, b),
+	'mul': lambda k, a, b: k.arith('mul', a, b),
+	'div': lambda k, a, b: k.arith('div', a, b),
+	'add(scalar)': lambda k, a, b: k.arith('add', a, [1.5] * len(a)),
+	'div(scalar)': lambda k, a, b: k.arith('div', a, [0.25] * len(a)),
+	'lerp': lambda k, a, b: k.lerp(a, b, 0.3),
+	'madd': lambda k, a, b: k.madd(a, b, 0.016),
+	'dot': lambda k, a, b: [k.dot(a, b)],
+	'magnitude': lambda k, a, b: [k.magnitude(a)],
+	'normalise': lambda k, a, b: k.normalise(a),
+}
+
+
+@pytest.mark.parametrize('dims', [2, 3])
+@pytest.mark.parametrize('kernel', list(KERNELS))
+@pytest.mark.parametrize('wrap', [list, lambda columns: [memoryview(c) for c in columns]], ids=['array', 'memoryview'])
+def test_kernels_match_the_array_backend(dims, kernel, wrap):
+	a, b = _columns(40, dims, 1), _columns(40, dims, 2)
+	expected = _lists(KERNELS[kernel](backends.get('array'), a, b))
+	result = KERNELS[kernel](backends.get('numpy'), wrap(a), wrap(b))
+
+	assert all(type(column) is array and column.typecode == 'd' for column in result)
+	assert _lists(result) == expected
+	assert _lists(a) == _lists(_columns(40, dims, 1))  # inputs untouched
+
+
+@pytest.mark.parametrize('batch, vector', [(Vec2dArray, Vec2d), (Vec3dArray, Vec3d)])
+def test_batch_methods_match_the_array_backend(batch, vector):
+	rng = random.Random(3)
+	dims = 2 if vector is Vec2d else 3
+	a = batch([vector(*(rng.uniform(-5, 5) for _ in range(dims))) for _ in range(30)])
+	a.append(vector())
+
+	for call in (
+		lambda backend: a.add(a, backend=backend),
+		lambda backend: a.madd(vector(*range(dims)), 0.5, backend=backend),
+		lambda backend: a.normalised(backend=backend),
+	):
+		assert _lists(call('numpy').columns) == _lists(call('array').columns)
+	assert list(a.get_magnitude(backend='numpy')) == list(a.get_magnitude(backend='array'))
+
+	b = a.copy()
+	b.iadd(a, backend='numpy')
+	assert _lists(b.columns) == _lists(a.mult(2, backend='array').columns)
+
+
+def test_division_by_zero_raises():
+	with pytest.raises(ZeroDivisionError):
+		Vec2dArray([Vec2d(1, 1)]).div(Vec2dArray([Vec2d(0, 1)]), backend='numpy')
+	with pytest.raises(ZeroDivisionError):
+		Vec2dArray([Vec2d(1, 1)]).div(0, backend='numpy')
+	with pytest.raises(ValueError):
+		backends.get('numpy').arith('pow', _columns(2, 2), _columns(2, 2))
+
+
+def test_available_and_default():
+	assert 'numpy' in backends.available()
+	try:
+		backends.set_default('numpy')
+		a = Vec3dArray([Vec3d(3, 4, 0)])
+		assert _lists(a.normalised().columns) == [[0.6], [0.8], [0.0]]
+	finally:
+		backends.set_default(backends.DEFAULT)
@@ -0,0 +1,66 @@
+import pytest
+from vector import Vec2d, Vec3d, Color, Vec2dArray, Vec3dArray, ColorBuffer
+
+
+@pytest.mark.parametrize('a, b', [
+	(Vec2d(1.5, -2), Vec2d(4, 0.25)),
+	(Vec3d(1.5, -2, 3), Vec3d(4, 0.25, -1)),
+	(Color(10, 200, 30), Color(40, 80, 250)),
+])
+@pytest.mark.parametrize('method', ['add', 'sub', 'mult', 'lerp'])
+def test_out_matches_a_new_result(a, b, method):
+	expected = getattr(a, method)(b)
+	out = type(a)()
+
+	assert getattr(a, method)(b, out=out) is out
+	assert repr(out) == repr(expected)
+
+
+def test_out_may_alias_an_operand():
+	a, b = Vec2d(1, 2), Vec2d(3, 4)
+	a.add(b, out=b)
+	assert b.as_floats() == [4, 6]
+
+	v = Vec3d(0, 3, 4)
+	v.normalised(out=v)
+	assert v.as_floats() == pytest.approx([0, 0.6, 0.8])
+
+	c = Vec3d(1, 0, 0)
+	c.cross_product(Vec3d(0, 1, 0), out=c)
+	assert c.as_floats() == [0, 0, 1]
+
+
+def test_madd():
+	position, velocity = Vec2d(1, 1), Vec2d(2, -4)
+	assert position.madd(velocity, 0.5).as_floats() == [2, -1]
+
+	position.imadd(velocity, 0.5)
+	assert position.as_floats() == [2, -1]
+	assert Color(10, 10, 10).madd(Color(100, 0, 250), 2).get() == [210, 10, 255]
+
+
+@pytest.mark.parametrize('batch, single', [
+	(Vec2dArray([Vec2d(1, 2), Vec2d(-3, 4)]), Vec2d(0.5, 2)),
+	(Vec3dArray([Vec3d(1, 2, 3), Vec3d(-3, 4, 0)]), Vec3d(0.5, 2, -1)),
+])
+def test_batch_out(batch, single):
+	out = batch.copy()
+	out.clear()
+
+	assert batch.madd(single, 2, out=out) is out
+	assert [v.as_floats() for v in out.as_list()] == [v.madd(single, 2).as_floats() for v in batch.as_list()]
+
+	batch.add(batch, out=batch)
+	assert [v.as_floats() for v in batch.as_list()] == [v.mult(2).as_floats() for v in batch.copy().mult(0.5).as_list()]
+
+	with pytest.raises(ValueError):
+		batch.add(single, out=type(batch)())
+
+
+def test_color_buffer_out():
+	buffer = ColorBuffer.from_colors([Color(10, 20, 30), Color(250, 0, 5)])
+	out = ColorBuffer(2)
+
+	assert buffer.add(Color(10, 10, 10), out=out) is out
+	assert [c.get() for c in out] == [[20, 30, 40], [255, 10, 15]]
+	assert [c.get() for c in buffer] == [[10, 20, 30], [250, 0, 5]]
@@ -0,0 +1,65 @@
+import random
+import pytest
+from math import sqrt
+from vector import Color, ColorBuffer
+from vector.palette import Palette
+
+
+def _distance(a, b):
+	return sqrt(sum((x - y)**2 for x, y in zip(a.get(), b.get())))
+
+
+def _pixels(count, seed=0):
+	rng = random.Random(seed)
+	return ColorBuffer.from_colors([Color(rng.randrange(256), rng.randrange(256), rng.randrange(256)) for _ in range(count)])
+
+
+def test_index_of_is_exact():
+	palette = Palette.from_constants()
+	for pixel in _pixels(300):
+		best = min(_distance(pixel, entry) for entry in palette)
+		assert _distance(pixel, palette.nearest(pixel)) == best
+
+
+@pytest.mark.parametrize('bits', [3, 5])
+def test_cube_is_within_one_cell_of_exact(bits):
+	palette = Palette([Color.BLACK, Color.RED, Color.GREEN, Color.BLUE, (255, 255, 255), Color.GREY, Color.ORANGE], bits)
+	pixels = _pixels(500, 1)
+	diagonal = sqrt(3) * (1 << (8 - bits))
+
+	for pixel, index in zip(pixels, palette.indices(pixels)):
+		assert _distance(pixel, palette[index]) <= _distance(pixel, palette.nearest(pixel)) + diagonal
+
+
+def test_quantize_writes_palette_colors():
+	palette = Palette([Color.BLACK, (255, 255, 255), Color.RED])
+	pixels = _pixels(64, 2)
+	pixels.width, pixels.height = 8, 8
+
+	for dither in (0, True, 40):
+		result = palette.quantize(pixels, dither)
+		indices = palette.indices(pixels, dither)
+		assert (result.width, result.height) == (8, 8)
+		assert [c.get() for c in result] == [palette[i].get() for i in indices]
+
+	copy = pixels.copy()
+	palette.iquantize(copy)
+	assert copy.data == palette.quantize(pixels).data
+
+
+def test_dithering_mixes_entries_over_flat_areas():
+	palette = Palette([Color.BLACK, (255, 255, 255)])
+	grey = ColorBuffer(8, 8)
+	grey.fill(128, 128, 128)
+
+	assert len(set(palette.indices(grey))) == 1
+	assert set(palette.indices(grey, dither=True)) == {0, 1}
+
+
+def test_invalid_palettes():
+	with pytest.raises(ValueError):
+		Palette([])
+	with pytest.raises(ValueError):
+		Palette([Color.RED] * 257)
+	with pytest.raises(ValueError):
+		Palette([Color.RED], bits=9)
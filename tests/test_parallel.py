@@ -0,0 +1,72 @@
+import random
+import pytest
+from vector import Vec2d, Vec3d, Vec2dArray, Vec3dArray
+from vector.parallel import ParallelExecutor, parallel_apply
+
+
+def _batch(count, seed=0):
+	rng = random.Random(seed)
+	return Vec3dArray([Vec3d(rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(count)])
+
+
+def _floats(batch):
+	return [v.as_floats() for v in batch.as_list()]
+
+
+def scale_shard(shard, factor):
+	# top-level so the worker processes can unpickle it
+	shard.imult(factor)
+
+
+@pytest.fixture(scope='module')
+def executor():
+	with ParallelExecutor(workers=2, min_shard=8) as executor:
+		yield executor
+
+
+def test_method_matches_serial(executor):
+	points = _batch(100)
+	expected = points.copy()
+	expected.rotate_z(0.3)
+
+	executor.apply(points, 'rotate_z', 0.3)
+	assert _floats(points) == _floats(expected)
+
+
+def test_sharded_batch_arguments_and_callables(executor):
+	points, targets = _batch(64, 1), _batch(64, 2)
+	expected = points.lerp(targets, t=0.25)
+	expected.imult(2)
+
+	shared = executor.share(points)
+	executor.apply(shared, 'ilerp', targets, t=0.25)
+	executor.apply(shared, scale_shard, 2)
+	assert _floats(shared) == _floats(expected)
+
+	executor.release(shared)
+	assert _floats(shared) == _floats(expected)
+
+
+def test_lists_are_updated_in_place(executor):
+	vectors = [Vec2d(i, -i) for i in range(40)]
+	executor.apply(vectors, 'iadd', 1, 2)
+
+	assert [v.as_floats() for v in vectors] == [[i + 1, 2 - i] for i in range(40)]
+
+
+def test_small_batches_run_inline():
+	points = _batch(10)
+	expected = points.add(1)
+
+	assert _floats(parallel_apply(points, 'iadd', 1, workers=4)) == _floats(expected)
+
+
+def test_release_rejects_batches_it_did_not_share(executor):
+	points = Vec2dArray([Vec2d(1, 2)])
+	with pytest.raises(ValueError):
+		executor.release(points)
+
+	shared = executor.share(points)
+	executor.release(shared)
+	with pytest.raises(ValueError):
+		executor.release(shared)
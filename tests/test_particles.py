@@ -0,0 +1,83 @@
+import random
+import pytest
+from vector import Vec2d, Vec3d, Vec2dArray
+from vector.particles import Particles
+
+
+def _vectors(count, seed=0):
+	rng = random.Random(seed)
+	return [Vec2d(rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(count)]
+
+
+def _lengths(particles):
+	return {len(particles.positions), len(particles.velocities), len(particles.accelerations), len(particles)}
+
+
+def test_step_matches_the_per_particle_loop():
+	positions, velocities = _vectors(50, 1), _vectors(50, 2)
+	particles = Particles(2)
+	particles.emit_batch(positions, Vec2dArray(velocities), Vec2d(0, -0.5))
+
+	for _ in range(5):
+		particles.step(max_speed=3)
+		for p, v in zip(positions, velocities):
+			v.iadd(Vec2d(0, -0.5))
+			v.clamp(3)
+			p.iadd(v)
+
+	assert [v.as_floats() for v in particles.positions.as_list()] == [p.as_floats() for p in positions]
+	assert [v.as_floats() for v in particles.velocities.as_list()] == [v.as_floats() for v in velocities]
+
+
+def test_verlet_with_constant_acceleration():
+	particles = Particles(3)
+	particles.emit(Vec3d(0, 0, 0), Vec3d(1, 2, 0), Vec3d(0, 0, -2))
+	dt = 0.5
+
+	x, v = [0.0, 0.0, 0.0], [1.0, 2.0, 0.0]
+	previous = [a - b * dt for a, b in zip(x, v)]
+	for _ in range(4):
+		particles.verlet(dt)
+		x, previous = [a + (a - q) + acc * dt * dt for a, q, acc in zip(x, previous, (0, 0, -2))], x
+
+	assert particles.position(0).as_floats() == pytest.approx(x)
+	assert particles.velocity(0).as_floats() == pytest.approx([(a - q) / dt for a, q in zip(x, previous)])
+
+
+def test_lifetimes_cull_particles():
+	particles = Particles(2)
+	particles.emit_batch(_vectors(4), lifetimes=[0.5, 1.5, 2.5, float('inf')])
+	particles.emit(Vec2d(1, 1), lifetime=1)
+
+	assert particles.step(1.0) == 2
+	assert particles.step(1.0) == 1
+	assert particles.step(1.0) == 1
+	assert len(particles) == 1 and _lengths(particles) == {1}
+
+
+def test_bad_emits_change_nothing():
+	particles = Particles(2)
+	particles.emit_batch(_vectors(3))
+
+	for emit in (
+		lambda: particles.emit_batch(_vectors(4), Vec2dArray(_vectors(3))),
+		lambda: particles.emit_batch(_vectors(4), Vec2d(1, 1), 'bad'),
+		lambda: particles.emit_batch(_vectors(4), lifetimes=[1, 2]),
+		lambda: particles.emit_batch(_vectors(4), lifetimes=['x'] * 4),
+		lambda: particles.emit(Vec2d(1, 1), 'bad'),
+		lambda: particles.emit(Vec2d(1, 1), lifetime='never'),
+	):
+		with pytest.raises((TypeError, ValueError)):
+			emit()
+		assert _lengths(particles) == {3}
+
+
+def test_views_write_through():
+	particles = Particles(2)
+	particles.emit(Vec2d(1, 2), Vec2d(1, 0))
+	particles.velocity(0).y = 5
+	particles.step()
+
+	assert particles.position(0).as_floats() == [2, 7]
+	with pytest.raises(ValueError):
+		Particles(4)
@@ -0,0 +1,99 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import pytest
+import vector
+from vector import Vec2d, Vec3d
+from vector import profiling
+
+
+@pytest.fixture(autouse=True)
+def clean():
+	profiling.reset()
+	yield
+	while profiling.is_enabled():
+		profiling.disable()
+	profiling.reset()
+
+
+def test_disabled_leaves_the_classes_untouched():
+	add = Vec2d.__dict__['add']
+	with profiling.profiled():
+		assert Vec2d.__dict__['add'] is not add
+		with profiling.profiled():
+			pass
+		assert profiling.is_enabled()
+
+	assert Vec2d.__dict__['add'] is add
+	assert not profiling.is_enabled()
+
+
+def test_counts_calls():
+	a, b = Vec2d(1, 2), Vec2d(3, 4)
+	with profiling.profiled():
+		for _ in range(5):
+			a.add(b)
+	a.add(b)
+
+	stats = profiling.stats()
+	assert stats['Vec2d.add']['calls'] == 5
+	assert stats['Vec2d.add']['seconds'] > 0
+
+
+def test_instances_per_class_and_method():
+	a, b = Vec2d(1, 2), Vec2d(3, 4)
+	with profiling.profiled():
+		for _ in range(3):
+			a.add(b)
+			a + b
+		Vec2d(0, 0)
+		Vec3d(1, 0, 0).cross_product(Vec3d(0, 1, 0))
+
+	assert profiling.instances() == {'Vec2d': 7, 'Vec3d': 3}
+	assert profiling.instances_by_method() == {
+		'Vec2d.add': {'Vec2d': 3},
+		'Vec2d.__add__': {'Vec2d': 3},
+		profiling.OUTSIDE: {'Vec2d': 1, 'Vec3d': 2},
+		'Vec3d.cross_product': {'Vec3d': 1},
+	}
+	assert profiling.stats()['Vec2d.add']['instances'] == 3
+
+
+def test_exceptions_keep_the_method_stack_balanced():
+	with profiling.profiled():
+		with pytest.raises(TypeError):
+			Vec2d(1, 2).add('bad')
+		Vec2d(1, 2)
+
+	assert profiling._running == []
+	assert profiling.instances_by_method()[profiling.OUTSIDE] == {'Vec2d': 2}
+
+
+def test_report_and_exports(tmp_path):
+	with profiling.profiled():
+		Vec2d(1, 2).add(Vec2d(3, 4))
+
+	out = io.StringIO()
+	profiling.report(file=out)
+	assert 'Vec2d.add' in out.getvalue()
+	assert 'by Vec2d.add' in out.getvalue()
+
+	profiling.export(str(tmp_path / 'profile.json'))
+	data = json.loads((tmp_path / 'profile.json').read_text())
+	assert data['instances_by_method']['Vec2d.add'] == {'Vec2d': 1}
+
+	profiling.export(str(tmp_path / 'profile.csv'))
+	lines = (tmp_path / 'profile.csv').read_text().splitlines()
+	assert lines[0] == 'method,calls,seconds,per_call,instances'
+	assert len(lines) == 1 + len(profiling.stats())
+
+
+def test_environment_variable_profiles_the_whole_run():
+	script = 'import vector; vector.Vec2d(1, 2).add(vector.Vec2d(3, 4)); print(sorted(vars(vector)))'
+	env = dict(os.environ, VECTOR_PROFILE='1', PYTHONPATH=os.path.dirname(os.path.dirname(vector.__file__)))
+	done = subprocess.run([sys.executable, '-c', script], env=env, capture_output=True, text=True, check=True)
+
+	assert 'Vec2d.add' in done.stderr
+	assert 'enable_from_environment' not in done.stdout
@@ -0,0 +1,104 @@
+import random
+from math import pi
+import pytest
+from vector import Vec3d, Vec3dArray, Quat, QuatArray
+
+
+def _angles(count, seed=0):
+	rng = random.Random(seed)
+	return [(rng.uniform(-pi, pi), rng.uniform(-pi, pi), rng.uniform(-pi, pi)) for _ in range(count)]
+
+
+def _vectors(count, seed=0):
+	rng = random.Random(seed)
+	return [Vec3d(rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(count)]
+
+
+def _quats(count, seed=0):
+	return [Quat.from_euler(*angles) for angles in _angles(count, seed)]
+
+
+def test_from_euler_matches_rotating_in_order():
+	for (x, y, z), v in zip(_angles(20, 1), _vectors(20, 2)):
+		expected = v.copy()
+		expected.rotate_x(x)
+		expected.rotate_y(y)
+		expected.rotate_z(z)
+
+		assert Quat.from_euler(x, y, z).transform(v).as_floats() == pytest.approx(expected.as_floats())
+
+
+def test_from_axis_angle_and_composition():
+	v = Vec3d(1, 2, 3)
+	assert Quat.from_axis_angle((0, 0, 5), pi / 2).transform(v).as_floats() == pytest.approx([-2, 1, 3])
+
+	a, b = _quats(2, 3)
+	assert (a * b).transform(v).as_floats() == pytest.approx(a.transform(b.transform(v)).as_floats())
+	assert (a @ v).as_floats() == a.transform(v).as_floats()
+	assert a.conjugate().transform(a.transform(v)).as_floats() == pytest.approx(v.as_floats())
+
+	with pytest.raises(ValueError):
+		Quat.from_axis_angle((0, 0, 0), 1)
+	with pytest.raises(TypeError):
+		Quat(1, 2)
+
+
+def test_transform_matches_the_matrix():
+	vectors = _vectors(30, 4)
+	for q in _quats(10, 5):
+		matrix = q.to_matrix()
+		assert [c for v in q.transform_all(vectors) for c in v.as_floats()] == pytest.approx(
+			[c for v in vectors for c in matrix.transform(v).as_floats()])
+
+		batch = Vec3dArray(vectors)
+		q.itransform_all(batch)
+		assert [c for v in batch.as_list() for c in v.as_floats()] == pytest.approx(
+			[c for v in vectors for c in q.transform(v).as_floats()])
+
+
+def test_slerp():
+	a, b = _quats(2, 6)
+	assert a.slerp(b, 0).as_floats() == pytest.approx(a.as_floats())
+	assert a.slerp(b, 1).as_floats() == pytest.approx(b.as_floats())
+	assert a.slerp(b, 0.3).get_magnitude() == pytest.approx(1)
+
+	# q and -q are the same orientation, the result stays on the short arc
+	negated = Quat(*(-c for c in b.as_floats()))
+	assert a.slerp(negated, 0.5).transform(Vec3d(1, 0, 0)).as_floats() == pytest.approx(
+		a.slerp(b, 0.5).transform(Vec3d(1, 0, 0)).as_floats())
+
+	# nearly equal orientations take the normalised lerp branch
+	near = a.multiply(Quat.from_axis_angle((1, 0, 0), 1e-4))
+	assert a.slerp(near, 0.5).get_magnitude() == pytest.approx(1)
+
+
+def test_quat_array_matches_quat_per_element():
+	a, b = _quats(25, 7), _quats(25, 8)
+	qa, qb = QuatArray(a), QuatArray(b)
+	ts = [i / 24 for i in range(25)]
+
+	assert qa.multiply(qb).as_list() == [p.multiply(q) for p, q in zip(a, b)]
+	assert qa.multiply(b[0]).as_list() == [p.multiply(b[0]) for p in a]
+	assert qa.slerp(qb, t=ts).as_list() == [p.slerp(q, t) for p, q, t in zip(a, b, ts)]
+	assert qa.conjugate().as_list() == [p.conjugate() for p in a]
+	assert list(qa.get_magnitude()) == [p.get_magnitude() for p in a]
+
+	vectors = _vectors(25, 9)
+	rotated = qa.transform_all(Vec3dArray(vectors))
+	assert [v.as_floats() for v in rotated.as_list()] == [q.transform(v).as_floats() for q, v in zip(a, vectors)]
+
+
+def test_quat_array_creation_and_errors():
+	assert QuatArray.identity(3).as_list() == [Quat()] * 3
+	assert QuatArray.from_axis_angles((0, 2, 0), [0.5, 1]).as_list() == [
+		Quat.from_axis_angle((0, 1, 0), 0.5), Quat.from_axis_angle((0, 1, 0), 1)]
+
+	out = QuatArray(_quats(3))
+	assert QuatArray(_quats(3, 1)).multiply(out, out=out) is out
+
+	with pytest.raises(ValueError):
+		QuatArray(_quats(3)).multiply(QuatArray(_quats(2)))
+	with pytest.raises(ValueError):
+		QuatArray(_quats(3)).itransform_all(Vec3dArray(_vectors(2)))
+	with pytest.raises(ValueError):
+		QuatArray.from_columns([1], [0], [0], [])
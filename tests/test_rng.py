@@ -0,0 +1,50 @@
+import random
+import pytest
+from vector.rng import VectorRandom
+
+
+def _floats(batch):
+	return [list(column) for column in batch.columns]
+
+
+def test_same_seed_same_batches():
+	a, b = VectorRandom(42), VectorRandom(42)
+
+	assert _floats(a.vec3_unit(50)) == _floats(b.vec3_unit(50))
+	assert _floats(a.in_disc(50, 3)) == _floats(b.in_disc(50, 3))
+	assert a.colors(20).data == b.colors(20).data
+	assert _floats(VectorRandom(1).vec2_pos(5)) != _floats(VectorRandom(2).vec2_pos(5))
+
+
+def test_independent_of_global_state():
+	random.seed(0)
+	first = _floats(VectorRandom(7).vec2_unit(10))
+	random.seed(1)
+	random.random()
+
+	assert _floats(VectorRandom(7).vec2_unit(10)) == first
+
+
+def test_reseed_and_spawn():
+	rng = VectorRandom(3)
+	first = _floats(rng.vec3_pos(5))
+	rng.reseed(3)
+	assert _floats(rng.vec3_pos(5)) == first
+
+	children = [_floats(child.vec2_unit(3)) for child in VectorRandom(9).spawn(4)]
+	assert children == [_floats(child.vec2_unit(3)) for child in VectorRandom(9).spawn(4)]
+	assert len({str(child) for child in children}) == 4
+
+
+def test_ranges():
+	rng = VectorRandom(5)
+
+	assert all(-1 <= v <= 1 for column in rng.vec3_unit(200).columns for v in column)
+	assert all(0 <= v <= 1 for column in rng.vec2_pos(200).columns for v in column)
+	assert all(v.get_magnitude() == pytest.approx(2) for v in rng.on_sphere(100, 2).as_list())
+	assert all(v.get_magnitude() == pytest.approx(3) for v in rng.on_circle(100, 3).as_list())
+	assert all(v.get_magnitude() <= 2 for v in rng.in_disc(200, 2).as_list())
+	assert all(v.get_magnitude() <= 2 for v in rng.in_ball(200, 2).as_list())
+
+	box = rng.vec3_uniform(200, (0, 10, -5), (1, 20, -4))
+	assert all(0 <= v.x <= 1 and 10 <= v.y <= 20 and -5 <= v.z <= -4 for v in box.as_list())
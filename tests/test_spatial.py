@@ -0,0 +1,139 @@
+import random
+import pytest
+from vector import Vec2d, Vec3d, Vec3dArray
+from vector.spatial import SpatialHash, KDTree, Octree
+
+
+def _points2(count, seed=0):
+	rng = random.Random(seed)
+	return [Vec2d(rng.uniform(-50, 50), rng.uniform(-50, 50)) for _ in range(count)]
+
+
+def _points3(count, seed=0):
+	rng = random.Random(seed)
+	return [Vec3d(rng.uniform(-50, 50), rng.uniform(-50, 50), rng.uniform(-50, 50)) for _ in range(count)]
+
+
+def _brute_nearest(points, query, k):
+	return sorted((query.dist(p), i) for i, p in enumerate(points))[:k]
+
+
+#region SpatialHash
+
+def test_grid_queries_match_brute_force():
+	points = _points2(300)
+	grid = SpatialHash.from_positions(points, 7.5)
+	query = Vec2d(3, -4)
+
+	assert sorted(grid.query_radius(query, 12)) == [i for i, p in enumerate(points) if query.dist(p) <= 144]
+	assert sorted(grid.query_box((-10, -10), (20, 5))) == [i for i, p in enumerate(points) if -10 <= p.x <= 20 and -10 <= p.y <= 5]
+	assert [(d, i) for i, d in grid.nearest(query, 5)] == _brute_nearest(points, query, 5)
+
+
+def test_grid_pairs_within_matches_brute_force():
+	points = _points2(150, 1)
+	grid = SpatialHash.from_positions(points, 4)
+	expected = {(a, b) for a in range(150) for b in range(a + 1, 150) if points[a].dist(points[b]) <= 36}
+
+	assert {tuple(sorted(pair)) for pair in grid.pairs_within(6)} == expected
+
+
+def test_grid_move_and_remove():
+	grid = SpatialHash(5)
+	grid.insert('a', 1, 1)
+	grid.insert('b', 40, 40)
+	grid.move('a', 39, 39)
+	grid.remove('b')
+
+	assert grid.query_radius((40, 40), 3) == ['a']
+	assert grid.nearest((0, 0), k=0) == []
+	with pytest.raises(KeyError):
+		grid.insert('a', 0, 0)
+
+#endregion
+
+
+#region KDTree
+
+def test_kdtree_matches_brute_force():
+	points = _points3(400)
+	tree = KDTree(points)
+	query = Vec3d(1, 2, 3)
+
+	assert [(d, i) for i, d in tree.nearest(query, 8)] == pytest.approx(_brute_nearest(points, query, 8))
+	assert sorted(tree.query_radius(query, 20)) == [i for i, p in enumerate(points) if query.dist(p) <= 400]
+	assert sorted(tree.query_box((-10, -10, -10), (10, 25, 10))) == [
+		i for i, p in enumerate(points) if -10 <= p.x <= 10 and -10 <= p.y <= 25 and -10 <= p.z <= 10
+	]
+
+
+def test_kdtree_from_batch_and_edge_cases():
+	points = _points3(50)
+	tree = KDTree(Vec3dArray(points))
+
+	assert tree.nearest(points[7])[0][0] == 7
+	assert tree.nearest(points[7], k=0) == []
+	assert len(tree.nearest(points[7], k=100)) == 50
+	assert KDTree([]).nearest((0, 0, 0)) == []
+
+#endregion
+
+
+#region Octree
+
+def test_octree_matches_brute_force():
+	points = _points3(400, 2)
+	tree = Octree((0, 0, 0), 50, capacity=4)
+	ids = tree.insert_all(points)
+	query = Vec3d(-5, 5, 0)
+
+	assert ids == list(range(400))
+	assert [(d, i) for i, d in tree.nearest(query, 6)] == pytest.approx(_brute_nearest(points, query, 6))
+	assert sorted(tree.query_radius(query, 25)) == [i for i, p in enumerate(points) if query.dist(p) <= 625]
+
+
+def test_octree_move_and_remove_match_brute_force():
+	points = _points3(200, 3)
+	tree = Octree((0, 0, 0), 50, capacity=4)
+	tree.insert_all(points)
+
+	rng = random.Random(4)
+	live = dict(enumerate(points))
+	for point in rng.sample(range(200), 60):
+		tree.remove(point)
+		del live[point]
+	for point in rng.sample(sorted(live), 60):
+		live[point] = Vec3d(rng.uniform(-50, 50), rng.uniform(-50, 50), rng.uniform(-50, 50))
+		tree.move(point, live[point])
+
+	query = Vec3d(0, 0, 0)
+	assert len(tree) == 140
+	assert sorted(tree.query_radius(query, 30)) == sorted(i for i, p in live.items() if query.dist(p) <= 900)
+	assert tree.position(next(iter(live))).as_floats() == live[next(iter(live))].as_floats()
+
+
+def test_octree_rejects_bad_ids():
+	tree = Octree((0, 0, 0), 10)
+	a = tree.insert(1, 1, 1)
+	tree.insert(2, 2, 2)
+	tree.remove(a)
+
+	for point in (a, -1, 2, 99):
+		with pytest.raises(KeyError):
+			tree.remove(point)
+		with pytest.raises(KeyError):
+			tree.move(point, 0, 0, 0)
+		with pytest.raises(KeyError):
+			tree.position(point)
+
+	assert len(tree) == 1
+	assert tree.insert(3, 3, 3) == a
+	assert sorted(tree.query_radius((0, 0, 0), 100)) == [0, 1]
+
+
+def test_octree_rejects_points_outside():
+	tree = Octree((0, 0, 0), 10)
+	with pytest.raises(ValueError):
+		tree.insert(11, 0, 0)
+
+#endregion
@@ -0,0 +1,112 @@
+import gc
+import io
+import random
+import warnings
+import pytest
+from vector import Vec2d, Vec3d, Color, Vec2dArray, Vec3dArray, ColorBuffer
+from vector import storage
+
+
+def _vectors(count, seed=0):
+	rng = random.Random(seed)
+	return [Vec3d(rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(count)]
+
+
+def _colors(count, seed=0):
+	rng = random.Random(seed)
+	return [Color(rng.randrange(256), rng.randrange(256), rng.randrange(256)) for _ in range(count)]
+
+
+@pytest.mark.parametrize('use_mmap', [True, False])
+def test_vec3d_round_trip(tmp_path, use_mmap):
+	path = str(tmp_path / 'points.vec')
+	vectors = _vectors(100)
+	assert storage.save(path, vectors) == 100
+
+	with storage.load(path, use_mmap) as f:
+		assert (f.kind, f.typecode, f.components, len(f)) == (storage.KIND_VEC3D, 'd', 3, 100)
+		assert f[-1].as_floats() == vectors[-1].as_floats()
+		assert [v.as_floats() for v in f] == [v.as_floats() for v in vectors]
+		assert [v.as_floats() for v in f.read(10, 20).as_list()] == [v.as_floats() for v in vectors[10:20]]
+		with pytest.raises(IndexError):
+			f[100]
+
+
+def test_batches_and_float32(tmp_path):
+	path = str(tmp_path / 'points.vec')
+	batch = Vec2dArray([Vec2d(0.5, -1.25), Vec2d(3, 4)])
+	storage.save(path, batch, typecode='f')
+
+	with storage.load(path) as f:
+		assert f.typecode == 'f'
+		assert [v.as_floats() for v in f.read().as_list()] == [[0.5, -1.25], [3, 4]]
+
+
+@pytest.mark.parametrize('typecode', [None, 'd'])
+def test_color_round_trip(tmp_path, typecode):
+	path = str(tmp_path / 'colors.vec')
+	colors = _colors(30)
+	storage.save(path, ColorBuffer.from_colors(colors), typecode)
+
+	with storage.load(path) as f:
+		assert [c.get() for c in f] == [c.get() for c in colors]
+		assert bytes(f.read().data) == bytes(ColorBuffer.from_colors(colors).data)
+
+
+def test_generator_of_batches(tmp_path):
+	path = str(tmp_path / 'stream.vec')
+	vectors = _vectors(10)
+	items = (item for item in [vectors[0], Vec3dArray(vectors[1:6]), *vectors[6:]])
+	assert storage.save(path, items) == 10
+
+	with storage.load(path) as f:
+		assert [v.as_floats() for v in f] == [v.as_floats() for v in vectors]
+
+
+def test_open_file_from_its_position():
+	f = io.BytesIO()
+	f.write(b'prefix')
+	storage.save(f, _vectors(3))
+	storage.save(f, _colors(2))
+
+	f.seek(6)
+	header = storage._parse_header(f.read(storage.HEADER.size), 'f')
+	assert header == (storage.KIND_VEC3D, 'd', 3, 3)
+
+
+def test_rejects_mixed_kinds():
+	for items in ([Vec2d(1, 2), Vec3d(3, 4, 5)], [Vec2d(1, 2), Vec3dArray(_vectors(2))], [Color(1, 2, 3), 5]):
+		with pytest.raises(TypeError):
+			storage.save(io.BytesIO(), items)
+
+
+def test_rejects_bad_arguments(tmp_path):
+	path = tmp_path / 'never.vec'
+	with pytest.raises(ValueError):
+		storage.save(str(path), [Vec2d(1, 2)], typecode='B')
+	with pytest.raises(ValueError):
+		storage.save(str(path), [Vec2d(1, 2)], typecode='i')
+	with pytest.raises(ValueError):
+		storage.save(str(path), [])
+	assert not path.exists()
+
+
+@pytest.mark.parametrize('data', [
+	b'',
+	b'NOPE' + bytes(12),
+	storage.HEADER.pack(storage.MAGIC, 99, 0, ord('d'), 2, 0),
+	storage.HEADER.pack(storage.MAGIC, storage.VERSION, 7, ord('d'), 2, 0),
+	storage.HEADER.pack(storage.MAGIC, storage.VERSION, 0, ord('d'), 2, 5) + bytes(16),
+])
+@pytest.mark.parametrize('use_mmap', [True, False])
+def test_bad_files_close_their_handle(tmp_path, data, use_mmap):
+	path = tmp_path / 'bad.vec'
+	path.write_bytes(data)
+
+	with warnings.catch_warnings(record=True) as caught:
+		warnings.simplefilter('always')
+		with pytest.raises(ValueError):
+			storage.load(str(path), use_mmap)
+		gc.collect()
+
+	assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
@@ -0,0 +1,103 @@
+import io
+import random
+import pytest
+from vector import Vec2d, Vec3d, Color, Vec3dArray, ColorBuffer
+from vector import stream, storage
+from vector.stream import Pipeline
+
+
+def _vectors(count, seed=0):
+	rng = random.Random(seed)
+	return [Vec3d(rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(count)]
+
+
+def _floats(items):
+	return [v.as_floats() for v in items]
+
+
+@pytest.mark.parametrize('batch_size', [None, 1, 7, 1000])
+def test_csv_round_trip(tmp_path, batch_size):
+	path = str(tmp_path / 'points.csv')
+	vectors = _vectors(50)
+	assert stream.write_csv(path, vectors) == 50
+
+	items = list(stream.unbatched(stream.read_csv(path, batch_size=batch_size)))
+	assert _floats(items) == _floats(vectors)
+
+
+def test_csv_colors_and_file_objects():
+	colors = [Color(1, 2, 3), Color(250, 0, 128)]
+	f = io.StringIO()
+	stream.write_csv(f, [ColorBuffer.from_colors(colors)])
+
+	assert f.getvalue().splitlines()[0] == 'r,g,b'
+	f.seek(0)
+	assert [c.get() for c in stream.read_csv(f, kind=Color)] == [c.get() for c in colors]
+
+
+def test_csv_needs_a_kind_for_other_widths():
+	with pytest.raises(ValueError):
+		list(stream.read_csv(io.StringIO('1,2,3,4\n')))
+
+
+@pytest.mark.parametrize('batch_size', [None, 3, 1000])
+def test_binary_round_trip(tmp_path, batch_size):
+	path = str(tmp_path / 'points.vec')
+	vectors = _vectors(40)
+	stream.write_binary(path, stream.batched(iter(vectors), 16))
+
+	items = list(stream.unbatched(stream.read_binary(path, batch_size)))
+	assert _floats(items) == _floats(vectors)
+
+
+def test_binary_through_a_pipe_like_file():
+	f = io.BytesIO()
+	stream.write_binary(f, _vectors(5))
+	f.seek(0)
+
+	assert _floats(stream.read_binary(io.BytesIO(f.read()))) == _floats(_vectors(5))
+
+
+def test_truncated_binary():
+	f = io.BytesIO()
+	stream.write_binary(f, _vectors(5))
+	data = f.getvalue()[:-8]
+
+	with pytest.raises(ValueError):
+		list(stream.read_binary(io.BytesIO(data)))
+	with pytest.raises(ValueError):
+		list(stream.read_binary(io.BytesIO(b'junk' * 4)))
+
+
+def test_pipeline_matches_eager(tmp_path):
+	source = str(tmp_path / 'in.csv')
+	target = str(tmp_path / 'out.vec')
+	vectors = _vectors(60)
+	stream.write_csv(source, vectors)
+
+	written = (Pipeline.csv(source, batch_size=8)
+		.apply('normalised')
+		.apply('clamp', 0.5, 0.5, 0.5)
+		.keep(lambda v: v.z > 0)
+		.write_binary(target))
+
+	expected = []
+	for v in vectors:
+		v = v.normalised()
+		v.clamp(0.5, 0.5, 0.5)
+		if v.z > 0:
+			expected.extend(v.as_floats())
+
+	assert written == len(expected) // 3
+	with storage.load(target) as f:
+		assert [c for v in f for c in v.as_floats()] == pytest.approx(expected)
+
+
+def test_keep_on_batches_can_empty_them():
+	kept = list(stream.keep([Vec3dArray(_vectors(4))], lambda v: False))
+	assert len(kept) == 1 and len(kept[0]) == 0
+
+
+def test_stages_accept_callables():
+	items = list(stream.apply([Vec2d(1, 2)], lambda v, k: v.mult(k), 3))
+	assert _floats(items) == [[3, 6]]
@@ -0,0 +1,86 @@
+import random
+import pytest
+from vector import Vec2d, Vec2dArray
+
+
+def _vectors(count, seed=0):
+	rng = random.Random(seed)
+	return [Vec2d(rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(count)]
+
+
+def _close(a, b):
+	return a.as_floats() == pytest.approx(b.as_floats())
+
+
+def test_round_trip():
+	vectors = _vectors(50)
+	batch = Vec2dArray(vectors)
+
+	assert len(batch) == 50
+	assert [v.as_floats() for v in batch.as_list()] == [v.as_floats() for v in vectors]
+	assert batch[-1].as_floats() == vectors[-1].as_floats()
+	assert Vec2dArray.from_columns(*batch.columns).as_list()[3].as_floats() == vectors[3].as_floats()
+
+
+@pytest.mark.parametrize('method', ['add', 'sub', 'mult', 'lerp'])
+def test_matches_single_vectors(method):
+	a, b = _vectors(40, 1), _vectors(40, 2)
+	result = getattr(Vec2dArray(a), method)(Vec2dArray(b))
+
+	for got, x, y in zip(result.as_list(), a, b):
+		assert _close(got, getattr(x, method)(y))
+
+
+def test_scalar_operand_and_in_place():
+	vectors = _vectors(20)
+	batch = Vec2dArray(vectors)
+	batch.iadd(1.5, -2)
+	batch.imult(2)
+
+	for got, v in zip(batch.as_list(), vectors):
+		assert _close(got, v.add(1.5, -2).mult(2))
+
+
+def test_reductions():
+	a, b = _vectors(30, 3), _vectors(30, 4)
+	batch = Vec2dArray(a)
+
+	assert list(batch.dot(Vec2dArray(b))) == pytest.approx([x.dot(y) for x, y in zip(a, b)])
+	assert list(batch.get_magnitude()) == pytest.approx([v.get_magnitude() for v in a])
+	assert list(batch.dist(Vec2dArray(b))) == pytest.approx([x.dist(y) for x, y in zip(a, b)])
+
+
+def test_normalise_and_rotate():
+	vectors = _vectors(25)
+	batch = Vec2dArray(vectors)
+	batch.normalise()
+	batch.rotate(0.3)
+
+	for got, v in zip(batch.as_list(), vectors):
+		expected = v.normalised()
+		expected.rotate(0.3)
+		assert _close(got, expected)
+
+
+def test_length_mismatch():
+	with pytest.raises(ValueError):
+		Vec2dArray(_vectors(3)).add(Vec2dArray(_vectors(4)))
+	with pytest.raises(ValueError):
+		Vec2dArray.from_columns([1, 2], [1])
+
+
+def test_index_out_of_range():
+	batch = Vec2dArray(_vectors(3))
+	with pytest.raises(IndexError):
+		batch[3]
+	with pytest.raises(IndexError):
+		batch[-4]
+
+
+def test_views_write_through():
+	batch = Vec2dArray(_vectors(3))
+	batch[1].x = 42
+	batch[2] = Vec2d(7, 8)
+
+	assert batch.xs[1] == 42
+	assert batch[2].as_floats() == [7, 8]
@@ -0,0 +1,62 @@
+import random
+import pytest
+from vector import Vec3d, Vec3dArray
+
+
+def _vectors(count, seed=0):
+	rng = random.Random(seed)
+	return [Vec3d(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(count)]
+
+
+def _close(a, b):
+	return a.as_floats() == pytest.approx(b.as_floats())
+
+
+def test_cross_product_matches_single_vectors():
+	a, b = _vectors(40, 1), _vectors(40, 2)
+	result = Vec3dArray(a).cross_product(Vec3dArray(b))
+
+	for got, x, y in zip(result.as_list(), a, b):
+		assert _close(got, x.cross_product(y))
+
+
+def test_cross_product_with_one_vector():
+	a = _vectors(10)
+	result = Vec3dArray(a).cross_product(Vec3d(0, 0, 1))
+
+	for got, x in zip(result.as_list(), a):
+		assert _close(got, x.cross_product(Vec3d(0, 0, 1)))
+
+
+@pytest.mark.parametrize('axis', ['rotate_x', 'rotate_y', 'rotate_z'])
+def test_rotations_match_single_vectors(axis):
+	vectors = _vectors(30)
+	batch = Vec3dArray(vectors)
+	getattr(batch, axis)(0.7)
+
+	for got, v in zip(batch.as_list(), vectors):
+		getattr(v, axis)(0.7)
+		assert _close(got, v)
+
+
+@pytest.mark.parametrize('method', ['add', 'sub', 'mult', 'lerp'])
+def test_arithmetic_matches_single_vectors(method):
+	a, b = _vectors(40, 3), _vectors(40, 4)
+	result = getattr(Vec3dArray(a), method)(Vec3dArray(b))
+
+	for got, x, y in zip(result.as_list(), a, b):
+		assert _close(got, getattr(x, method)(y))
+
+
+def test_reductions():
+	a, b = _vectors(30, 5), _vectors(30, 6)
+	batch = Vec3dArray(a)
+
+	assert list(batch.dot(Vec3dArray(b))) == pytest.approx([x.dot(y) for x, y in zip(a, b)])
+	assert list(batch.get_magnitude()) == pytest.approx([v.get_magnitude() for v in a])
+	assert list(batch.dist_sqrt(Vec3dArray(b))) == pytest.approx([x.dist_sqrt(y) for x, y in zip(a, b)])
+
+
+def test_length_mismatch():
+	with pytest.raises(ValueError):
+		Vec3dArray(_vectors(3)).cross_product(Vec3dArray(_vectors(2)))
@@ -0,0 +1,38 @@
+import pytest
+from vector import Vec2d, Vec3d, Color
+
+
+@pytest.mark.parametrize('cls', [Vec2d, Vec3d, Color])
+def test_no_instance_dict(cls):
+	v = cls()
+	assert not hasattr(v, '__dict__')
+	with pytest.raises(AttributeError):
+		v.extra = 1
+
+
+def test_constructor_forms_agree():
+	assert Vec2d(3, 4).as_floats() == Vec2d([3, 4]).as_floats() == Vec2d((3, 4)).as_floats() == Vec2d(Vec2d(3, 4)).as_floats()
+	assert Vec2d(5).as_floats() == [5, 5]
+	assert Vec2d().as_floats() == [0, 0]
+	assert Vec3d(1, 2, 3).as_floats() == Vec3d([1, 2, 3]).as_floats() == Vec3d(Vec3d(1, 2, 3)).as_floats()
+	assert Color(1, 2, 3).get() == Color((1, 2, 3)).get() == Color(Color(1, 2, 3)).get()
+
+
+def test_color_clamps():
+	assert Color(-5, 300, 128).get() == [0, 255, 128]
+	assert Color(10, 10, 10).add(Color(250, 0, 0)).get() == [255, 10, 10]
+
+
+@pytest.mark.parametrize('args', [('a',), (1, 2, 3, 4), (None,)])
+def test_invalid_input(args):
+	with pytest.raises(TypeError):
+		Vec2d(*args)
+
+
+def test_fast_paths_match_general_paths():
+	a, b = Vec2d(1.5, -2), Vec2d(0.25, 4)
+
+	assert a.add(b).as_floats() == a.add(b.x, b.y).as_floats()
+	assert a.mult(b).as_floats() == a.mult([b.x, b.y]).as_floats()
+	assert a.dot(b) == a.dot(b.x, b.y)
+	assert a.dist(b) == a.dist(b.x, b.y)